@@ -4,8 +4,29 @@ It may be also used for extending doctest's context:
 2. https://docs.pytest.org/en/latest/doctest.html
 """
 
+import pytest
+
 pytest_plugins = ["crowdin_api.fixtures"]
 
 
-def pytest_configure():
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark", action="store_true", default=False, help="Run the timing benchmarks."
+    )
+
+
+def pytest_configure(config):
     """Configure settings."""
+    config.addinivalue_line(
+        "markers", "benchmark: timing comparison, only run with the --benchmark option"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark"):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="Timing benchmarks run with --benchmark only")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
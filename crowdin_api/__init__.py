@@ -1,6 +1,6 @@
-from crowdin_api.client import CrowdinClient
+from crowdin_api.client import AsyncCrowdinClient, CrowdinClient
 
-__all__ = ["CrowdinClient"]
+__all__ = ["AsyncCrowdinClient", "CrowdinClient"]
 __author__ = "Crowdin"
 __version__ = "1.28.0"
 
@@ -1,33 +1,43 @@
-from .ai.resource import AIResource, EnterpriseAIResource
-from .application.resource import ApplicationResource
-from .bundles.resource import BundlesResource
-from .dictionaries.resource import DictionariesResource
-from .distributions.resource import DistributionsResource
-from .fields.resource import FieldsResource
-from .glossaries.resource import GlossariesResource
-from .groups.resource import GroupsResource
-from .labels.resource import LabelsResource
-from .languages.resource import LanguagesResource
-from .machine_translation_engines.resource import MachineTranslationEnginesResource
-from .projects.resource import ProjectsResource
-from .reports.resource import EnterpriseReportsResource, ReportsResource
-from .screenshots.resource import ScreenshotsResource
-from .security_logs.resource import SecurityLogsResource
-from .source_files.resource import SourceFilesResource
-from .source_strings.resource import SourceStringsResource
-from .storages.resource import StoragesResource
-from .string_comments.resource import StringCommentsResource
-from .string_translations.resource import StringTranslationsResource
-from .style_guides.resource import StyleGuidesResource
-from .tasks.resource import EnterpriseTasksResource, TasksResource
-from .teams.resource import TeamsResource
-from .translation_memory.resource import TranslationMemoryResource
-from .translation_status.resource import TranslationStatusResource
-from .translations.resource import TranslationsResource
-from .users.resource import EnterpriseUsersResource, UsersResource
-from .vendors.resource import VendorsResource
-from .webhooks.resource import WebhooksResource
-from .workflows.resource import WorkflowsResource
+import importlib
+from typing import TYPE_CHECKING
+
+# Resource modules are imported on first access, see __getattr__
+_resource_modules = {
+    "AIResource": ".ai.resource",
+    "EnterpriseAIResource": ".ai.resource",
+    "ApplicationResource": ".application.resource",
+    "BundlesResource": ".bundles.resource",
+    "DictionariesResource": ".dictionaries.resource",
+    "DistributionsResource": ".distributions.resource",
+    "FieldsResource": ".fields.resource",
+    "GlossariesResource": ".glossaries.resource",
+    "GroupsResource": ".groups.resource",
+    "LabelsResource": ".labels.resource",
+    "LanguagesResource": ".languages.resource",
+    "MachineTranslationEnginesResource": ".machine_translation_engines.resource",
+    "ProjectsResource": ".projects.resource",
+    "ReportsResource": ".reports.resource",
+    "EnterpriseReportsResource": ".reports.resource",
+    "ScreenshotsResource": ".screenshots.resource",
+    "SecurityLogsResource": ".security_logs.resource",
+    "SourceFilesResource": ".source_files.resource",
+    "SourceStringsResource": ".source_strings.resource",
+    "StoragesResource": ".storages.resource",
+    "StringCommentsResource": ".string_comments.resource",
+    "StringTranslationsResource": ".string_translations.resource",
+    "StyleGuidesResource": ".style_guides.resource",
+    "TasksResource": ".tasks.resource",
+    "EnterpriseTasksResource": ".tasks.resource",
+    "TeamsResource": ".teams.resource",
+    "TranslationMemoryResource": ".translation_memory.resource",
+    "TranslationStatusResource": ".translation_status.resource",
+    "TranslationsResource": ".translations.resource",
+    "UsersResource": ".users.resource",
+    "EnterpriseUsersResource": ".users.resource",
+    "VendorsResource": ".vendors.resource",
+    "WebhooksResource": ".webhooks.resource",
+    "WorkflowsResource": ".workflows.resource",
+}
 
 __all__ = [
     "AIResource",
@@ -65,3 +75,51 @@ __all__ = [
     "WebhooksResource",
     "WorkflowsResource",
 ]
+
+
+def __getattr__(name):
+    try:
+        module_name = _resource_modules[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    resource_class = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = resource_class
+    return resource_class
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .ai.resource import AIResource, EnterpriseAIResource
+    from .application.resource import ApplicationResource
+    from .bundles.resource import BundlesResource
+    from .dictionaries.resource import DictionariesResource
+    from .distributions.resource import DistributionsResource
+    from .fields.resource import FieldsResource
+    from .glossaries.resource import GlossariesResource
+    from .groups.resource import GroupsResource
+    from .labels.resource import LabelsResource
+    from .languages.resource import LanguagesResource
+    from .machine_translation_engines.resource import MachineTranslationEnginesResource
+    from .projects.resource import ProjectsResource
+    from .reports.resource import EnterpriseReportsResource, ReportsResource
+    from .screenshots.resource import ScreenshotsResource
+    from .security_logs.resource import SecurityLogsResource
+    from .source_files.resource import SourceFilesResource
+    from .source_strings.resource import SourceStringsResource
+    from .storages.resource import StoragesResource
+    from .string_comments.resource import StringCommentsResource
+    from .string_translations.resource import StringTranslationsResource
+    from .style_guides.resource import StyleGuidesResource
+    from .tasks.resource import EnterpriseTasksResource, TasksResource
+    from .teams.resource import TeamsResource
+    from .translation_memory.resource import TranslationMemoryResource
+    from .translation_status.resource import TranslationStatusResource
+    from .translations.resource import TranslationsResource
+    from .users.resource import EnterpriseUsersResource, UsersResource
+    from .vendors.resource import VendorsResource
+    from .webhooks.resource import WebhooksResource
+    from .workflows.resource import WorkflowsResource
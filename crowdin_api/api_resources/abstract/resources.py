@@ -1,9 +1,85 @@
+import asyncio
+import copy
+import threading
+import warnings
+import weakref
 from abc import ABCMeta
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
 
 from crowdin_api.requester import APIRequester
 
 
+class _ResourceCopy:
+    """A copy of a resource returned by `with_fetch_all` or `with_stream`."""
+
+    def __init__(self, resource: "BaseResource", options: dict):
+        self.thread_id = threading.get_ident()
+        self.resource = weakref.ref(resource)
+        self.options = options
+        self.used = False
+
+
+class _Pages:
+    """
+    Page bookkeeping of list calls returning all records, shared by the sync and async helpers.
+
+    Iterating yields the limit and the request arguments of each page in offset order until a
+    short page is added or `max_amount` records are requested. With `join` set, `result` returns
+    the data of all added pages.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict],
+        max_amount: Optional[int],
+        join: bool = False,
+    ):
+        self.method = method
+        self.path = path
+        self.params = params or {}
+        self.join = join
+        self.done = False
+        self._content = None
+        self._data = []
+        self._bounds = BaseResource._iter_page_bounds(max_amount=max_amount)
+        self._pages = self._iter_pages()
+
+    def _iter_pages(self) -> Iterator[Tuple[int, dict]]:
+        for offset, limit in self._bounds:
+            if self.done:
+                return
+            params = {**self.params, "limit": limit, "offset": offset}
+            yield limit, {"method": self.method, "path": self.path, "params": params}
+
+    def __iter__(self) -> Iterator[Tuple[int, dict]]:
+        return self._pages
+
+    def next(self) -> Optional[Tuple[int, dict]]:
+        return next(self._pages, None)
+
+    def take(self, count: int) -> List[Tuple[int, dict]]:
+        return list(islice(self._pages, count))
+
+    def add(self, limit: int, content: dict) -> list:
+        """Add the response of a page, return its data."""
+        data = content.get("data", [])
+        self.done = self.done or len(data) < limit
+        if self.join:
+            self._data.extend(data)
+        self._content = content
+        return data
+
+    def result(self) -> dict:
+        """The last response with the data of all pages."""
+        self._content["data"] = self._data
+        return self._content
+
+
 class BaseResource(metaclass=ABCMeta):
     def __init__(
         self, requester: APIRequester, project_id: Optional[int] = None, page_size=25
@@ -13,6 +89,11 @@ class BaseResource(metaclass=ABCMeta):
         self.page_size = page_size
         self._flag_fetch_all = None
         self._max_limit = None
+        self._concurrency = None
+        self._flag_stream = None
+        self._prefetch = None
+        self._last_copy = None
+        self._copy = None
 
     def get_project_id(self):
         if self.project_id is None:
@@ -48,12 +129,91 @@ class BaseResource(metaclass=ABCMeta):
 
         return {"offset": offset, "limit": limit}
 
-    def with_fetch_all(self, max_limit: Optional[int] = None):
-        self._max_limit = max_limit
-        self._flag_fetch_all = True
-        return self
+    def _copy_with(self, options: dict) -> "BaseResource":
+        resource = copy.copy(self)
+        resource.__dict__.update(options)
+        return resource
+
+    def _with_options(self, **options) -> "BaseResource":
+        """Return a copy of the resource with list options, the resource itself is not changed."""
+        if self._copy is not None:
+            # Configured further, e.g. resource.with_fetch_all().with_stream()
+            self._copy.used = True
+
+        resource = self._copy_with(options)
+        resource._last_copy = None
+        resource._copy = self._last_copy = _ResourceCopy(resource, options)
+        return resource
+
+    def _pop_discarded_options(self) -> Optional[dict]:
+        """
+        Return the options of a copy dropped without a list call, e.g. of the statement form
+
+            resource.with_fetch_all()
+            resource.list_projects()
+
+        which set the options on the resource for the next list call before they became copies.
+        """
+        last_copy = self._last_copy
+        if last_copy is None or last_copy.thread_id != threading.get_ident():
+            return None
+
+        self._last_copy = None
+        if last_copy.used or last_copy.resource() is not None:
+            return None
+
+        warnings.warn(
+            "with_fetch_all() and with_stream() return a copy of the resource and no longer "
+            "change it, chain the list call: resource.with_fetch_all().list_...(). The options "
+            "of the discarded copy only apply to this call.",
+            DeprecationWarning,
+            stacklevel=4,
+        )
+        return last_copy.options
+
+    def with_fetch_all(self, max_limit: Optional[int] = None, concurrency: Optional[int] = None):
+        """
+        Fetch all records of list calls.
+
+        Returns a copy of the resource whose list calls return all records, so the resource can
+        be shared between threads and tasks. With `concurrency` set, pages are requested in
+        parallel by up to `concurrency` workers.
+        """
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("The concurrency must be greater than or equal to 1.")
+
+        return self._with_options(
+            _flag_fetch_all=True, _max_limit=max_limit, _concurrency=concurrency
+        )
+
+    def with_stream(self, max_limit: Optional[int] = None, prefetch: bool = False):
+        """
+        Iterate over all records of list calls page by page.
+
+        Returns a copy of the resource whose list calls return an iterator over items instead of
+        a response. With `prefetch` set, the next page is downloaded in the background while the
+        current one is consumed.
+        """
+        return self._with_options(_flag_stream=True, _max_limit=max_limit, _prefetch=prefetch)
 
     def _get_entire_data(self, method: str, path: str, params: Optional[dict] = None):
+        if self._copy is not None:
+            self._copy.used = True
+
+        discarded_options = self._pop_discarded_options()
+        if discarded_options is not None:
+            return self._copy_with(discarded_options)._get_entire_data(method, path, params)
+
+        if self._flag_stream:
+            iter_all = self._async_iter_all if self.requester.is_async else self._iter_all
+            return iter_all(
+                method=method,
+                path=path,
+                params=params,
+                max_amount=self._max_limit,
+                prefetch=self._prefetch,
+            )
+
         if not self._flag_fetch_all:
             return self.requester.request(
                 method=method,
@@ -61,15 +221,17 @@ class BaseResource(metaclass=ABCMeta):
                 params=params,
             )
 
-        contents = self._fetch_all(
-            method=method,
-            path=path,
-            params=params,
-            max_amount=self._max_limit
-        )
-        self._flag_fetch_all = False
-        self._max_limit = None
-        return contents
+        kwargs = {"method": method, "path": path, "params": params, "max_amount": self._max_limit}
+        if self._concurrency:
+            kwargs["concurrency"] = self._concurrency
+            if self.requester.is_async:
+                fetch_all = self._async_parallel_fetch_all
+            else:
+                fetch_all = self._parallel_fetch_all
+        else:
+            fetch_all = self._async_fetch_all if self.requester.is_async else self._fetch_all
+
+        return fetch_all(**kwargs)
 
     def _fetch_all(
         self,
@@ -78,29 +240,151 @@ class BaseResource(metaclass=ABCMeta):
         params: Optional[dict] = None,
         max_amount: Optional[int] = None
     ) -> list:
+        pages = _Pages(method, path, params, max_amount, join=True)
+        for limit, request in pages:
+            pages.add(limit, self.requester.request(**request))
+        return pages.result()
+
+    async def _async_fetch_all(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        max_amount: Optional[int] = None
+    ) -> list:
+        pages = _Pages(method, path, params, max_amount, join=True)
+        for limit, request in pages:
+            pages.add(limit, await self.requester.request(**request))
+        return pages.result()
+
+    @staticmethod
+    def _iter_page_bounds(max_amount: Optional[int] = None) -> Iterator[Tuple[int, int]]:
         limit = 500
         offset = 0
-        join_data = []
-        if params is None:
-            params = {}
 
-        if max_amount and max_amount < limit:
-            limit = max_amount
+        while not max_amount or offset < max_amount:
+            yield offset, min(limit, max_amount - offset) if max_amount else limit
+            offset += limit
 
-        while True:
-            params.update({"limit": limit, "offset": offset})
+    def _parallel_fetch_all(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        max_amount: Optional[int] = None,
+        concurrency: int = 8,
+    ) -> list:
+        """
+        Fetch pages concurrently, keeping at most `concurrency` requests in flight.
 
-            content = self.requester.request(method=method, path=path, params=params)
-            data = content.get("data", [])
-            data and join_data.extend(data)
+        No new page is started once a short page is received, data is joined in offset order.
+        """
+        pages = _Pages(method, path, params, max_amount, join=True)
 
-            if len(data) < limit or (max_amount and len(join_data) >= max_amount):
-                break
-            else:
-                offset += limit
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = deque(
+                (limit, executor.submit(self.requester.request, **request))
+                for limit, request in pages.take(concurrency)
+            )
+            try:
+                while pending:
+                    limit, future = pending.popleft()
+                    pages.add(limit, future.result())
+                    if pages.done:
+                        break
+
+                    for limit, request in pages.take(1):
+                        pending.append((limit, executor.submit(self.requester.request, **request)))
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+        return pages.result()
+
+    async def _async_parallel_fetch_all(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        max_amount: Optional[int] = None,
+        concurrency: int = 8,
+    ) -> list:
+        pages = _Pages(method, path, params, max_amount, join=True)
+
+        def fetch_page(request: dict):
+            return asyncio.ensure_future(self.requester.request(**request))
+
+        pending = deque((limit, fetch_page(request)) for limit, request in pages.take(concurrency))
+        try:
+            while pending:
+                limit, task = pending.popleft()
+                pages.add(limit, await task)
+                if pages.done:
+                    break
+
+                for limit, request in pages.take(1):
+                    pending.append((limit, fetch_page(request)))
+        finally:
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+        return pages.result()
+
+    def _iter_all(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        max_amount: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict]:
+        pages = _Pages(method, path, params, max_amount)
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        next_page = None
+
+        page = pages.next()
+        try:
+            while page is not None:
+                limit, request = page
+                content = next_page.result() if next_page else self.requester.request(**request)
+                data = pages.add(limit, content)
+
+                page, next_page = pages.next(), None
+                if executor is not None and page is not None:
+                    next_page = executor.submit(self.requester.request, **page[1])
+
+                yield from data
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    async def _async_iter_all(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        max_amount: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[dict]:
+        pages = _Pages(method, path, params, max_amount)
+        next_page = None
+
+        page = pages.next()
+        try:
+            while page is not None:
+                limit, request = page
+                content = await (next_page or self.requester.request(**request))
+                data = pages.add(limit, content)
 
-            if max_amount and max_amount < len(join_data) + limit:
-                limit = max_amount - len(join_data)
+                page, next_page = pages.next(), None
+                if prefetch and page is not None:
+                    next_page = asyncio.ensure_future(self.requester.request(**page[1]))
 
-        content["data"] = join_data
-        return content
+                for item in data:
+                    yield item
+        finally:
+            if next_page is not None:
+                next_page.cancel()
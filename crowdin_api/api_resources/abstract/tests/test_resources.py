@@ -1,9 +1,11 @@
+import asyncio
+import threading
 from unittest import mock
 from unittest.mock import Mock
 
 import pytest
 from crowdin_api.api_resources.abstract.resources import BaseResource
-from crowdin_api.requester import APIRequester
+from crowdin_api.requester import APIRequester, AsyncAPIRequester
 
 
 class TestBaseResource:
@@ -55,10 +57,90 @@ class TestBaseResource:
     def test_with_fetch_all(self, in_param, out_param, base_absolut_url):
         resource = BaseResource(requester=APIRequester(base_url=base_absolut_url))
 
-        resource.with_fetch_all(**in_param)
+        fetch_all_resource = resource.with_fetch_all(**in_param)
 
-        assert resource._max_limit == out_param
-        assert resource._flag_fetch_all is True
+        assert fetch_all_resource is not resource
+        assert fetch_all_resource.requester is resource.requester
+        assert fetch_all_resource._max_limit == out_param
+        assert fetch_all_resource._flag_fetch_all is True
+        assert fetch_all_resource._concurrency is None
+        assert resource._flag_fetch_all is None
+
+    def test_with_fetch_all_concurrency(self, base_absolut_url):
+        resource = BaseResource(requester=APIRequester(base_url=base_absolut_url))
+
+        assert resource.with_fetch_all(concurrency=4)._concurrency == 4
+
+        with pytest.raises(ValueError):
+            resource.with_fetch_all(concurrency=0)
+
+    def test_with_fetch_all_shared_resource(self, base_absolut_url):
+        requester = APIRequester(base_url=base_absolut_url)
+        requester.request = Mock(return_value={"data": [1]})
+        resource = BaseResource(requester=requester)
+        fetch_all_resource = resource.with_fetch_all(max_limit=10)
+        results = []
+
+        def worker():
+            results.append(resource._get_entire_data(method="get", path="test"))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert requester.request.call_count == 4
+        for call in requester.request.call_args_list:
+            assert "limit" not in (call.kwargs["params"] or {})
+
+        # The options apply to every list call of the returned resource
+        for _ in range(2):
+            fetch_all_resource._get_entire_data(method="get", path="test")
+        assert requester.request.call_args.kwargs["params"] == {"limit": 10, "offset": 0}
+
+    def test_with_fetch_all_statement(self, base_absolut_url):
+        requester = APIRequester(base_url=base_absolut_url)
+        requester.request = Mock(return_value={"data": [1]})
+        resource = BaseResource(requester=requester)
+
+        resource.with_fetch_all(max_limit=10)
+        with pytest.warns(DeprecationWarning, match="chain the list call"):
+            resource._get_entire_data(method="get", path="test")
+        assert requester.request.call_args.kwargs["params"] == {"limit": 10, "offset": 0}
+
+        # Only the next list call
+        resource._get_entire_data(method="get", path="test")
+        assert requester.request.call_args.kwargs["params"] is None
+
+    @pytest.mark.filterwarnings("error")
+    def test_with_fetch_all_copy_used(self, base_absolut_url):
+        requester = APIRequester(base_url=base_absolut_url)
+        requester.request = Mock(return_value={"data": [1]})
+        resource = BaseResource(requester=requester)
+
+        resource.with_fetch_all(max_limit=10)._get_entire_data(method="get", path="test")
+        resource.with_fetch_all(max_limit=10).with_stream()
+        stored = resource.with_fetch_all(max_limit=10)
+
+        resource._get_entire_data(method="get", path="test")
+
+        assert requester.request.call_args.kwargs["params"] is None
+        assert stored._flag_fetch_all
+
+    def test_with_fetch_all_statement_other_thread(self, base_absolut_url):
+        requester = APIRequester(base_url=base_absolut_url)
+        requester.request = Mock(return_value={"data": [1]})
+        resource = BaseResource(requester=requester)
+
+        resource.with_fetch_all(max_limit=10)
+        thread = threading.Thread(
+            target=resource._get_entire_data, kwargs={"method": "get", "path": "test"}
+        )
+        thread.start()
+        thread.join()
+
+        assert requester.request.call_args.kwargs["params"] is None
 
     @pytest.mark.parametrize(
         "incoming_data, request_data",
@@ -110,14 +192,12 @@ class TestBaseResource:
         base_absolut_url
     ):
         resource = BaseResource(requester=APIRequester(base_url=base_absolut_url))
-        resource.with_fetch_all(max_limit=max_limit)
+        resource = resource.with_fetch_all(max_limit=max_limit)
 
         resource._fetch_all = Mock(return_value="response")
 
         assert resource._flag_fetch_all is True
         assert resource._get_entire_data(**incoming_data) == "response"
-        assert resource._flag_fetch_all is False
-        assert resource._max_limit is None
         resource._fetch_all.assert_called_once_with(**request_data)
 
     @pytest.mark.parametrize(
@@ -152,3 +232,161 @@ class TestBaseResource:
 
         testing_result = resource._fetch_all(**incoming_data)
         assert testing_result == expected_result
+
+    @pytest.mark.parametrize(
+        "max_amount, pages, expected_calls",
+        (
+            (None, [[1] * 500, [2] * 10], [(500, 0), (500, 500)]),
+            (None, [[1] * 500, []], [(500, 0), (500, 500)]),
+            (600, [[1] * 500, [2] * 100], [(500, 0), (100, 500)]),
+            (10, [[1] * 10], [(10, 0)]),
+        ),
+    )
+    def test__async_fetch_all(self, max_amount, pages, expected_calls, base_absolut_url):
+        calls = []
+
+        async def m_request(method, path, params):
+            calls.append((params["limit"], params["offset"]))
+            return {"data": pages[len(calls) - 1]}
+
+        requester = AsyncAPIRequester(base_url=base_absolut_url)
+        requester.request = m_request
+        resource = BaseResource(requester=requester)
+
+        content = asyncio.run(
+            resource.with_fetch_all(max_amount)._get_entire_data(method="get", path="test")
+        )
+
+        assert calls == expected_calls
+        assert content == {"data": [item for page in pages for item in page]}
+        assert resource._flag_fetch_all is None
+
+    @pytest.mark.parametrize(
+        "max_amount, total, concurrency, required_offsets",
+        (
+            (None, 1200, 2, [0, 500, 1000]),
+            (None, 1000, 8, [0, 500, 1000]),
+            (None, 0, 3, [0]),
+            (700, 5000, 4, [0, 500]),
+            (300, 5000, 4, [0]),
+        ),
+    )
+    def test__parallel_fetch_all(
+        self, max_amount, total, concurrency, required_offsets, base_absolut_url
+    ):
+        def m_request(method, path, params):
+            assert params["test"] == "value"
+            offset, limit = params["offset"], params["limit"]
+            return {"data": list(range(offset, min(offset + limit, total)))}
+
+        requester = APIRequester(base_url=base_absolut_url)
+        requester.request = Mock(side_effect=m_request)
+        resource = BaseResource(requester=requester)
+
+        content = resource.with_fetch_all(max_amount, concurrency=concurrency)._get_entire_data(
+            method="get", path="test", params={"test": "value"}
+        )
+
+        expected_total = min(total, max_amount) if max_amount else total
+        assert content["data"] == list(range(expected_total))
+
+        offsets = sorted(call.kwargs["params"]["offset"] for call in requester.request.call_args_list)
+        assert offsets[:len(required_offsets)] == required_offsets
+        assert len(offsets) <= len(required_offsets) + concurrency
+
+    @pytest.mark.parametrize(
+        "max_amount, total, expected_offsets",
+        (
+            (None, 1200, [0, 500, 1000]),
+            (600, 5000, [0, 500]),
+        ),
+    )
+    def test__async_parallel_fetch_all(
+        self, max_amount, total, expected_offsets, base_absolut_url
+    ):
+        offsets = []
+
+        async def m_request(method, path, params):
+            offsets.append(params["offset"])
+            offset, limit = params["offset"], params["limit"]
+            await asyncio.sleep(0)
+            return {"data": list(range(offset, min(offset + limit, total)))}
+
+        requester = AsyncAPIRequester(base_url=base_absolut_url)
+        requester.request = m_request
+        resource = BaseResource(requester=requester)
+
+        content = asyncio.run(
+            resource.with_fetch_all(max_amount, concurrency=3)._get_entire_data(
+                method="get", path="test"
+            )
+        )
+
+        expected_total = min(total, max_amount) if max_amount else total
+        assert content["data"] == list(range(expected_total))
+        assert sorted(offsets) == expected_offsets
+
+    @pytest.mark.parametrize("prefetch", (False, True))
+    @pytest.mark.parametrize(
+        "max_amount, total, expected_offsets",
+        (
+            (None, 1200, [0, 500, 1000]),
+            (None, 1000, [0, 500, 1000]),
+            (None, 0, [0]),
+            (700, 5000, [0, 500]),
+        ),
+    )
+    def test_with_stream(self, prefetch, max_amount, total, expected_offsets, base_absolut_url):
+        def m_request(method, path, params):
+            offset, limit = params["offset"], params["limit"]
+            return {"data": list(range(offset, min(offset + limit, total)))}
+
+        requester = APIRequester(base_url=base_absolut_url)
+        requester.request = Mock(side_effect=m_request)
+        resource = BaseResource(requester=requester)
+
+        items = resource.with_stream(max_amount, prefetch=prefetch)._get_entire_data(
+            method="get", path="test"
+        )
+
+        assert resource._flag_stream is None
+        assert requester.request.call_count == 0
+
+        expected_total = min(total, max_amount) if max_amount else total
+        assert list(items) == list(range(expected_total))
+        assert [
+            call.kwargs["params"]["offset"] for call in requester.request.call_args_list
+        ] == expected_offsets
+
+    def test_with_stream_consumes_lazily(self, base_absolut_url):
+        requester = APIRequester(base_url=base_absolut_url)
+        requester.request = Mock(return_value={"data": [{"data": {}}] * 500})
+        resource = BaseResource(requester=requester)
+
+        items = resource.with_stream()._get_entire_data(method="get", path="test")
+
+        assert next(items) == {"data": {}}
+        items.close()
+        assert requester.request.call_count == 1
+
+    @pytest.mark.parametrize("prefetch", (False, True))
+    def test_with_stream_async(self, prefetch, base_absolut_url):
+        offsets = []
+
+        async def m_request(method, path, params):
+            offsets.append(params["offset"])
+            offset, limit = params["offset"], params["limit"]
+            return {"data": list(range(offset, min(offset + limit, 1200)))}
+
+        requester = AsyncAPIRequester(base_url=base_absolut_url)
+        requester.request = m_request
+        resource = BaseResource(requester=requester)
+
+        async def run():
+            items = resource.with_stream(prefetch=prefetch)._get_entire_data(
+                method="get", path="test"
+            )
+            return [item async for item in items]
+
+        assert asyncio.run(run()) == list(range(1200))
+        assert offsets == [0, 500, 1000]
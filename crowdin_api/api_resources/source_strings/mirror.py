@@ -0,0 +1,191 @@
+import os
+import sqlite3
+from typing import Iterator, List, Optional, Union
+
+from crowdin_api.api_resources.source_strings.enums import ListStringsOrderBy
+from crowdin_api.api_resources.source_strings.resource import SourceStringsResource
+from crowdin_api.exceptions import CrowdinException
+from crowdin_api.parser import dumps, loads
+from crowdin_api.sorting import Sorting, SortingOrder, SortingRule
+
+
+class SourceStringsMirror:
+    """
+    Local SQLite copy of the source strings of a project or branch.
+
+    `refresh` lists the strings ordered by `updatedAt` and then by `createdAt` descending and
+    stops at the first string not changed since the previous sync, so repeat runs only download
+    changed strings. Strings deleted in Crowdin are only dropped by a full refresh,
+    `refresh(full=True)`.
+
+        mirror = SourceStringsMirror(client.source_strings, "strings.db", project_id=1)
+        mirror.refresh()
+        mirror.get_by_identifier("app.title")
+    """
+
+    write_batch_size = 1000
+
+    def __init__(
+        self,
+        resource: SourceStringsResource,
+        path: Union[str, os.PathLike],
+        project_id: Optional[int] = None,
+        branch_id: Optional[int] = None,
+    ):
+        if resource.requester.is_async:
+            raise CrowdinException(detail="SourceStringsMirror requires a synchronous client")
+
+        self.resource = resource
+        self.project_id = project_id or resource.get_project_id()
+        self.branch_id = branch_id
+        self._branch_key = branch_id or 0
+        self._connection = sqlite3.connect(os.fspath(path))
+        self._create_tables()
+
+    def _create_tables(self):
+        with self._connection:
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS strings (
+                    project_id INTEGER NOT NULL,
+                    branch_key INTEGER NOT NULL,
+                    id INTEGER NOT NULL,
+                    identifier TEXT,
+                    updated_at REAL NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (project_id, branch_key, id)
+                );
+                CREATE INDEX IF NOT EXISTS strings_identifier
+                    ON strings (project_id, branch_key, identifier);
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    project_id INTEGER NOT NULL,
+                    branch_key INTEGER NOT NULL,
+                    synced_until REAL NOT NULL,
+                    PRIMARY KEY (project_id, branch_key)
+                );
+                """
+            )
+
+    @property
+    def synced_until(self) -> Optional[float]:
+        """Timestamp of the most recent `updatedAt` stored in the mirror."""
+        row = self._connection.execute(
+            "SELECT synced_until FROM sync_state WHERE project_id = ? AND branch_key = ?",
+            (self.project_id, self._branch_key),
+        ).fetchone()
+        return row and row[0]
+
+    def _iter_strings(self, order_by: ListStringsOrderBy) -> Iterator[dict]:
+        return self.resource.with_stream().list_strings(
+            projectId=self.project_id,
+            branchId=self.branch_id,
+            orderBy=Sorting([SortingRule(order_by, SortingOrder.DESC)]),
+        )
+
+    def _iter_changed_strings(self, synced_until: Optional[float]) -> Iterator[dict]:
+        """Yield the strings updated or created since `synced_until`, all strings without it."""
+        if synced_until is None:
+            for item in self._iter_strings(ListStringsOrderBy.UPDATED_AT):
+                yield item["data"]
+            return
+
+        # Strings never updated have no updatedAt, they are found by the createdAt scan
+        for field, order_by in (
+            ("updatedAt", ListStringsOrderBy.UPDATED_AT),
+            ("createdAt", ListStringsOrderBy.CREATED_AT),
+        ):
+            for item in self._iter_strings(order_by):
+                changed_at = item["data"].get(field)
+                if changed_at is None:
+                    continue
+
+                # Strings changed in the same second as the last sync are fetched again
+                if changed_at.timestamp() < synced_until:
+                    break
+
+                yield item["data"]
+
+    def _get_row(self, string: dict, updated_at: float) -> tuple:
+        return (
+            self.project_id,
+            self._branch_key,
+            string["id"],
+            string.get("identifier"),
+            updated_at,
+            dumps(string),
+        )
+
+    def _write_rows(self, rows: List[tuple]):
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO strings VALUES (?, ?, ?, ?, ?, ?)", rows
+        )
+        rows.clear()
+
+    def refresh(self, full: bool = False) -> int:
+        """Download the strings updated since the last sync, return their number."""
+        synced_until = None if full else self.synced_until
+        newest = synced_until
+        string_ids = set()
+        rows = []
+
+        with self._connection:
+            if full:
+                self._connection.execute(
+                    "DELETE FROM strings WHERE project_id = ? AND branch_key = ?",
+                    (self.project_id, self._branch_key),
+                )
+
+            # Rows are written while the strings are listed, in batches of write_batch_size
+            for string in self._iter_changed_strings(synced_until):
+                updated_at = (string.get("updatedAt") or string["createdAt"]).timestamp()
+                newest = max(newest or updated_at, updated_at)
+                string_ids.add(string["id"])
+                rows.append(self._get_row(string, updated_at))
+                if len(rows) >= self.write_batch_size:
+                    self._write_rows(rows)
+            self._write_rows(rows)
+
+            if newest is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+                    (self.project_id, self._branch_key, newest),
+                )
+
+        return len(string_ids)
+
+    def get_string(self, string_id: int) -> Optional[dict]:
+        row = self._connection.execute(
+            "SELECT data FROM strings WHERE project_id = ? AND branch_key = ? AND id = ?",
+            (self.project_id, self._branch_key, string_id),
+        ).fetchone()
+        return row and loads(row[0])
+
+    def get_by_identifier(self, identifier: str) -> Optional[dict]:
+        row = self._connection.execute(
+            "SELECT data FROM strings WHERE project_id = ? AND branch_key = ? AND identifier = ?",
+            (self.project_id, self._branch_key, identifier),
+        ).fetchone()
+        return row and loads(row[0])
+
+    def iter_strings(self) -> Iterator[dict]:
+        cursor = self._connection.execute(
+            "SELECT data FROM strings WHERE project_id = ? AND branch_key = ? ORDER BY id",
+            (self.project_id, self._branch_key),
+        )
+        for (data,) in cursor:
+            yield loads(data)
+
+    def __len__(self):
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM strings WHERE project_id = ? AND branch_key = ?",
+            (self.project_id, self._branch_key),
+        ).fetchone()[0]
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,146 @@
+import datetime
+from unittest import mock
+
+import pytest
+from crowdin_api.api_resources.source_strings.enums import ListStringsOrderBy
+from crowdin_api.api_resources.source_strings.mirror import SourceStringsMirror
+from crowdin_api.api_resources.source_strings.resource import SourceStringsResource
+from crowdin_api.exceptions import CrowdinException
+from crowdin_api.requester import APIRequester, AsyncAPIRequester
+from crowdin_api.sorting import Sorting, SortingOrder, SortingRule
+
+
+def get_time(second):
+    return datetime.datetime(2023, 1, 1, 0, 0, second, tzinfo=datetime.timezone.utc)
+
+
+def get_string(string_id, updated_at, created_at=0):
+    return {
+        "data": {
+            "id": string_id,
+            "identifier": "key_{0}".format(string_id),
+            "text": "text",
+            "createdAt": get_time(created_at),
+            "updatedAt": None if updated_at is None else get_time(updated_at),
+        }
+    }
+
+
+class TestSourceStringsMirror:
+    def get_mirror(self, base_absolut_url, path=":memory:", **kwargs):
+        resource = SourceStringsResource(
+            requester=APIRequester(base_url=base_absolut_url), project_id=1
+        )
+        return SourceStringsMirror(resource, path, **kwargs)
+
+    def test_async_client(self, base_absolut_url):
+        resource = SourceStringsResource(requester=AsyncAPIRequester(base_url=base_absolut_url))
+
+        with pytest.raises(CrowdinException):
+            SourceStringsMirror(resource, ":memory:", project_id=1)
+
+    @mock.patch.object(SourceStringsResource, "list_strings")
+    def test_refresh(self, m_list_strings, base_absolut_url):
+        mirror = self.get_mirror(base_absolut_url, branch_id=2)
+        m_list_strings.return_value = iter([get_string(2, 20), get_string(1, 10)])
+
+        assert mirror.synced_until is None
+        assert mirror.refresh() == 2
+        m_list_strings.assert_called_once_with(
+            projectId=1,
+            branchId=2,
+            orderBy=Sorting([SortingRule(ListStringsOrderBy.UPDATED_AT, SortingOrder.DESC)]),
+        )
+        assert len(mirror) == 2
+        assert mirror.synced_until == get_string(2, 20)["data"]["updatedAt"].timestamp()
+
+        # Only strings updated since the last sync are stored
+        m_list_strings.side_effect = [
+            iter([get_string(3, 30), get_string(2, 20), get_string(1, 10), get_string(0, 5)]),
+            iter([get_string(3, 30), get_string(2, 20), get_string(1, 10), get_string(0, 5)]),
+        ]
+        assert mirror.refresh() == 2
+        m_list_strings.assert_called_with(
+            projectId=1,
+            branchId=2,
+            orderBy=Sorting([SortingRule(ListStringsOrderBy.CREATED_AT, SortingOrder.DESC)]),
+        )
+        assert len(mirror) == 3
+        assert mirror.get_string(3) == get_string(3, 30)["data"]
+        assert mirror.get_by_identifier("key_1") == get_string(1, 10)["data"]
+        assert mirror.get_string(0) is None
+        assert [string["id"] for string in mirror.iter_strings()] == [1, 2, 3]
+
+    @mock.patch.object(SourceStringsResource, "list_strings")
+    def test_refresh_strings_never_updated(self, m_list_strings, base_absolut_url):
+        mirror = self.get_mirror(base_absolut_url)
+        m_list_strings.return_value = iter([get_string(1, 10)])
+        mirror.refresh()
+
+        # New strings have no updatedAt and are listed after the updated ones
+        m_list_strings.side_effect = [
+            iter([get_string(2, 20), get_string(1, 10), get_string(3, None, created_at=30)]),
+            iter([get_string(3, None, created_at=30), get_string(1, 10)]),
+        ]
+        # The string updated in the second of the last sync is fetched again
+        assert mirror.refresh() == 3
+        assert mirror.get_string(3) == get_string(3, None, created_at=30)["data"]
+        assert mirror.synced_until == get_time(30).timestamp()
+
+    @mock.patch.object(SourceStringsResource, "list_strings")
+    def test_refresh_written_in_batches(self, m_list_strings, base_absolut_url):
+        mirror = self.get_mirror(base_absolut_url)
+        mirror.write_batch_size = 2
+        m_list_strings.return_value = iter([get_string(i, 50 - i) for i in range(5)])
+        batches = []
+        write_rows = mirror._write_rows
+
+        def record_rows(rows):
+            batches.append(len(rows))
+            write_rows(rows)
+
+        with mock.patch.object(mirror, "_write_rows", side_effect=record_rows):
+            assert mirror.refresh() == 5
+
+        assert batches == [2, 2, 1]
+        assert len(mirror) == 5
+
+    @mock.patch.object(SourceStringsResource, "list_strings")
+    def test_refresh_failed_rolled_back(self, m_list_strings, base_absolut_url):
+        mirror = self.get_mirror(base_absolut_url)
+        mirror.write_batch_size = 1
+
+        def failing_strings():
+            yield get_string(1, 10)
+            yield get_string(2, 20)
+            raise CrowdinException(detail="Connection reset")
+
+        m_list_strings.return_value = failing_strings()
+        with pytest.raises(CrowdinException):
+            mirror.refresh()
+
+        assert len(mirror) == 0
+        assert mirror.synced_until is None
+
+    @mock.patch.object(SourceStringsResource, "list_strings")
+    def test_refresh_full(self, m_list_strings, base_absolut_url):
+        mirror = self.get_mirror(base_absolut_url)
+        m_list_strings.return_value = iter([get_string(2, 20), get_string(1, 10)])
+        mirror.refresh()
+
+        m_list_strings.return_value = iter([get_string(1, 10)])
+        assert mirror.refresh(full=True) == 1
+        assert [string["id"] for string in mirror.iter_strings()] == [1]
+
+    @mock.patch.object(SourceStringsResource, "list_strings")
+    def test_persistence(self, m_list_strings, base_absolut_url, tmp_path):
+        m_list_strings.return_value = iter([get_string(1, 10)])
+        with self.get_mirror(base_absolut_url, tmp_path / "strings.db") as mirror:
+            mirror.refresh()
+
+        with self.get_mirror(base_absolut_url, tmp_path / "strings.db") as mirror:
+            assert mirror.get_string(1) == get_string(1, 10)["data"]
+
+        with self.get_mirror(base_absolut_url, tmp_path / "strings.db", branch_id=3) as mirror:
+            assert len(mirror) == 0
+            assert mirror.synced_until is None
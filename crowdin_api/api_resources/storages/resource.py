@@ -1,6 +1,14 @@
-from typing import IO, Optional
+import os
+from functools import partial
+from typing import Optional
 
 from crowdin_api.api_resources.abstract.resources import BaseResource
+from crowdin_api.api_resources.storages.upload import UploadSource, UploadStream
+from crowdin_api.cache import StorageCache
+from crowdin_api.exceptions import NotFound
+from crowdin_api.requester import APIRequester
+from crowdin_api.steps import Blocking, Steps
+from crowdin_api.typing import ProgressCallback
 
 
 class StoragesResource(BaseResource):
@@ -20,6 +28,16 @@ class StoragesResource(BaseResource):
     https://developer.crowdin.com/api/v2/#tag/Storage
     """
 
+    def __init__(
+        self,
+        requester: APIRequester,
+        project_id: Optional[int] = None,
+        page_size=25,
+        storage_cache: Optional[StorageCache] = None,
+    ):
+        super().__init__(requester=requester, project_id=project_id, page_size=page_size)
+        self.storage_cache = storage_cache
+
     def get_storages_path(self, storageId: Optional[int] = None):
         if storageId:
             return f"storages/{storageId}"
@@ -44,14 +62,62 @@ class StoragesResource(BaseResource):
             params=self.get_page_params(page=page, offset=offset, limit=limit),
         )
 
-    def add_storage(self, file: IO):
+    def add_storage(
+        self,
+        file: UploadSource,
+        file_name: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        chunk_size: int = UploadStream.default_chunk_size,
+    ):
         """Add Storage.
 
+        `file` is a binary file object, a file path, an iterable of bytes or an `UploadStream`.
+        Paths, iterables and file objects without a name, for which `file_name` must be set, are
+        sent in chunks of `chunk_size` bytes, `progress` is called with the number of bytes sent
+        and the total size after each chunk.
+
+        With a `storage_cache`, content uploaded before under the same name is not uploaded
+        again, the existing storage is returned instead.
+
         Link to documentation:
         https://developer.crowdin.com/api/v2/#operation/api.storages.post
         """
-
-        return self.requester.request(method="post", path=self.get_storages_path(), file=file)
+        # Named files are sent as they are, the HTTP library reads them in blocks
+        is_named_file = hasattr(file, "read") and isinstance(getattr(file, "name", None), str)
+        if not isinstance(file, UploadStream) and not (
+            is_named_file and file_name is None and progress is None and self.storage_cache is None
+        ):
+            file = UploadStream(
+                file, file_name=file_name, chunk_size=chunk_size, progress=progress
+            )
+
+        if self.storage_cache is None:
+            return self.requester.request(method="post", path=self.get_storages_path(), file=file)
+
+        return self.requester.run_steps(self._add_cached_storage(file))
+
+    @staticmethod
+    def _get_storage_cache_key(stream: UploadStream, content_hash: str):
+        return os.path.basename(stream.name), stream.hash_name, content_hash
+
+    def _add_cached_storage(self, stream: UploadStream) -> Steps:
+        key = None
+        if stream.repeatable:
+            content_hash = yield Blocking(stream.content_hash)
+            key = self._get_storage_cache_key(stream, content_hash)
+            storage_id = self.storage_cache.get(key)
+            if storage_id is not None:
+                try:
+                    return (yield partial(self.get_storage, storageId=storage_id))
+                except NotFound:
+                    self.storage_cache.delete(key)
+
+        response = yield partial(
+            self.requester.request, method="post", path=self.get_storages_path(), file=stream
+        )
+        key = key or self._get_storage_cache_key(stream, stream.hexdigest())
+        self.storage_cache.set(key, response["data"]["id"])
+        return response
 
     def get_storage(self, storageId: int):
         """Get Storage.
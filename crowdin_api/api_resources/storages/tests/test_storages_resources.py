@@ -1,6 +1,9 @@
+import io
 from unittest import mock
 
+import pytest
 from crowdin_api.api_resources import StoragesResource
+from crowdin_api.api_resources.storages.upload import UploadStream
 from crowdin_api.requester import APIRequester
 
 
@@ -25,10 +28,43 @@ class TestStoragesResource:
     @mock.patch("crowdin_api.requester.APIRequester.request")
     def test_add_storage(self, m_request, base_absolut_url):
         m_request.return_value = "response"
+        file = io.BytesIO(b"content")
+        file.name = "file.txt"
 
         resource = self.get_resource(base_absolut_url)
-        assert resource.add_storage("SOME_FILE") == "response"
-        m_request.assert_called_once_with(method="post", path="storages", file="SOME_FILE")
+        assert resource.add_storage(file) == "response"
+        m_request.assert_called_once_with(method="post", path="storages", file=file)
+
+    @pytest.mark.parametrize(
+        "in_params, stream_name",
+        (
+            ({"file": __file__}, __file__),
+            ({"file": io.BytesIO(b"content"), "file_name": "file.tmx"}, "file.tmx"),
+            ({"file": [b"con", b"tent"], "file_name": "file.tmx"}, "file.tmx"),
+        ),
+    )
+    @mock.patch("crowdin_api.requester.APIRequester.request")
+    def test_add_storage_stream(self, m_request, in_params, stream_name, base_absolut_url):
+        m_request.return_value = "response"
+        progress = mock.Mock()
+
+        resource = self.get_resource(base_absolut_url)
+        assert resource.add_storage(progress=progress, chunk_size=3, **in_params) == "response"
+
+        stream = m_request.call_args.kwargs["file"]
+        assert isinstance(stream, UploadStream)
+        assert stream.name == stream_name
+        assert stream.source is in_params["file"]
+        assert stream.chunk_size == 3
+        assert stream.progress is progress
+
+    @mock.patch("crowdin_api.requester.APIRequester.request")
+    def test_add_storage_upload_stream(self, m_request, base_absolut_url):
+        stream = UploadStream(b"content", file_name="file.txt")
+
+        self.get_resource(base_absolut_url).add_storage(stream)
+
+        assert m_request.call_args.kwargs["file"] is stream
 
     @mock.patch("crowdin_api.requester.APIRequester.request")
     def test_get_storage(self, m_request, base_absolut_url):
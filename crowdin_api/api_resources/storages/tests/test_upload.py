@@ -0,0 +1,230 @@
+import asyncio
+import hashlib
+import io
+import mimetypes
+from unittest import mock
+
+import pytest
+from crowdin_api.api_resources.storages.resource import StoragesResource
+from crowdin_api.api_resources.storages.upload import UploadStream
+from crowdin_api.cache import StorageCache
+from crowdin_api.exceptions import CrowdinException, NotFound
+from crowdin_api.requester import APIRequester, AsyncAPIRequester
+
+CONTENT = b"<xliff>" + b"0123456789" * 1000 + b"</xliff>"
+
+
+class UnseekableFile(io.RawIOBase):
+    def __init__(self, content: bytes):
+        self._file = io.BytesIO(content)
+
+    def readinto(self, buffer):
+        data = self._file.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+@pytest.fixture
+def file_path(tmp_path):
+    path = tmp_path / "file.xliff"
+    path.write_bytes(CONTENT)
+    return path
+
+
+class TestUploadStream:
+    @pytest.mark.parametrize("memory_map", (False, True))
+    def test_path(self, file_path, memory_map):
+        progress = mock.Mock()
+        stream = UploadStream(file_path, chunk_size=4096, progress=progress, memory_map=memory_map)
+
+        assert stream.name == str(file_path)
+        assert stream.len == len(CONTENT)
+        assert stream.repeatable is True
+
+        chunks = list(stream)
+        assert [len(chunk) for chunk in chunks] == [4096, 4096, len(CONTENT) - 8192]
+        assert b"".join(chunks) == CONTENT
+        assert stream.hexdigest() == hashlib.sha256(CONTENT).hexdigest()
+        assert progress.call_args_list == [
+            mock.call(4096, len(CONTENT)),
+            mock.call(8192, len(CONTENT)),
+            mock.call(len(CONTENT), len(CONTENT)),
+        ]
+
+        # Read again from the start, e.g. on retry
+        assert b"".join(stream) == CONTENT
+        assert stream.bytes_sent == len(CONTENT)
+
+    def test_empty_file_memory_map(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+
+        stream = UploadStream(path, memory_map=True)
+
+        assert list(stream) == []
+        assert stream.hexdigest() == hashlib.sha256(b"").hexdigest()
+
+    def test_seekable_file_without_name(self):
+        file = io.BytesIO(CONTENT)
+        file.read(7)
+
+        stream = UploadStream(file, file_name="file.xliff", chunk_size=5000)
+
+        assert stream.len == len(CONTENT) - 7
+        assert b"".join(stream) == CONTENT[7:]
+        assert b"".join(stream) == CONTENT[7:]
+
+    def test_unseekable_file(self):
+        stream = UploadStream(UnseekableFile(CONTENT), file_name="file.xliff", memory_map=True)
+
+        assert stream.len is None
+        assert stream.repeatable is False
+        assert b"".join(stream) == CONTENT
+
+        with pytest.raises(CrowdinException):
+            list(stream)
+
+    def test_iterable(self):
+        stream = UploadStream(iter([b"abc", b"", b"def"]), file_name="file.txt")
+
+        assert stream.len is None
+        assert list(stream) == [b"abc", b"def"]
+        assert stream.hexdigest() == hashlib.sha256(b"abcdef").hexdigest()
+
+    def test_content_hash(self, file_path):
+        stream = UploadStream(file_path, progress=mock.Mock())
+
+        assert stream.content_hash() == hashlib.sha256(CONTENT).hexdigest()
+        assert stream.bytes_sent == 0
+        stream.progress.assert_not_called()
+
+        with pytest.raises(CrowdinException):
+            UploadStream(iter([b"abc"]), file_name="file.txt").content_hash()
+
+    def test_bytes(self):
+        stream = UploadStream(bytearray(b"abcdef"), file_name="file.txt", chunk_size=4)
+
+        assert stream.len == 6
+        assert list(stream) == [b"abcd", b"ef"]
+
+    @pytest.mark.parametrize(
+        "in_params",
+        (
+            {"source": iter([b"abc"])},
+            {"source": io.BytesIO(b"abc")},
+            {"source": b"abc", "chunk_size": 0},
+        ),
+    )
+    def test_invalid(self, in_params):
+        with pytest.raises(ValueError):
+            UploadStream(**in_params)
+
+
+class TestStreamingUpload:
+    def test_add_storage_path(self, server_url, file_path):
+        progress = mock.Mock()
+        resource = StoragesResource(requester=APIRequester(base_url=server_url))
+
+        response = resource.add_storage(file_path, progress=progress, chunk_size=4096)
+
+        assert response["data"] == {
+            "id": 1,
+            "fileName": "file.xliff",
+            "contentType": mimetypes.guess_type("file.xliff")[0] or "application/octet-stream",
+            "chunked": False,
+            "size": len(CONTENT),
+            "sha256": hashlib.sha256(CONTENT).hexdigest(),
+        }
+        assert progress.call_count == 3
+
+    def test_add_storage_iterable(self, server_url):
+        resource = StoragesResource(requester=APIRequester(base_url=server_url))
+        stream = UploadStream((CONTENT[i:i + 1000] for i in range(0, len(CONTENT), 1000)), "f.tmx")
+
+        response = resource.add_storage(stream)
+
+        assert response["data"]["chunked"] is True
+        assert response["data"]["size"] == len(CONTENT)
+        assert response["data"]["sha256"] == stream.hexdigest()
+
+
+class TestStorageCache:
+    def get_resource(self, server_url, requester_class=APIRequester):
+        return StoragesResource(
+            requester=requester_class(base_url=server_url), storage_cache=StorageCache()
+        )
+
+    def test_identical_content_uploaded_once(self, server_url, file_path):
+        resource = self.get_resource(server_url)
+        storage = {"data": {"id": 1, "fileName": "file.xliff"}}
+
+        with mock.patch.object(resource, "get_storage", return_value=storage) as m_get_storage:
+            first = resource.add_storage(file_path)
+            with open(file_path, "rb") as file:
+                second = resource.add_storage(file)
+
+        assert first["data"]["sha256"] == hashlib.sha256(CONTENT).hexdigest()
+        assert second == storage
+        m_get_storage.assert_called_once_with(storageId=1)
+
+    def test_named_file_first_upload(self, server_url, file_path):
+        resource = self.get_resource(server_url)
+
+        with open(file_path, "rb") as file:
+            response = resource.add_storage(file)
+
+        assert response["data"]["sha256"] == hashlib.sha256(CONTENT).hexdigest()
+        assert len(resource.storage_cache) == 1
+
+    def test_other_name_uploaded(self, server_url, file_path):
+        resource = self.get_resource(server_url)
+
+        with mock.patch.object(resource, "get_storage") as m_get_storage:
+            resource.add_storage(file_path)
+            response = resource.add_storage(CONTENT, file_name="other.xliff")
+
+        assert response["data"]["fileName"] == "other.xliff"
+        m_get_storage.assert_not_called()
+
+    def test_expired_storage_uploaded_again(self, server_url, file_path):
+        resource = self.get_resource(server_url)
+        resource.add_storage(file_path)
+
+        with mock.patch.object(resource, "get_storage", side_effect=NotFound()) as m_get_storage:
+            response = resource.add_storage(file_path)
+
+        assert response["data"]["size"] == len(CONTENT)
+        m_get_storage.assert_called_once_with(storageId=1)
+        assert len(resource.storage_cache) == 1
+
+    def test_iterable_cached_after_upload(self, server_url):
+        resource = self.get_resource(server_url)
+
+        resource.add_storage(iter([CONTENT]), file_name="file.xliff")
+
+        with mock.patch.object(resource, "get_storage", return_value="storage"):
+            assert resource.add_storage(CONTENT, file_name="file.xliff") == "storage"
+
+    def test_async(self, server_url, file_path):
+        resource = self.get_resource(server_url, AsyncAPIRequester)
+
+        async def get_storage(storageId):
+            if storageId == 1 and get_storage.expired:
+                raise NotFound()
+            return {"data": {"id": storageId}}
+
+        get_storage.expired = False
+
+        async def run():
+            with mock.patch.object(resource, "get_storage", side_effect=get_storage):
+                uploaded = await resource.add_storage(file_path)
+                cached = await resource.add_storage(file_path)
+                get_storage.expired = True
+                uploaded_again = await resource.add_storage(file_path)
+            return uploaded, cached, uploaded_again
+
+        uploaded, cached, uploaded_again = asyncio.run(run())
+
+        assert uploaded["data"]["size"] == len(CONTENT)
+        assert cached == {"data": {"id": 1}}
+        assert uploaded_again["data"]["size"] == len(CONTENT)
@@ -0,0 +1,168 @@
+import hashlib
+import io
+import mmap
+import os
+from typing import IO, Iterable, Iterator, Optional, Union
+
+from crowdin_api.exceptions import CrowdinException
+from crowdin_api.typing import ProgressCallback
+
+UploadSource = Union[str, os.PathLike, bytes, IO, Iterable[bytes]]
+
+
+class UploadStream:
+    """
+    Request body sending a file in chunks.
+
+    `source` is a file path, a binary file object or an iterable of bytes. The content is read
+    `chunk_size` bytes at a time while the request is sent, so large files are never held in
+    memory, with `memory_map` a file path is read through a memory map instead of `read` calls.
+    `progress` is called with the number of bytes sent and the total size, None if unknown,
+    and the hash of the content is computed on the way, see `hexdigest`.
+
+    Paths and seekable files are read again from the start when the request is retried,
+    iterables can only be sent once.
+    """
+
+    default_chunk_size = 1024 * 1024
+
+    def __init__(
+        self,
+        source: UploadSource,
+        file_name: Optional[str] = None,
+        chunk_size: int = default_chunk_size,
+        progress: Optional[ProgressCallback] = None,
+        memory_map: bool = False,
+        hash_name: str = "sha256",
+    ):
+        if chunk_size < 1:
+            raise ValueError("The chunk_size must be greater than or equal to 1.")
+
+        self.source = source
+        self.name = file_name or self._get_name(source)
+        if not self.name:
+            raise ValueError("The file_name must be set for sources without a name.")
+
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.memory_map = memory_map
+        self.hash_name = hash_name
+        self.bytes_sent = 0
+        self._hash = hashlib.new(hash_name)
+        self._start = self._get_start(source)
+        self._iterated = False
+
+        # Read by requests to send the Content-Length header, the body is chunked without it
+        self.len = self._get_size(source)
+
+    @staticmethod
+    def _is_path(source: UploadSource) -> bool:
+        return isinstance(source, (str, os.PathLike))
+
+    @classmethod
+    def _get_name(cls, source: UploadSource) -> Optional[str]:
+        if cls._is_path(source):
+            return os.fspath(source)
+
+        name = getattr(source, "name", None)
+        return name if isinstance(name, str) else None
+
+    @staticmethod
+    def _get_start(source: UploadSource) -> Optional[int]:
+        try:
+            return source.tell() if source.seekable() else None
+        except (AttributeError, OSError, ValueError):
+            return None
+
+    def _get_size(self, source: UploadSource) -> Optional[int]:
+        if self._is_path(source):
+            return os.path.getsize(source)
+
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return memoryview(source).nbytes
+
+        if self._start is not None:
+            end = source.seek(0, io.SEEK_END)
+            source.seek(self._start)
+            return end - self._start
+
+        return None
+
+    def _read_file(self, file: IO) -> Iterator[bytes]:
+        if self.memory_map:
+            try:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError, io.UnsupportedOperation):
+                # Empty files and streams without a file descriptor cannot be mapped
+                mapped = None
+
+            if mapped is not None:
+                with mapped:
+                    for offset in range(0, len(mapped), self.chunk_size):
+                        yield mapped[offset:offset + self.chunk_size]
+                return
+
+        chunk = file.read(self.chunk_size)
+        while chunk:
+            yield chunk
+            chunk = file.read(self.chunk_size)
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        source = self.source
+
+        if self._is_path(source):
+            with open(source, "rb") as file:
+                yield from self._read_file(file)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            view = memoryview(source).cast("B")
+            for offset in range(0, len(view), self.chunk_size):
+                yield view[offset:offset + self.chunk_size].tobytes()
+        elif self._start is not None:
+            source.seek(self._start)
+            yield from self._read_file(source)
+        elif hasattr(source, "read"):
+            yield from self._read_file(source)
+        else:
+            yield from source
+
+    @property
+    def repeatable(self) -> bool:
+        """Whether the content can be sent again, e.g. when the request is retried."""
+        return (
+            self._is_path(self.source)
+            or isinstance(self.source, (bytes, bytearray, memoryview))
+            or self._start is not None
+        )
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._iterated and not self.repeatable:
+            raise CrowdinException(detail="The upload source can not be read again")
+
+        self._iterated = True
+        self._hash = hashlib.new(self.hash_name)
+        self.bytes_sent = 0
+
+        for chunk in self._iter_chunks():
+            if not chunk:
+                continue
+
+            self._hash.update(chunk)
+            yield chunk
+
+            self.bytes_sent += len(chunk)
+            if self.progress is not None:
+                self.progress(self.bytes_sent, self.len)
+
+    def hexdigest(self) -> str:
+        """Hash of the content sent."""
+        return self._hash.hexdigest()
+
+    def content_hash(self) -> str:
+        """Read the content to compute its hash before it is sent, only for repeatable sources."""
+        if not self.repeatable:
+            raise CrowdinException(detail="The upload source can only be read once")
+
+        content_hash = hashlib.new(self.hash_name)
+        for chunk in self._iter_chunks():
+            content_hash.update(chunk)
+        return content_hash.hexdigest()
@@ -1,13 +1,28 @@
-from typing import Iterable, Optional
+import hashlib
+import logging
+from collections import Counter
+from functools import partial
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union
 
 from crowdin_api.api_resources.abstract.resources import BaseResource
-from crowdin_api.api_resources.enums import DenormalizePlaceholders, PluralCategoryName
+from crowdin_api.api_resources.enums import (
+    DenormalizePlaceholders,
+    PatchOperation,
+    PluralCategoryName,
+)
+from crowdin_api.api_resources.source_strings.resource import SourceStringsResource
 from crowdin_api.api_resources.string_translations.enums import VoteMark
 from crowdin_api.api_resources.string_translations.types import (
     ApprovalBatchOpPatchRequest,
     TranslationBatchOpPatchRequest
 )
+from crowdin_api.batch import AsyncBatchExecutor, BatchExecutor
 from crowdin_api.sorting import Sorting
+from crowdin_api.steps import Steps
+
+logger = logging.getLogger("crowdin")
+
+TranslationText = Union[str, Mapping[str, str]]
 
 
 class StringTranslationsResource(BaseResource):
@@ -475,3 +490,157 @@ class StringTranslationsResource(BaseResource):
             path=f"projects/{project_id}/translations",
             request_data=data,
         )
+
+    def sync_translations(
+        self,
+        languageId: str,
+        translations: Mapping[Union[int, str], TranslationText],
+        projectId: Optional[int] = None,
+        fileId: Optional[int] = None,
+        branchId: Optional[int] = None,
+        executor: Union[BatchExecutor, AsyncBatchExecutor, None] = None,
+    ):
+        """
+        Add the translations which differ from the current ones.
+
+        `translations` maps string ids or string identifiers to the translated text, or for
+        plural strings to a mapping of plural category names to texts. The current translations
+        of the language, of `fileId` or `branchId` if set, are fetched in bulk and compared by
+        text hash, only new and changed translations are sent by `executor` through
+        `translation_batch_operations`. Returns the `BatchResult`. Identifiers are unique within
+        a file only, without `fileId` identifiers of several strings are skipped, as are
+        identifiers unknown in the project.
+        """
+        projectId = projectId or self.get_project_id()
+        if executor is None:
+            executor = AsyncBatchExecutor() if self.requester.is_async else BatchExecutor()
+
+        kwargs = {
+            "languageId": languageId,
+            "translations": translations,
+            "projectId": projectId,
+            "fileId": fileId,
+            "branchId": branchId,
+            "executor": executor,
+        }
+        return self.requester.run_steps(self._sync_translations(**kwargs))
+
+    @staticmethod
+    def _get_text_hash(text: str) -> bytes:
+        return hashlib.sha1(text.encode("utf-8")).digest()
+
+    @classmethod
+    def _get_translation_hashes(
+        cls, items: Iterable[Dict]
+    ) -> Dict[Tuple[int, Optional[str]], bytes]:
+        hashes = {}
+        for item in items:
+            translation = item["data"]
+            for plural in translation.get("plurals") or ():
+                hashes[translation["stringId"], plural["pluralForm"]] = cls._get_text_hash(
+                    plural["text"]
+                )
+            if translation.get("text") is not None:
+                hashes[translation["stringId"], None] = cls._get_text_hash(translation["text"])
+        return hashes
+
+    def _iter_string_changes(
+        self,
+        languageId: str,
+        string_id: int,
+        text: TranslationText,
+        current: Dict[Tuple[int, Optional[str]], bytes],
+    ) -> Iterator[TranslationBatchOpPatchRequest]:
+        texts = text.items() if isinstance(text, Mapping) else ((None, text),)
+        for plural_form, plural_text in texts:
+            if plural_text is None:
+                continue
+            if current.get((string_id, plural_form)) == self._get_text_hash(plural_text):
+                continue
+
+            value = {"stringId": string_id, "languageId": languageId, "text": plural_text}
+            if plural_form is not None:
+                value["pluralCategoryName"] = plural_form
+            yield {"op": PatchOperation.ADD, "path": "/-", "value": value}
+
+    def _iter_translation_changes(
+        self,
+        languageId: str,
+        translations: Mapping[Union[int, str], TranslationText],
+        string_ids: Optional[Dict[str, Optional[int]]],
+        current: Dict[Tuple[int, Optional[str]], bytes],
+    ) -> Iterator[TranslationBatchOpPatchRequest]:
+        skipped = Counter()
+        for key, text in translations.items():
+            string_id = key if isinstance(key, int) else string_ids.get(key)
+            if string_id is None:
+                skipped["ambiguous" if key in string_ids else "unknown"] += 1
+            else:
+                yield from self._iter_string_changes(languageId, string_id, text, current)
+
+        if skipped["unknown"]:
+            logger.warning(
+                "Skipped translations of {0} unknown string identifiers.".format(skipped["unknown"])
+            )
+        if skipped["ambiguous"]:
+            # Identifiers are unique within a file only
+            logger.warning(
+                "Skipped translations of {0} identifiers used by several strings, set fileId to "
+                "tell them apart.".format(skipped["ambiguous"])
+            )
+
+    @staticmethod
+    def _needs_string_ids(translations: Mapping[Union[int, str], TranslationText]) -> bool:
+        return any(not isinstance(key, int) for key in translations)
+
+    @staticmethod
+    def _get_string_ids(items: Iterable[Dict]) -> Dict[str, Optional[int]]:
+        """Map identifiers to string ids, None for identifiers of several strings."""
+        string_ids = {}
+        ambiguous = set()
+        for item in items:
+            identifier = item["data"]["identifier"]
+            if identifier in string_ids:
+                ambiguous.add(identifier)
+            string_ids[identifier] = item["data"]["id"]
+
+        string_ids.update(dict.fromkeys(ambiguous))
+        return string_ids
+
+    def _get_strings_resource(self, projectId: int) -> SourceStringsResource:
+        return SourceStringsResource(
+            requester=self.requester, project_id=projectId, page_size=self.page_size
+        ).with_fetch_all()
+
+    def _sync_translations(
+        self, languageId, translations, projectId, fileId, branchId, executor
+    ) -> Steps:
+        resource = self.with_fetch_all()
+
+        string_ids = None
+        if self._needs_string_ids(translations):
+            strings = yield partial(
+                self._get_strings_resource(projectId).list_strings,
+                projectId=projectId,
+                fileId=fileId,
+                branchId=branchId,
+            )
+            string_ids = self._get_string_ids(strings["data"])
+
+        current = yield partial(
+            resource.list_language_translations,
+            languageId=languageId,
+            projectId=projectId,
+            fileId=fileId,
+            branchId=branchId,
+        )
+        operations = self._iter_translation_changes(
+            languageId, translations, string_ids, self._get_translation_hashes(current["data"])
+        )
+        return (
+            yield partial(
+                executor.run,
+                partial(self.translation_batch_operations, project_id=projectId),
+                operations,
+            )
+        )
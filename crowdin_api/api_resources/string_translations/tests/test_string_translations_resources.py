@@ -1,3 +1,4 @@
+import asyncio
 from unittest import mock
 
 import pytest
@@ -9,7 +10,9 @@ from crowdin_api.api_resources.string_translations.enums import (
     VoteMark,
 )
 from crowdin_api.api_resources.string_translations.resource import StringTranslationsResource
-from crowdin_api.requester import APIRequester
+from crowdin_api.batch import BatchExecutor
+from crowdin_api.exceptions import ValidationError
+from crowdin_api.requester import APIRequester, AsyncAPIRequester
 from crowdin_api.sorting import Sorting, SortingOrder, SortingRule
 
 
@@ -624,3 +627,148 @@ class TestStringTranslationsResource:
             path=f"projects/{project_id}/translations",
             request_data=request_params,
         )
+
+
+STRINGS = [
+    {"data": {"id": 1, "identifier": "app.title"}},
+    {"data": {"id": 2, "identifier": "app.items"}},
+    {"data": {"id": 3, "identifier": "app.new"}},
+]
+
+CURRENT_TRANSLATIONS = [
+    {"data": {"stringId": 1, "text": "Titel"}},
+    {
+        "data": {
+            "stringId": 2,
+            "text": None,
+            "plurals": [
+                {"pluralForm": "one", "text": "Element"},
+                {"pluralForm": "other", "text": "Elemente"},
+            ],
+        }
+    },
+]
+
+
+class TestSyncTranslations:
+    def fake_request(self, method, path, params=None, request_data=None):
+        if path == "projects/1/strings":
+            return {"data": STRINGS[params["offset"]:params["offset"] + params["limit"]]}
+        if path == "projects/1/languages/de/translations":
+            return {"data": CURRENT_TRANSLATIONS[params["offset"]:]}
+        if path == "projects/1/translations":
+            self.batches.append(request_data)
+            if any(operation["value"]["text"] == "invalid" for operation in request_data):
+                raise ValidationError()
+            return {"data": [{"data": operation["value"]} for operation in request_data]}
+        raise AssertionError(path)
+
+    def get_resource(self, base_absolut_url, requester_class=APIRequester):
+        self.batches = []
+        return StringTranslationsResource(
+            requester=requester_class(base_url=base_absolut_url), project_id=1
+        )
+
+    def test_only_changes_sent(self, base_absolut_url):
+        resource = self.get_resource(base_absolut_url)
+
+        with mock.patch.object(resource.requester, "request", side_effect=self.fake_request):
+            result = resource.sync_translations(
+                "de",
+                {
+                    "app.title": "Titel",
+                    "app.items": {"one": "Element", "other": "Eintr\u00e4ge"},
+                    "app.new": "Neu",
+                    "app.unknown": "Unbekannt",
+                },
+            )
+
+        assert result.ok
+        assert result.total == 2
+        assert [operation["value"] for batch in self.batches for operation in batch] == [
+            {
+                "stringId": 2,
+                "languageId": "de",
+                "text": "Eintr\u00e4ge",
+                "pluralCategoryName": "other",
+            },
+            {"stringId": 3, "languageId": "de", "text": "Neu"},
+        ]
+        assert self.batches[0][0]["op"] == PatchOperation.ADD
+        assert self.batches[0][0]["path"] == "/-"
+
+    def test_ambiguous_identifiers_skipped(self, base_absolut_url, caplog):
+        resource = self.get_resource(base_absolut_url)
+        strings = STRINGS + [{"data": {"id": 4, "identifier": "app.new"}}]
+
+        def fake_request(method, path, params=None, request_data=None):
+            if path == "projects/1/strings":
+                return {"data": strings[params["offset"]:params["offset"] + params["limit"]]}
+            return self.fake_request(method, path, params, request_data)
+
+        with mock.patch.object(resource.requester, "request", side_effect=fake_request):
+            result = resource.sync_translations(
+                "de", {"app.title": "Neuer Titel", "app.new": "Neu", "app.unknown": "?"}
+            )
+
+        assert [operation["value"]["stringId"] for operation in self.batches[0]] == [1]
+        assert result.total == 1
+        assert "1 unknown string identifiers" in caplog.text
+        assert "1 identifiers used by several strings" in caplog.text
+
+    def test_string_ids(self, base_absolut_url):
+        resource = self.get_resource(base_absolut_url)
+
+        with mock.patch.object(
+            resource.requester, "request", side_effect=self.fake_request
+        ) as m_request:
+            result = resource.sync_translations(
+                "de",
+                {1: "Neuer Titel", 3: "Neu", 4: "invalid"},
+                executor=BatchExecutor(max_operations=1, concurrency=1),
+            )
+
+        # Strings are not listed without identifiers
+        paths = [call.kwargs["path"] for call in m_request.call_args_list]
+        assert "projects/1/strings" not in paths
+        assert result.succeeded == 2
+        assert list(result.errors) == [2]
+        assert result.failed_operations[2]["value"]["stringId"] == 4
+
+    def test_nothing_changed(self, base_absolut_url):
+        resource = self.get_resource(base_absolut_url)
+
+        with mock.patch.object(resource.requester, "request", side_effect=self.fake_request):
+            result = resource.sync_translations("de", {1: "Titel", 2: {"one": "Element"}})
+
+        assert result.total == 0
+        assert self.batches == []
+
+    def test_file_and_branch(self, base_absolut_url):
+        resource = self.get_resource(base_absolut_url)
+
+        with mock.patch.object(
+            resource.requester, "request", side_effect=self.fake_request
+        ) as m_request:
+            resource.sync_translations("de", {"app.new": "Neu"}, fileId=5, branchId=6)
+
+        for call in m_request.call_args_list[:2]:
+            assert call.kwargs["params"]["fileId"] == 5
+            assert call.kwargs["params"]["branchId"] == 6
+
+    def test_async(self, base_absolut_url):
+        resource = self.get_resource(base_absolut_url, AsyncAPIRequester)
+
+        async def request(**kwargs):
+            return self.fake_request(**kwargs)
+
+        async def run():
+            with mock.patch.object(resource.requester, "request", side_effect=request):
+                return await resource.sync_translations(
+                    "de", {"app.title": "Titel", "app.new": "Neu"}
+                )
+
+        result = asyncio.run(run())
+
+        assert result.total == 1
+        assert result.data == [{"data": {"stringId": 3, "languageId": "de", "text": "Neu"}}]
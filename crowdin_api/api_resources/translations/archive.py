@@ -0,0 +1,223 @@
+import os
+import struct
+import zlib
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from crowdin_api.exceptions import CrowdinException
+
+FileCallback = Callable[[str, bytes], None]
+
+_LOCAL_FILE_HEADER = struct.Struct("<4s5H3I2H")
+_LOCAL_FILE_SIGNATURE = b"PK\x03\x04"
+_DATA_DESCRIPTOR_SIGNATURE = b"PK\x07\x08"
+# The central directory, or the end of central directory records of archives without entries
+_CENTRAL_DIRECTORY_SIGNATURES = (b"PK\x01\x02", b"PK\x05\x06", b"PK\x06\x06")
+_ZIP64_EXTRA_ID = 0x0001
+
+_FLAG_ENCRYPTED = 0x1
+_FLAG_DATA_DESCRIPTOR = 0x8
+_FLAG_UTF8 = 0x800
+
+_STORED = 0
+_DEFLATED = 8
+
+
+class _ChunkReader:
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def read_chunk(self) -> bytes:
+        if self._buffer:
+            chunk, self._buffer = self._buffer, b""
+            return chunk
+        return next(self._chunks, b"")
+
+    def read(self, size: int) -> bytes:
+        data = [self._buffer]
+        available = len(self._buffer)
+        while available < size:
+            chunk = next(self._chunks, b"")
+            if not chunk:
+                break
+            data.append(chunk)
+            available += len(chunk)
+
+        data = b"".join(data)
+        self._buffer = data[size:]
+        return data[:size]
+
+    def read_exactly(self, size: int) -> bytes:
+        data = self.read(size)
+        if len(data) != size:
+            raise CrowdinException(detail="The archive is truncated")
+        return data
+
+    def unread(self, data: bytes):
+        self._buffer = data + self._buffer
+
+
+def _get_zip64_sizes(extra: bytes):
+    while len(extra) >= 4:
+        header_id, size = struct.unpack("<HH", extra[:4])
+        if header_id == _ZIP64_EXTRA_ID:
+            return struct.unpack("<QQ", extra[4:20]) if size >= 16 else None
+        extra = extra[4 + size:]
+    return None
+
+
+def _iter_stored(reader: _ChunkReader, size: int) -> Iterator[bytes]:
+    while size:
+        chunk = reader.read_chunk()
+        if not chunk:
+            raise CrowdinException(detail="The archive is truncated")
+        if len(chunk) > size:
+            reader.unread(chunk[size:])
+            chunk = chunk[:size]
+        size -= len(chunk)
+        yield chunk
+
+
+def _iter_deflated(reader: _ChunkReader, size: Optional[int]) -> Iterator[bytes]:
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+    chunks = _iter_stored(reader, size) if size is not None else iter(reader.read_chunk, b"")
+
+    for chunk in chunks:
+        data = decompressor.decompress(chunk)
+        if data:
+            yield data
+        if decompressor.eof:
+            reader.unread(decompressor.unused_data)
+            break
+
+    if not decompressor.eof:
+        raise CrowdinException(detail="The archive is truncated")
+    data = decompressor.flush()
+    if data:
+        yield data
+
+
+def _read_local_file_header(reader: _ChunkReader) -> Optional[bytes]:
+    """Return the header of the next entry, None at the central directory after the last one."""
+    header = reader.read(_LOCAL_FILE_HEADER.size)
+    signature = header[:4]
+    if signature in _CENTRAL_DIRECTORY_SIGNATURES:
+        return None
+    if len(signature) == 4 and signature != _LOCAL_FILE_SIGNATURE:
+        raise CrowdinException(detail="The content is not a ZIP archive")
+    if len(header) != _LOCAL_FILE_HEADER.size:
+        raise CrowdinException(detail="The archive is truncated")
+    return header
+
+
+def iter_zip_stream(chunks: Iterable[bytes]) -> Iterator[Tuple[str, Iterator[bytes]]]:
+    """
+    Read a ZIP archive from `chunks` as they arrive, without waiting for its end.
+
+    Yields the name of each entry and an iterator over its content, which has to be consumed
+    before the next entry is read. Stored and deflated entries are supported.
+    """
+    reader = _ChunkReader(chunks)
+
+    while True:
+        header = _read_local_file_header(reader)
+        if header is None:
+            return
+
+        (_, _, flags, method, _, _, crc, compressed_size, _, name_size, extra_size) = (
+            _LOCAL_FILE_HEADER.unpack(header)
+        )
+        name = reader.read_exactly(name_size).decode("utf-8" if flags & _FLAG_UTF8 else "cp437")
+        zip64_sizes = _get_zip64_sizes(reader.read_exactly(extra_size))
+        if zip64_sizes is not None:
+            compressed_size = zip64_sizes[1]
+
+        has_descriptor = bool(flags & _FLAG_DATA_DESCRIPTOR)
+        if flags & _FLAG_ENCRYPTED or method not in (_STORED, _DEFLATED) or (
+            method == _STORED and has_descriptor
+        ):
+            raise CrowdinException(detail="Unsupported archive entry {0}".format(name))
+
+        if method == _STORED:
+            content = _iter_stored(reader, compressed_size)
+        else:
+            content = _iter_deflated(reader, None if has_descriptor else compressed_size)
+
+        entry = _iter_checked(reader, content, name, crc, has_descriptor, zip64_sizes is not None)
+        yield name, entry
+
+        # Skip what the caller did not read
+        for _ in entry:
+            pass
+
+
+def _iter_checked(
+    reader: _ChunkReader,
+    content: Iterator[bytes],
+    name: str,
+    crc: int,
+    has_descriptor: bool,
+    is_zip64: bool,
+) -> Iterator[bytes]:
+    content_crc = 0
+    for data in content:
+        content_crc = zlib.crc32(data, content_crc)
+        yield data
+
+    if has_descriptor:
+        descriptor = reader.read_exactly(4)
+        if descriptor == _DATA_DESCRIPTOR_SIGNATURE:
+            descriptor = reader.read_exactly(4)
+        (crc,) = struct.unpack("<I", descriptor)
+        reader.read_exactly(16 if is_zip64 else 8)
+
+    if content_crc != crc:
+        raise CrowdinException(detail="Invalid checksum of {0}".format(name))
+
+
+def _get_target_path(directory: str, name: str) -> str:
+    directory = os.path.realpath(directory)
+    path = os.path.realpath(os.path.join(directory, name))
+    if os.path.commonpath([directory, path]) != directory:
+        raise CrowdinException(detail="Archive entry {0} is outside of the directory".format(name))
+    return path
+
+
+def extract_zip_stream(
+    chunks: Iterable[bytes],
+    directory: Union[str, os.PathLike, None] = None,
+    on_file: Optional[FileCallback] = None,
+) -> List[str]:
+    """
+    Extract the files of a ZIP archive while it is downloaded, return their names.
+
+    Files are written under `directory` block by block, `on_file` is called with the name and
+    the content of each file.
+    """
+    if directory is None and on_file is None:
+        raise ValueError("The directory or on_file must be set.")
+
+    names = []
+    for name, content in iter_zip_stream(chunks):
+        if name.endswith("/"):
+            if directory is not None:
+                os.makedirs(_get_target_path(directory, name), exist_ok=True)
+            continue
+
+        if directory is not None:
+            path = _get_target_path(directory, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                if on_file is None:
+                    for data in content:
+                        file.write(data)
+                else:
+                    data = b"".join(content)
+                    file.write(data)
+                    on_file(name, data)
+        else:
+            on_file(name, b"".join(content))
+
+        names.append(name)
+
+    return names
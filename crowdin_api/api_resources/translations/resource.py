@@ -1,7 +1,12 @@
-from typing import Dict, Iterable, Optional
+import logging
+import os
+import time
+from functools import partial
+from typing import Dict, Iterable, Optional, Union
 
 from crowdin_api.api_resources.abstract.resources import BaseResource
 from crowdin_api.api_resources.enums import ExportProjectTranslationFormat
+from crowdin_api.api_resources.translations.archive import FileCallback, extract_zip_stream
 from crowdin_api.api_resources.translations.types import (
     FallbackLanguages,
     EditPreTranslationScheme,
@@ -14,6 +19,10 @@ from crowdin_api.api_resources.translations.enums import (
     PreTranslationReplaceTranslationsOption,
     PreTranslationScope,
 )
+from crowdin_api.exceptions import CrowdinException
+from crowdin_api.steps import Blocking, Sleep, Steps
+
+logger = logging.getLogger("crowdin")
 
 
 class TranslationsResource(BaseResource):
@@ -459,6 +468,118 @@ class TranslationsResource(BaseResource):
             path=self.get_builds_path(projectId=projectId, buildId=buildId),
         )
 
+    def build_and_download_translations(
+        self,
+        directory: Union[str, os.PathLike, None] = None,
+        on_file: Optional[FileCallback] = None,
+        request_data: Optional[Dict] = None,
+        projectId: Optional[int] = None,
+        poll_interval: float = 1,
+        max_poll_interval: float = 15,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Build project translations, wait for the build, download and extract it.
+
+        The build status is polled every `poll_interval` seconds at first, then less often as
+        the progress of the build shows how long it still needs, at most every
+        `max_poll_interval` seconds. The archive is extracted while it is downloaded, files are
+        written under `directory` and passed with their content to `on_file`. Returns the names
+        of the extracted files.
+
+        The build is canceled when it does not finish within `timeout` seconds or waiting for it
+        is interrupted, e.g. by KeyboardInterrupt or cancellation of the task.
+        """
+        if directory is None and on_file is None:
+            raise ValueError("The directory or on_file must be set.")
+
+        kwargs = {
+            "directory": directory,
+            "on_file": on_file,
+            "request_data": request_data or {},
+            "projectId": projectId or self.get_project_id(),
+            "poll_interval": poll_interval,
+            "max_poll_interval": max_poll_interval,
+            "timeout": timeout,
+        }
+        return self.requester.run_steps(self._build_and_download_translations(**kwargs))
+
+    @staticmethod
+    def _get_build_poll_delay(
+        build: Dict, elapsed: float, delay: float, poll_interval: float, max_poll_interval: float
+    ) -> float:
+        progress = build.get("progress") or 0
+        if 0 < progress < 100:
+            # Check again halfway through the estimated remaining time
+            delay = elapsed * (100 - progress) / progress / 2
+        else:
+            delay *= 2
+        return min(max(delay, poll_interval), max_poll_interval)
+
+    @staticmethod
+    def _check_build(build: Dict, started: float, timeout: Optional[float]) -> bool:
+        if build["status"] == "finished":
+            return True
+        if build["status"] in ("failed", "canceled"):
+            raise CrowdinException(
+                detail="Build {0} is {1}".format(build["id"], build["status"])
+            )
+        if timeout is not None and time.monotonic() - started > timeout:
+            raise CrowdinException(
+                detail="Build {0} did not finish in {1} seconds".format(build["id"], timeout)
+            )
+        return False
+
+    def _build_and_download_translations(
+        self,
+        directory,
+        on_file,
+        request_data,
+        projectId,
+        poll_interval,
+        max_poll_interval,
+        timeout,
+    ) -> Steps:
+        started = time.monotonic()
+        build = yield partial(
+            self.build_project_translation, request_data=request_data, projectId=projectId
+        )
+        build = build["data"]
+        delay = poll_interval
+
+        try:
+            while not self._check_build(build, started, timeout):
+                elapsed = time.monotonic() - started
+                delay = self._get_build_poll_delay(
+                    build, elapsed, delay, poll_interval, max_poll_interval
+                )
+                yield Sleep(delay)
+                build = yield partial(
+                    self.check_project_build_status, buildId=build["id"], projectId=projectId
+                )
+                build = build["data"]
+        except BaseException:
+            if build["status"] not in ("finished", "failed", "canceled"):
+                try:
+                    yield partial(self.cancel_build, buildId=build["id"], projectId=projectId)
+                except CrowdinException as err:
+                    logger.warning("Failed to cancel build {0}: {1}".format(build["id"], err))
+            raise
+
+        url = yield partial(
+            self.download_project_translations, buildId=build["id"], projectId=projectId
+        )
+        return (
+            yield Blocking(
+                partial(
+                    extract_zip_stream,
+                    self.requester.iter_download(url["data"]["url"]),
+                    directory=directory,
+                    on_file=on_file,
+                )
+            )
+        )
+
     def export_project_translation(
         self,
         targetLanguageId: str,
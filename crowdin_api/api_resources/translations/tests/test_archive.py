@@ -0,0 +1,146 @@
+import io
+import zipfile
+
+import pytest
+from crowdin_api.api_resources.translations.archive import extract_zip_stream, iter_zip_stream
+from crowdin_api.exceptions import CrowdinException
+
+FILES = {
+    "de/strings.xml": b"<resources>" + b"<string>Hallo</string>" * 500 + b"</resources>",
+    "de/empty.txt": b"",
+    "uk/readme.md": "Привіт".encode("utf-8") * 100,
+}
+
+
+class UnseekableWriter(io.RawIOBase):
+    """Makes zipfile write data descriptors after the entries."""
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self.buffer.write(data)
+
+
+def make_archive(compression=zipfile.ZIP_DEFLATED, seekable=True, force_zip64=False) -> bytes:
+    file = io.BytesIO() if seekable else UnseekableWriter()
+    with zipfile.ZipFile(file, "w", compression=compression) as archive:
+        archive.writestr("de/", b"")
+        for name, content in FILES.items():
+            with archive.open(name, "w", force_zip64=force_zip64) as entry:
+                entry.write(content)
+    return file.getvalue() if seekable else file.buffer.getvalue()
+
+
+def split(data: bytes, size: int = 7):
+    return [data[offset:offset + size] for offset in range(0, len(data), size)]
+
+
+class TestIterZipStream:
+    @pytest.mark.parametrize(
+        "in_params",
+        (
+            {"compression": zipfile.ZIP_DEFLATED},
+            {"compression": zipfile.ZIP_STORED},
+            {"compression": zipfile.ZIP_DEFLATED, "seekable": False},
+            {"compression": zipfile.ZIP_DEFLATED, "seekable": False, "force_zip64": True},
+            {"compression": zipfile.ZIP_STORED, "force_zip64": True},
+        ),
+    )
+    @pytest.mark.parametrize("chunk_size", (7, 4096))
+    def test_entries(self, in_params, chunk_size):
+        entries = {
+            name: b"".join(content)
+            for name, content in iter_zip_stream(split(make_archive(**in_params), chunk_size))
+        }
+
+        assert entries == {"de/": b"", **FILES}
+
+    def test_unread_entries_skipped(self):
+        names = [name for name, _ in iter_zip_stream(split(make_archive(seekable=False)))]
+
+        assert names == ["de/", *FILES]
+
+    def test_truncated(self):
+        archive = make_archive()
+
+        with pytest.raises(CrowdinException, match="truncated"):
+            list(iter_zip_stream([archive[:100]]))
+
+    @pytest.mark.parametrize("size", (0, 2))
+    def test_truncated_before_central_directory(self, size):
+        archive = make_archive()
+        end = archive.index(b"PK\x01\x02") + size
+
+        with pytest.raises(CrowdinException, match="truncated"):
+            list(iter_zip_stream(split(archive[:end])))
+
+    @pytest.mark.parametrize(
+        "content", (b"<html><body>Gateway Timeout</body></html>", b'{"error": "not found"}')
+    )
+    def test_not_zip_archive(self, content):
+        with pytest.raises(CrowdinException, match="not a ZIP archive"):
+            list(iter_zip_stream([content]))
+
+    def test_empty_archive(self):
+        file = io.BytesIO()
+        zipfile.ZipFile(file, "w").close()
+
+        assert list(iter_zip_stream([file.getvalue()])) == []
+
+    def test_invalid_checksum(self):
+        archive = bytearray(make_archive(compression=zipfile.ZIP_STORED))
+        offset = archive.index(b"Hallo")
+        archive[offset] = ord("h")
+
+        with pytest.raises(CrowdinException, match="checksum"):
+            list(iter_zip_stream([bytes(archive)]))
+
+    def test_unsupported_compression(self):
+        file = io.BytesIO()
+        with zipfile.ZipFile(file, "w", compression=zipfile.ZIP_BZIP2) as archive:
+            archive.writestr("file.txt", b"content")
+
+        with pytest.raises(CrowdinException, match="Unsupported"):
+            list(iter_zip_stream([file.getvalue()]))
+
+
+class TestExtractZipStream:
+    def test_directory(self, tmp_path):
+        names = extract_zip_stream(split(make_archive(), 100), directory=tmp_path)
+
+        assert names == list(FILES)
+        for name, content in FILES.items():
+            assert (tmp_path / name).read_bytes() == content
+
+    def test_callback(self):
+        files = {}
+
+        extract_zip_stream([make_archive()], on_file=files.__setitem__)
+
+        assert files == FILES
+
+    def test_directory_and_callback(self, tmp_path):
+        files = {}
+
+        extract_zip_stream([make_archive()], directory=tmp_path, on_file=files.__setitem__)
+
+        assert files == FILES
+        assert (tmp_path / "de/strings.xml").read_bytes() == FILES["de/strings.xml"]
+
+    def test_outside_of_directory(self, tmp_path):
+        file = io.BytesIO()
+        with zipfile.ZipFile(file, "w") as archive:
+            archive.writestr("../evil.txt", b"content")
+
+        with pytest.raises(CrowdinException, match="outside"):
+            extract_zip_stream([file.getvalue()], directory=tmp_path / "target")
+
+        assert not (tmp_path / "evil.txt").exists()
+
+    def test_no_target(self):
+        with pytest.raises(ValueError):
+            extract_zip_stream([])
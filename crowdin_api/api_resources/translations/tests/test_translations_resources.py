@@ -1,3 +1,6 @@
+import asyncio
+import io
+import zipfile
 from unittest import mock
 
 import pytest
@@ -11,7 +14,8 @@ from crowdin_api.api_resources.translations.enums import (
     PreTranslationScope,
 )
 from crowdin_api.api_resources.translations.resource import TranslationsResource
-from crowdin_api.requester import APIRequester
+from crowdin_api.exceptions import CrowdinException
+from crowdin_api.requester import APIRequester, AsyncAPIRequester
 
 
 class TestTranslationsResource:
@@ -816,3 +820,192 @@ class TestTranslationsResource:
             method="get",
             path=f"projects/{project_id}/translations/imports/{import_translation_id}/report",
         )
+
+
+def make_build(status, progress=0):
+    return {"data": {"id": 2, "status": status, "progress": progress}}
+
+
+def make_archive():
+    file = io.BytesIO()
+    with zipfile.ZipFile(file, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("de/strings.xml", b"<resources/>")
+        archive.writestr("uk/strings.xml", b"<resources></resources>")
+    return file.getvalue()
+
+
+class TestBuildAndDownloadTranslations:
+    def get_resource(self, base_absolut_url, requester_class=APIRequester):
+        return TranslationsResource(requester=requester_class(base_url=base_absolut_url))
+
+    @mock.patch("crowdin_api.api_resources.translations.resource.time.sleep")
+    def test_build_and_download(self, m_sleep, base_absolut_url, tmp_path):
+        resource = self.get_resource(base_absolut_url)
+        statuses = [
+            make_build("inProgress", 10),
+            make_build("inProgress", 60),
+            make_build("finished"),
+        ]
+        files = {}
+
+        with mock.patch.object(
+            resource, "build_project_translation", return_value=make_build("created")
+        ) as m_build, mock.patch.object(
+            resource, "check_project_build_status", side_effect=statuses
+        ) as m_status, mock.patch.object(
+            resource, "download_project_translations", return_value={"data": {"url": "url"}}
+        ), mock.patch.object(
+            resource.requester, "iter_download", return_value=iter([make_archive()])
+        ) as m_iter_download:
+            names = resource.build_and_download_translations(
+                directory=tmp_path,
+                on_file=files.__setitem__,
+                request_data={"targetLanguageIds": ["de", "uk"]},
+                projectId=1,
+                poll_interval=0.5,
+                max_poll_interval=8,
+            )
+
+        assert names == ["de/strings.xml", "uk/strings.xml"]
+        assert files["de/strings.xml"] == b"<resources/>"
+        assert (tmp_path / "uk/strings.xml").read_bytes() == b"<resources></resources>"
+        m_build.assert_called_once_with(
+            request_data={"targetLanguageIds": ["de", "uk"]}, projectId=1
+        )
+        assert m_status.call_count == 3
+        m_iter_download.assert_called_once_with("url")
+        delays = [call.args[0] for call in m_sleep.call_args_list]
+        assert delays[0] == 1
+        assert all(0.5 <= delay <= 8 for delay in delays)
+
+    @pytest.mark.parametrize(
+        "build, elapsed, delay, expected",
+        (
+            ({"progress": 0}, 1, 0.5, 1),
+            ({"progress": 0}, 1, 10, 15),
+            ({"progress": 50}, 20, 1, 10),
+            ({"progress": 99}, 20, 1, 1),
+            ({"progress": 10}, 20, 1, 15),
+        ),
+    )
+    def test_poll_delay(self, build, elapsed, delay, expected):
+        assert TranslationsResource._get_build_poll_delay(build, elapsed, delay, 1, 15) == expected
+
+    @mock.patch("crowdin_api.api_resources.translations.resource.time.sleep")
+    def test_failed_build(self, m_sleep, base_absolut_url):
+        resource = self.get_resource(base_absolut_url)
+
+        with mock.patch.object(
+            resource, "build_project_translation", return_value=make_build("created")
+        ), mock.patch.object(
+            resource, "check_project_build_status", return_value=make_build("failed")
+        ), mock.patch.object(resource, "cancel_build") as m_cancel:
+            with pytest.raises(CrowdinException, match="failed"):
+                resource.build_and_download_translations(on_file=mock.Mock(), projectId=1)
+
+        m_cancel.assert_not_called()
+
+    @pytest.mark.parametrize("error", (KeyboardInterrupt, CrowdinException))
+    @mock.patch("crowdin_api.api_resources.translations.resource.time.sleep")
+    def test_aborted_build_canceled(self, m_sleep, error, base_absolut_url):
+        resource = self.get_resource(base_absolut_url)
+        m_sleep.side_effect = [None, error()]
+
+        with mock.patch.object(
+            resource, "build_project_translation", return_value=make_build("created")
+        ), mock.patch.object(
+            resource, "check_project_build_status", return_value=make_build("inProgress", 5)
+        ), mock.patch.object(
+            resource, "cancel_build", side_effect=CrowdinException("Not found")
+        ) as m_cancel:
+            with pytest.raises(error):
+                resource.build_and_download_translations(on_file=mock.Mock(), projectId=1)
+
+        m_cancel.assert_called_once_with(buildId=2, projectId=1)
+
+    @mock.patch("crowdin_api.api_resources.translations.resource.time.monotonic")
+    @mock.patch("crowdin_api.api_resources.translations.resource.time.sleep")
+    def test_timeout(self, m_sleep, m_monotonic, base_absolut_url):
+        resource = self.get_resource(base_absolut_url)
+        m_monotonic.side_effect = [0, 1, 2, 100]
+
+        with mock.patch.object(
+            resource, "build_project_translation", return_value=make_build("created")
+        ), mock.patch.object(
+            resource, "check_project_build_status", return_value=make_build("inProgress", 5)
+        ), mock.patch.object(resource, "cancel_build") as m_cancel:
+            with pytest.raises(CrowdinException, match="did not finish"):
+                resource.build_and_download_translations(
+                    on_file=mock.Mock(), projectId=1, timeout=60
+                )
+
+        m_cancel.assert_called_once_with(buildId=2, projectId=1)
+
+    def test_no_target(self, base_absolut_url):
+        with pytest.raises(ValueError):
+            self.get_resource(base_absolut_url).build_and_download_translations(projectId=1)
+
+    def test_async(self, base_absolut_url, tmp_path):
+        resource = self.get_resource(base_absolut_url, AsyncAPIRequester)
+        statuses = iter([make_build("inProgress", 50), make_build("finished")])
+
+        async def build_project_translation(**kwargs):
+            return make_build("created")
+
+        async def check_project_build_status(**kwargs):
+            return next(statuses)
+
+        async def download_project_translations(**kwargs):
+            return {"data": {"url": "url"}}
+
+        async def run():
+            with mock.patch.object(
+                resource, "build_project_translation", side_effect=build_project_translation
+            ), mock.patch.object(
+                resource, "check_project_build_status", side_effect=check_project_build_status
+            ), mock.patch.object(
+                resource,
+                "download_project_translations",
+                side_effect=download_project_translations,
+            ), mock.patch.object(
+                resource.requester, "iter_download", return_value=iter([make_archive()])
+            ):
+                return await resource.build_and_download_translations(
+                    directory=tmp_path, projectId=1, poll_interval=0, max_poll_interval=0
+                )
+
+        assert asyncio.run(run()) == ["de/strings.xml", "uk/strings.xml"]
+        assert (tmp_path / "de/strings.xml").read_bytes() == b"<resources/>"
+
+    def test_async_cancelled(self, base_absolut_url):
+        resource = self.get_resource(base_absolut_url, AsyncAPIRequester)
+        canceled = []
+
+        async def build_project_translation(**kwargs):
+            return make_build("created")
+
+        async def check_project_build_status(**kwargs):
+            return make_build("inProgress", 1)
+
+        async def cancel_build(**kwargs):
+            canceled.append(kwargs)
+
+        async def run():
+            with mock.patch.object(
+                resource, "build_project_translation", side_effect=build_project_translation
+            ), mock.patch.object(
+                resource, "check_project_build_status", side_effect=check_project_build_status
+            ), mock.patch.object(resource, "cancel_build", side_effect=cancel_build):
+                task = asyncio.ensure_future(
+                    resource.build_and_download_translations(
+                        on_file=mock.Mock(), projectId=1, poll_interval=0.01
+                    )
+                )
+                await asyncio.sleep(0.05)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+        asyncio.run(run())
+
+        assert canceled == [{"buildId": 2, "projectId": 1}]
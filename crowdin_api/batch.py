@@ -0,0 +1,192 @@
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import count
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from crowdin_api.exceptions import APIException, CrowdinException
+from crowdin_api.parser import dumps
+
+Chunk = Tuple[int, List[Dict]]
+
+
+class BatchResult:
+    """Outcome of a `BatchExecutor` run."""
+
+    def __init__(self):
+        self.total = 0
+        self.responses: List[Tuple[int, Any]] = []
+        self.errors: Dict[int, Exception] = {}
+        self.failed_operations: Dict[int, Dict] = {}
+
+    @property
+    def succeeded(self) -> int:
+        return self.total - len(self.errors)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def data(self) -> List:
+        """The `data` of all responses in the order of the operations."""
+        data = []
+        for _, response in sorted(self.responses, key=lambda item: item[0]):
+            if isinstance(response, dict) and isinstance(response.get("data"), list):
+                data.extend(response["data"])
+        return data
+
+    def raise_for_errors(self):
+        if self.errors:
+            index, error = min(self.errors.items(), key=lambda item: item[0])
+            raise CrowdinException(
+                detail="{0} of {1} operations failed, the first one at {2}: {3}".format(
+                    len(self.errors), self.total, index, error
+                )
+            )
+
+
+class _BaseBatchExecutor:
+    def __init__(
+        self,
+        max_operations: int = 500,
+        max_size: int = 1024 * 1024,
+        concurrency: int = 4,
+        split_rejected: bool = True,
+    ):
+        if max_operations < 1 or max_size < 1 or concurrency < 1:
+            raise ValueError(
+                "The max_operations, max_size and concurrency must be greater than or equal to 1."
+            )
+
+        self.max_operations = max_operations
+        self.max_size = max_size
+        self.concurrency = concurrency
+        self.split_rejected = split_rejected
+
+    def iter_chunks(self, operations: Iterable[Dict], result: BatchResult) -> Iterator[Chunk]:
+        """Split operations into chunks of at most `max_operations` and `max_size` bytes."""
+        chunk, chunk_start, chunk_size = [], 0, 2
+
+        for index, operation in zip(count(), operations):
+            result.total += 1
+            # The separator between the operations in the JSON array
+            size = len(dumps(operation).encode("utf-8")) + 1
+
+            if chunk and (
+                len(chunk) >= self.max_operations or chunk_size + size > self.max_size
+            ):
+                yield chunk_start, chunk
+                chunk, chunk_start, chunk_size = [], index, 2
+
+            chunk.append(operation)
+            chunk_size += size
+
+        if chunk:
+            yield chunk_start, chunk
+
+    def _split_rejected(
+        self, result: BatchResult, start: int, chunk: List[Dict], error: Exception
+    ) -> List[Chunk]:
+        """Return the halves of a rejected chunk to send again, record the error otherwise."""
+        # Retryable errors were retried by the requester, others are caused by the operations
+        if (
+            self.split_rejected
+            and len(chunk) > 1
+            and isinstance(error, APIException)
+            and not error.should_retry
+        ):
+            middle = len(chunk) // 2
+            return [(start, chunk[:middle]), (start + middle, chunk[middle:])]
+
+        for index, operation in enumerate(chunk, start):
+            result.errors[index] = error
+            result.failed_operations[index] = operation
+        return []
+
+
+class BatchExecutor(_BaseBatchExecutor):
+    """
+    Sends a large number of JSON Patch operations to a batch endpoint in chunks.
+
+    Operations are read lazily and sent in chunks of at most `max_operations` operations and
+    `max_size` bytes of JSON, up to `concurrency` chunks at a time, e.g.
+
+        executor = BatchExecutor(max_operations=500, concurrency=4)
+        result = executor.run(
+            partial(client.string_translations.translation_batch_operations, project_id=1),
+            operations,
+        )
+
+    `send` is called with the chunk as `data`. Requests are sent through the requester, which
+    applies its rate limiter and retries throttled and failed requests. A chunk rejected by the
+    API, e.g. with a validation error, is split in halves and sent again until the rejected
+    operations are isolated, so the others are applied. `result.errors` maps the index of each
+    rejected operation to its error and `result.failed_operations` to the operation.
+    """
+
+    def _send_chunk(self, send: Callable, result: BatchResult, start: int, chunk: List[Dict]):
+        try:
+            result.responses.append((start, send(data=chunk)))
+        except Exception as err:
+            for part in self._split_rejected(result, start, chunk, err):
+                self._send_chunk(send, result, *part)
+
+    def run(self, send: Callable[..., Dict], operations: Iterable[Dict]) -> BatchResult:
+        result = BatchResult()
+        chunks = self.iter_chunks(operations, result)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            pending = set()
+            try:
+                for start, chunk in chunks:
+                    if len(pending) >= self.concurrency:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    pending.add(executor.submit(self._send_chunk, send, result, start, chunk))
+
+                for future in pending:
+                    future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        return result
+
+
+class AsyncBatchExecutor(_BaseBatchExecutor):
+    """`BatchExecutor` for asyncio, `send` returns an awaitable."""
+
+    async def _send_chunk(
+        self, send: Callable, result: BatchResult, start: int, chunk: List[Dict]
+    ):
+        try:
+            result.responses.append((start, await send(data=chunk)))
+        except Exception as err:
+            for part in self._split_rejected(result, start, chunk, err):
+                await self._send_chunk(send, result, *part)
+
+    async def run(
+        self, send: Callable[..., Awaitable[Dict]], operations: Iterable[Dict]
+    ) -> BatchResult:
+        result = BatchResult()
+        pending = set()
+
+        try:
+            for start, chunk in self.iter_chunks(operations, result):
+                if len(pending) >= self.concurrency:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        task.result()
+                pending.add(asyncio.ensure_future(self._send_chunk(send, result, start, chunk)))
+
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return result
@@ -0,0 +1,217 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple, Union
+
+
+class ResponseCache:
+    """
+    ETag cache of GET responses.
+
+    `APIRequester` stores the ETag and parsed body of successful GET responses, sends
+    `If-None-Match` with the next request to the same URL and returns a copy of the stored body
+    when the API answers `304 Not Modified`, so the body is not parsed again. The least recently
+    used entries are dropped above `max_entries`. The cache is thread-safe and can be shared by
+    several clients.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        if max_entries < 1:
+            raise ValueError("The max_entries must be greater than or equal to 1.")
+
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Tuple[str, Any]]:
+        """Return the ETag and a copy of the body stored for the key."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+
+        etag, content = entry
+        return etag, copy.deepcopy(content)
+
+    def set(self, key: Hashable, etag: str, content: Any):
+        content = copy.deepcopy(content)
+
+        with self._lock:
+            self._entries[key] = (etag, content)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class TTLCache:
+    """
+    In-memory cache of parsed GET responses with a time to live per endpoint.
+
+    `ttl` maps path patterns to the number of seconds responses are kept, "*" matches one path
+    segment, e.g. `{"languages": 3600, "projects/*": 60}`. Paths matching no pattern are not
+    cached. Above `max_entries` the least recently used entries are dropped. Post, put, patch
+    and delete requests drop the entries whose path starts with the request path or is a prefix
+    of it, so `PATCH projects/1` clears both `projects/1` and `projects`.
+
+    Without `ttl`, the reference data in `default_ttl` is cached. `APIRequester` keys the
+    responses by API url and token, so clients of different accounts can share a cache. Callers
+    get a copy of the cached response, the cache is thread-safe.
+    """
+
+    default_ttl = {
+        "languages": 3600,
+        "languages/*": 3600,
+        "mts": 600,
+        "mts/*": 600,
+        "workflow-templates": 3600,
+        "workflow-templates/*": 3600,
+        "projects/*": 60,
+        "user": 600,
+    }
+
+    def __init__(
+        self, ttl: Optional[Dict[str, Union[int, float]]] = None, max_entries: int = 1024
+    ):
+        if max_entries < 1:
+            raise ValueError("The max_entries must be greater than or equal to 1.")
+
+        ttl = self.default_ttl if ttl is None else ttl
+        self.ttl = {self._split_path(pattern): value for pattern, value in ttl.items()}
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _split_path(path: str) -> Tuple[str, ...]:
+        return tuple(path.strip("/").split("/"))
+
+    def get_ttl(self, path: str) -> Optional[Union[int, float]]:
+        """Return the time to live of the first pattern matching the path."""
+        segments = self._split_path(path)
+
+        for pattern, ttl in self.ttl.items():
+            if len(pattern) == len(segments) and all(
+                expected in ("*", segment) for expected, segment in zip(pattern, segments)
+            ):
+                return ttl
+
+        return None
+
+    def get(self, path: str, key: Hashable) -> Optional[Any]:
+        entry_key = (self._split_path(path), key)
+
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                return None
+
+            expires_at, content = entry
+            if expires_at <= time.monotonic():
+                del self._entries[entry_key]
+                return None
+
+            self._entries.move_to_end(entry_key)
+
+        return copy.deepcopy(content)
+
+    def set(self, path: str, key: Hashable, content: Any):
+        ttl = self.get_ttl(path)
+        if not ttl:
+            return
+
+        entry_key = (self._split_path(path), key)
+        content = copy.deepcopy(content)
+
+        with self._lock:
+            self._entries[entry_key] = (time.monotonic() + ttl, content)
+            self._entries.move_to_end(entry_key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: str):
+        """Drop the entries on the path, above it and below it."""
+        segments = self._split_path(path)
+
+        with self._lock:
+            for entry_key in list(self._entries):
+                entry_segments = entry_key[0]
+                size = min(len(segments), len(entry_segments))
+                if entry_segments[:size] == segments[:size]:
+                    del self._entries[entry_key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class StorageCache:
+    """
+    Storage ids of uploaded content.
+
+    `StoragesResource.add_storage` looks up the hash and name of the content and returns the
+    storage uploaded before instead of uploading the same file again. Entries expire after `ttl`
+    seconds, which should stay within the time Crowdin keeps storages. A storage removed
+    earlier is noticed when it is looked up and the content is uploaded again. Storages belong
+    to the account that uploaded them, so a cache must not be shared by clients of different
+    accounts. The cache is thread-safe.
+    """
+
+    def __init__(self, ttl: Union[int, float] = 3600, max_entries: int = 1024):
+        if max_entries < 1:
+            raise ValueError("The max_entries must be greater than or equal to 1.")
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, storage_id = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return storage_id
+
+    def set(self, key: Hashable, storage_id: int):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, storage_id)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
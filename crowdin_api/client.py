@@ -1,10 +1,32 @@
+from __future__ import annotations
+
 import copy
-from typing import Dict, Optional, Type, Union
+import functools
+from typing import Callable, Dict, Optional, Type, Union
 
 from crowdin_api import api_resources
+from crowdin_api.cache import ResponseCache, StorageCache, TTLCache
+from crowdin_api.connection import ConnectionPool
 from crowdin_api.enums import PlatformType
 from crowdin_api.exceptions import CrowdinException
-from crowdin_api.requester import APIRequester
+from crowdin_api.rate_limit import RateLimiter
+from crowdin_api.requester import APIRequester, AsyncAPIRequester
+from crowdin_api.retry import RetryPolicy
+from crowdin_api.transport import Transport
+
+
+def _cached_resource(get_resource: Callable) -> Callable:
+    """Build the resource once per project and page size and reuse it on every access."""
+
+    @functools.wraps(get_resource)
+    def wrapper(self):
+        key = (get_resource.__name__, self.PROJECT_ID, self.PAGE_SIZE)
+        try:
+            return self._resources[key]
+        except KeyError:
+            return self._resources.setdefault(key, get_resource(self))
+
+    return wrapper
 
 
 class CrowdinClient:
@@ -22,6 +44,16 @@ class CrowdinClient:
     USER_AGENT = "crowdin-api-client-python"
     PAGE_SIZE = 25
     EXTENDED_REQUEST_PARAMS = None
+    RETRY_POLICY: Optional[RetryPolicy] = None
+    RATE_LIMITER: Optional[RateLimiter] = None
+    RESPONSE_CACHE: Optional[ResponseCache] = None
+    TTL_CACHE: Optional[TTLCache] = None
+    STORAGE_CACHE: Optional[StorageCache] = None
+    COALESCE_REQUESTS = False
+    CONNECTION_POOL: Optional[ConnectionPool] = None
+    TRANSPORT: Optional[Transport] = None
+
+    _CACHE_OPTIONS = ("response_cache", "ttl_cache", "storage_cache")
 
     def __init__(
         self,
@@ -38,27 +70,55 @@ class CrowdinClient:
         max_retries: Optional[int] = None,
         http_protocol: Optional[str] = None,
         headers: Optional[dict] = None,
-        extended_request_params: Optional[dict] = None
+        extended_request_params: Optional[dict] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        ttl_cache: Optional[TTLCache] = None,
+        storage_cache: Optional[StorageCache] = None,
+        coalesce_requests: Optional[bool] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+        transport: Optional[Transport] = None,
     ):
-        self.PROJECT_ID = project_id or self.PROJECT_ID
-        self.ORGANIZATION = organization or self.ORGANIZATION
-        self.TOKEN = token or self.TOKEN
-        self.BASE_URL = base_url or self.BASE_URL
-        self.USER_AGENT = user_agent or self.USER_AGENT
-        self.PAGE_SIZE = page_size or self.PAGE_SIZE
-        self.TIMEOUT = timeout or self.TIMEOUT
-        self.RETRY_DELAY = retry_delay or self.RETRY_DELAY
-        self.MAX_RETRIES = max_retries or self.MAX_RETRIES
-        self.HTTP_PROTOCOL = http_protocol or self.HTTP_PROTOCOL
-        self.HEADERS = headers or self.HEADERS
-        self.EXTENDED_REQUEST_PARAMS = extended_request_params or self.EXTENDED_REQUEST_PARAMS
+        self._set_options(
+            project_id=project_id,
+            organization=organization,
+            token=token,
+            base_url=base_url,
+            user_agent=user_agent,
+            page_size=page_size,
+            timeout=timeout,
+            retry_delay=retry_delay,
+            max_retries=max_retries,
+            http_protocol=http_protocol,
+            headers=headers,
+            extended_request_params=extended_request_params,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
+            ttl_cache=ttl_cache,
+            storage_cache=storage_cache,
+            coalesce_requests=coalesce_requests,
+            connection_pool=connection_pool,
+            transport=transport,
+        )
         self._api_requestor = None
+        self._resources = {}
+        self._project_clients = {}
 
         if self.ORGANIZATION is None:
             self._platform_type = PlatformType.BASIC
         else:
             self._platform_type = PlatformType.ENTERPRISE
 
+    def _set_options(self, **options):
+        """Override the class attributes of the options passed, e.g. `token` sets `TOKEN`."""
+        for name, value in options.items():
+            # Caches are set even when empty, which makes them falsy
+            is_set = value is not None if name in self._CACHE_OPTIONS else bool(value)
+            if is_set:
+                setattr(self, name.upper(), value)
+
     @property
     def url(self) -> str:
         if not self._is_enterprise_platform:
@@ -81,18 +141,51 @@ class CrowdinClient:
 
         return headers
 
+    def _get_requester_kwargs(self) -> Dict:
+        return {
+            "base_url": self.url,
+            "timeout": self.TIMEOUT,
+            "retry_delay": self.RETRY_DELAY,
+            "max_retries": self.MAX_RETRIES,
+            "default_headers": self.get_default_headers(),
+            "extended_params": self.EXTENDED_REQUEST_PARAMS,
+            "retry_policy": self.RETRY_POLICY,
+            "rate_limiter": self.RATE_LIMITER,
+            "response_cache": self.RESPONSE_CACHE,
+            "ttl_cache": self.TTL_CACHE,
+            "coalesce_requests": self.COALESCE_REQUESTS,
+            "connection_pool": self.CONNECTION_POOL,
+            "transport": self.TRANSPORT,
+        }
+
     def get_api_requestor(self) -> APIRequester:
         if self._api_requestor is None:
-            self._api_requestor = self.API_REQUESTER_CLASS(
-                base_url=self.url,
-                timeout=self.TIMEOUT,
-                retry_delay=self.RETRY_DELAY,
-                max_retries=self.MAX_RETRIES,
-                default_headers=self.get_default_headers(),
-                extended_params=self.EXTENDED_REQUEST_PARAMS
-            )
+            self._api_requestor = self.API_REQUESTER_CLASS(**self._get_requester_kwargs())
         return self._api_requestor
 
+    def close(self):
+        if self._api_requestor is not None:
+            self._api_requestor.close()
+            self._api_requestor = None
+            self._resources.clear()
+            self._project_clients.clear()
+
+    def for_project(self, project_id: int) -> CrowdinClient:
+        """
+        Return a client bound to the project.
+
+        The client shares the connection and the cached resources of this one, so code working
+        on several projects does not build a client per call.
+        """
+        client = self._project_clients.get(project_id)
+        if client is None:
+            self.get_api_requestor()
+            client = copy.copy(self)
+            client.PROJECT_ID = project_id
+            client = self._project_clients.setdefault(project_id, client)
+
+        return client
+
     def graphql(self, query: str, variables: Optional[Dict] = None) -> Dict:
         data = {
             "query": query,
@@ -105,6 +198,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def ai(self) -> Union[api_resources.AIResource, api_resources.EnterpriseAIResource]:
         if self._is_enterprise_platform:
             ai_class = api_resources.EnterpriseAIResource
@@ -120,12 +214,14 @@ class CrowdinClient:
         return ai_class(requester=self.get_api_requestor(), page_size=self.PAGE_SIZE)
 
     @property
+    @_cached_resource
     def applications(self) -> api_resources.ApplicationResource:
         return api_resources.ApplicationResource(
             requester=self.get_api_requestor(), page_size=self.PAGE_SIZE
         )
 
     @property
+    @_cached_resource
     def bundles(self) -> api_resources.BundlesResource:
         if self.PROJECT_ID:
             return api_resources.BundlesResource(
@@ -139,6 +235,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def dictionaries(self) -> api_resources.DictionariesResource:
         if self.PROJECT_ID:
             return api_resources.DictionariesResource(
@@ -152,6 +249,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def distributions(self) -> api_resources.DistributionsResource:
         if self.PROJECT_ID:
             return api_resources.DistributionsResource(
@@ -165,6 +263,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def fields(self) -> api_resources.FieldsResource:
         if not self._is_enterprise_platform:
             raise CrowdinException(detail="Not implemented for the base API")
@@ -181,6 +280,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def glossaries(self) -> api_resources.GlossariesResource:
         if self.PROJECT_ID:
             return api_resources.GlossariesResource(
@@ -194,6 +294,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def groups(self) -> api_resources.GroupsResource:
         if not self._is_enterprise_platform:
             raise CrowdinException(detail="Not implemented for the base API")
@@ -210,6 +311,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def labels(self) -> api_resources.LabelsResource:
         if self.PROJECT_ID:
             return api_resources.LabelsResource(
@@ -223,6 +325,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def languages(self) -> api_resources.LanguagesResource:
         if self.PROJECT_ID:
             return api_resources.LanguagesResource(
@@ -236,6 +339,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def projects(self) -> api_resources.ProjectsResource:
         if self.PROJECT_ID:
             return api_resources.ProjectsResource(
@@ -249,6 +353,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def reports(self) -> Union[api_resources.ReportsResource,
                                api_resources.EnterpriseReportsResource]:
 
@@ -270,6 +375,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def screenshots(self) -> api_resources.ScreenshotsResource:
         if self.PROJECT_ID:
             return api_resources.ScreenshotsResource(
@@ -283,6 +389,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def security_logs(self) -> api_resources.SecurityLogsResource:
         if self.PROJECT_ID:
             return api_resources.SecurityLogsResource(
@@ -296,6 +403,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def source_files(self) -> api_resources.SourceFilesResource:
         if self.PROJECT_ID:
             return api_resources.SourceFilesResource(
@@ -309,6 +417,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def source_strings(self) -> api_resources.SourceStringsResource:
         if self.PROJECT_ID:
             return api_resources.SourceStringsResource(
@@ -322,19 +431,24 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def storages(self) -> api_resources.StoragesResource:
         if self.PROJECT_ID:
             return api_resources.StoragesResource(
                 requester=self.get_api_requestor(),
                 project_id=self.PROJECT_ID,
                 page_size=self.PAGE_SIZE,
+                storage_cache=self.STORAGE_CACHE,
             )
 
         return api_resources.StoragesResource(
-            requester=self.get_api_requestor(), page_size=self.PAGE_SIZE
+            requester=self.get_api_requestor(),
+            page_size=self.PAGE_SIZE,
+            storage_cache=self.STORAGE_CACHE,
         )
 
     @property
+    @_cached_resource
     def string_comments(self) -> api_resources.StringCommentsResource:
         if self.PROJECT_ID:
             return api_resources.StringCommentsResource(
@@ -348,6 +462,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def string_translations(self) -> api_resources.StringTranslationsResource:
         if self.PROJECT_ID:
             return api_resources.StringTranslationsResource(
@@ -361,6 +476,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def style_guides(self) -> api_resources.StyleGuidesResource:
         if self.PROJECT_ID:
             return api_resources.StyleGuidesResource(
@@ -374,6 +490,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def tasks(self) -> Union[api_resources.TasksResource, api_resources.EnterpriseTasksResource]:
         if self._is_enterprise_platform:
             report_class = api_resources.EnterpriseTasksResource
@@ -393,6 +510,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def teams(self) -> api_resources.TeamsResource:
         if not self._is_enterprise_platform:
             raise CrowdinException(detail="Not implemented for the base API")
@@ -409,6 +527,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def translation_memory(self) -> api_resources.TranslationMemoryResource:
         if self.PROJECT_ID:
             return api_resources.TranslationMemoryResource(
@@ -422,6 +541,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def translation_status(self) -> api_resources.TranslationStatusResource:
         if self.PROJECT_ID:
             return api_resources.TranslationStatusResource(
@@ -435,6 +555,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def translations(self) -> api_resources.TranslationsResource:
         if self.PROJECT_ID:
             return api_resources.TranslationsResource(
@@ -448,6 +569,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def machine_translations(self) -> api_resources.MachineTranslationEnginesResource:
         if self.PROJECT_ID:
             return api_resources.MachineTranslationEnginesResource(
@@ -461,6 +583,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def users(self) -> Union[api_resources.UsersResource, api_resources.EnterpriseUsersResource]:
         if self._is_enterprise_platform:
             user_class = api_resources.EnterpriseUsersResource
@@ -479,6 +602,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def vendors(self) -> api_resources.VendorsResource:
         if not self._is_enterprise_platform:
             raise CrowdinException(detail="Not implemented for the base API")
@@ -495,6 +619,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def webhooks(self) -> api_resources.WebhooksResource:
         if self.PROJECT_ID:
             return api_resources.WebhooksResource(
@@ -508,6 +633,7 @@ class CrowdinClient:
         )
 
     @property
+    @_cached_resource
     def workflows(self) -> api_resources.WorkflowsResource:
         if not self._is_enterprise_platform:
             raise CrowdinException(detail="Not implemented for the base API")
@@ -522,3 +648,33 @@ class CrowdinClient:
         return api_resources.WorkflowsResource(
             requester=self.get_api_requestor(), page_size=self.PAGE_SIZE
         )
+
+
+class AsyncCrowdinClient(CrowdinClient):
+    """Asyncio flavour of `CrowdinClient`.
+
+    Exposes the same resources, but every API method returns an awaitable:
+
+        async with AsyncCrowdinClient(token="__token__") as client:
+            project = await client.projects.get_project(projectId=1)
+    """
+
+    API_REQUESTER_CLASS: Type[AsyncAPIRequester] = AsyncAPIRequester
+
+    MAX_CONCURRENCY = 100
+
+    def __init__(self, *args, max_concurrency: Optional[int] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._set_options(max_concurrency=max_concurrency)
+
+    def _get_requester_kwargs(self) -> Dict:
+        return {**super()._get_requester_kwargs(), "max_concurrency": self.MAX_CONCURRENCY}
+
+    def get_api_requestor(self) -> AsyncAPIRequester:
+        return super().get_api_requestor()
+
+    async def __aenter__(self) -> "AsyncCrowdinClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
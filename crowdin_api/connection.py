@@ -0,0 +1,179 @@
+import logging
+import socket
+import threading
+from typing import Dict, Optional, Union
+
+from requests import Request
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from requests.exceptions import RequestException
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import HTTPError
+
+logger = logging.getLogger("crowdin")
+
+
+class _CountingPoolMixin:
+    """Count the sockets opened by a host pool, including reconnects of pooled connections."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.num_sockets = 0
+        self.num_reused = 0
+        self._counts_lock = threading.Lock()
+
+    def count_socket(self):
+        with self._counts_lock:
+            self.num_sockets += 1
+
+    def _make_request(self, conn, *args, **kwargs):
+        with self._counts_lock:
+            if conn.sock is None:
+                self.num_sockets += 1
+            else:
+                self.num_reused += 1
+        return super()._make_request(conn, *args, **kwargs)
+
+
+class _HTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _HTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class ConnectionPool(HTTPAdapter):
+    """
+    Transport adapter with tunable connection pooling.
+
+    `pool_maxsize` is the number of connections kept open per host, it should be at least the
+    number of threads sending requests, otherwise connections are closed after use and the next
+    request pays a new TLS handshake. With `pool_block` set, requests wait for a free connection
+    instead of opening one that is discarded afterwards.
+
+    With `keep_alive` disabled every request closes its connection. `keep_alive_idle` enables
+    TCP keep-alive probes after the given number of idle seconds, so idle pooled connections
+    are not silently dropped by proxies and load balancers. `warm_up` connections are opened
+    when the requester is created.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        keep_alive: bool = True,
+        keep_alive_idle: Optional[int] = None,
+        warm_up: int = 0,
+    ):
+        if pool_maxsize < 1:
+            raise ValueError("The pool_maxsize must be greater than or equal to 1.")
+
+        self.keep_alive = keep_alive
+        self.keep_alive_idle = keep_alive_idle
+        self.warm_up = min(warm_up, pool_maxsize)
+        self._requests = 0
+        self._disposed_counts = (0, 0)
+        self._stats_lock = threading.Lock()
+        super().__init__(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block
+        )
+
+    def get_socket_options(self) -> list:
+        options = list(HTTPConnection.default_socket_options)
+        if self.keep_alive_idle is None:
+            return options
+
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.keep_alive_idle))
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.keep_alive_idle))
+        return options
+
+    def init_poolmanager(self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs):
+        pool_kwargs.setdefault("socket_options", self.get_socket_options())
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _HTTPConnectionPool,
+            "https": _HTTPSConnectionPool,
+        }
+
+        # Keep the counts of host pools dropped from the pool manager
+        pools = self.poolmanager.pools
+        dispose = pools.dispose_func
+
+        def dispose_pool(pool):
+            with self._stats_lock:
+                sockets, reused = self._disposed_counts
+                self._disposed_counts = (sockets + pool.num_sockets, reused + pool.num_reused)
+            if dispose is not None:
+                dispose(pool)
+
+        pools.dispose_func = dispose_pool
+
+    def send(self, request, *args, **kwargs):
+        if not self.keep_alive:
+            request.headers["Connection"] = "close"
+
+        with self._stats_lock:
+            self._requests += 1
+        return super().send(request, *args, **kwargs)
+
+    def warm_up_connections(
+        self, url: str, connections: Optional[int] = None, verify=True, proxies=None, cert=None
+    ) -> int:
+        """
+        Open connections to the host of the url in advance, return the number opened.
+
+        `verify`, `proxies` and `cert` must match the settings requests are sent with, otherwise
+        the connections are opened in another host pool.
+        """
+        connections = self.warm_up if connections is None else connections
+        if hasattr(self, "get_connection_with_tls_context"):
+            pool = self.get_connection_with_tls_context(
+                Request("GET", url).prepare(), verify=verify, proxies=proxies, cert=cert
+            )
+        else:  # pragma: no cover, requests < 2.32
+            pool = self.get_connection(url, proxies=proxies)
+        checked_out = []
+        opened = 0
+
+        try:
+            for _ in range(min(connections, self._pool_maxsize)):
+                conn = pool._get_conn()
+                checked_out.append(conn)
+                if conn.sock is None:
+                    conn.connect()
+                    pool.count_socket()
+                    opened += 1
+        except (OSError, ValueError, RequestException, HTTPError) as err:
+            logger.info("Connection warm-up to {url} stopped: {err}".format(url=url, err=err))
+        finally:
+            for conn in checked_out:
+                pool._put_conn(conn)
+
+        return opened
+
+    @property
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Number of requests sent, connections opened, including warm-up and reconnects, and
+        requests sent over an already open connection.
+        """
+        with self.poolmanager.pools.lock:
+            pools = [self.poolmanager.pools[key] for key in self.poolmanager.pools.keys()]
+
+        with self._stats_lock:
+            requests = self._requests
+            connections, reused = self._disposed_counts
+
+        connections += sum(pool.num_sockets for pool in pools)
+        reused += sum(pool.num_reused for pool in pools)
+        return {
+            "requests": requests,
+            "connections": connections,
+            "reused": reused,
+            "reuse_ratio": reused / requests if requests else 0.0,
+        }
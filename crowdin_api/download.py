@@ -0,0 +1,289 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, Optional, Set, Tuple, Type, Union
+
+import requests
+from crowdin_api import status
+from crowdin_api.exceptions import APIException, CrowdinException
+from crowdin_api.retry import RetryPolicy
+from crowdin_api.typing import ProgressCallback
+
+logger = logging.getLogger("crowdin")
+
+_content_range_re = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+class RangedDownload:
+    """
+    Download of a file to disk in fixed-size chunks.
+
+    When the server answers `Range` requests, up to `concurrency` chunks are requested in
+    parallel and written to their place in `<path>.part`. The finished chunks are recorded in
+    `<path>.part.json`, so running the download again after a failure only requests the
+    missing ones, as long as the size and ETag of the file did not change. Servers without range
+    support get a single streamed request. At most `concurrency` blocks of `block_size` bytes
+    are held in memory.
+
+    Once complete the size and, with `checksum`, the `hash_name` hash of the file are verified
+    and the file is moved to `path`. Failed requests are retried according to `retry_policy`.
+    """
+
+    block_size = 64 * 1024
+
+    def __init__(
+        self,
+        session: requests.Session,
+        url: str,
+        path: Union[str, os.PathLike],
+        chunk_size: int = 8 * 1024 * 1024,
+        concurrency: int = 4,
+        checksum: Optional[str] = None,
+        hash_name: str = "sha256",
+        progress: Optional[ProgressCallback] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: Optional[float] = None,
+        exception_map: Optional[Dict[int, Type[APIException]]] = None,
+        **request_kwargs
+    ):
+        if chunk_size < 1:
+            raise ValueError("The chunk_size must be greater than or equal to 1.")
+        if concurrency < 1:
+            raise ValueError("The concurrency must be greater than or equal to 1.")
+
+        self.session = session
+        self.url = url
+        self.path = os.fspath(path)
+        self.part_path = self.path + ".part"
+        self.state_path = self.part_path + ".json"
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.checksum = checksum
+        self.hash_name = hash_name
+        self.progress = progress
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.timeout = timeout
+        self.exception_map = exception_map or {}
+        self.request_kwargs = request_kwargs
+
+        self.size = None
+        self.etag = None
+        self.bytes_done = 0
+        self._done: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def _get(self, headers: Optional[Dict] = None) -> requests.Response:
+        try:
+            response = self.session.get(
+                self.url, headers=headers, stream=True, timeout=self.timeout, **self.request_kwargs
+            )
+        except requests.RequestException as err:
+            raise APIException(detail=str(err), should_retry=True) from err
+
+        if response.status_code not in (status.HTTP_200_OK, status.HTTP_206_PARTIAL_CONTENT):
+            response.close()
+            raise self.exception_map.get(response.status_code, APIException)(
+                http_status=response.status_code, headers=response.headers
+            )
+
+        return response
+
+    def _with_retries(self, func: Callable, *args):
+        num_retries = 0
+        started = time.monotonic()
+
+        while True:
+            try:
+                return func(*args)
+            except APIException as err:
+                num_retries += 1
+                delay = self.retry_policy.get_delay(
+                    err, num_retries=num_retries, elapsed=time.monotonic() - started
+                )
+                if delay is None:
+                    raise
+
+                logger.info(
+                    "Retrying download of {url} after {delay} seconds.".format(
+                        url=self.url, delay=round(delay, 3)
+                    )
+                )
+                time.sleep(delay)
+
+    def _iter_blocks(self, response: requests.Response) -> Iterator[bytes]:
+        try:
+            yield from response.iter_content(self.block_size)
+        except requests.RequestException as err:
+            raise APIException(detail=str(err), should_retry=True) from err
+        finally:
+            response.close()
+
+    def _add_progress(self, amount: int):
+        with self._lock:
+            self.bytes_done += amount
+            bytes_done = self.bytes_done
+
+        if self.progress is not None:
+            self.progress(bytes_done, self.size)
+
+    def _get_chunks(self) -> Iterator[Tuple[int, int, int]]:
+        for index, start in enumerate(range(0, self.size, self.chunk_size)):
+            yield index, start, min(start + self.chunk_size, self.size) - 1
+
+    def _load_state(self):
+        try:
+            with open(self.state_path) as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        if (
+            state.get("size") == self.size
+            and state.get("etag") == self.etag
+            and state.get("chunk_size") == self.chunk_size
+            and os.path.exists(self.part_path)
+        ):
+            self._done = set(state.get("done", []))
+
+    def _save_state(self):
+        state = {
+            "size": self.size,
+            "etag": self.etag,
+            "chunk_size": self.chunk_size,
+            "done": sorted(self._done),
+        }
+        with open(self.state_path + ".tmp", "w") as file:
+            json.dump(state, file)
+        os.replace(self.state_path + ".tmp", self.state_path)
+
+    def _write_chunk(self, index: int, start: int, end: int, response=None):
+        if response is None:
+            response = self._get(headers={"Range": "bytes={0}-{1}".format(start, end)})
+
+        content_range = _content_range_re.match(response.headers.get("Content-Range", ""))
+        if response.status_code != status.HTTP_206_PARTIAL_CONTENT or content_range is None or (
+            int(content_range.group(1)) != start
+        ):
+            response.close()
+            raise CrowdinException(detail="The server did not answer the range request")
+
+        written = 0
+        try:
+            with open(self.part_path, "r+b") as file:
+                file.seek(start)
+                for block in self._iter_blocks(response):
+                    file.write(block)
+                    written += len(block)
+                    self._add_progress(len(block))
+        except APIException:
+            self._add_progress(-written)
+            raise
+
+        if written != end - start + 1:
+            self._add_progress(-written)
+            raise APIException(detail="Incomplete chunk", should_retry=True)
+
+        with self._lock:
+            self._done.add(index)
+            self._save_state()
+
+    def _download_ranges(self, probe: requests.Response):
+        self._load_state()
+        if not self._done:
+            with open(self.part_path, "wb") as file:
+                file.truncate(self.size)
+
+        self.bytes_done = 0
+        self._add_progress(
+            sum(end - start + 1 for index, start, end in self._get_chunks() if index in self._done)
+        )
+        missing = [chunk for chunk in self._get_chunks() if chunk[0] not in self._done]
+
+        if missing and missing[0][0] == 0:
+            # The probe response already carries the first chunk
+            try:
+                self._write_chunk(*missing[0], response=probe)
+            except APIException:
+                self._with_retries(self._write_chunk, *missing[0])
+            missing = missing[1:]
+        else:
+            probe.close()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [
+                executor.submit(self._with_retries, self._write_chunk, *chunk) for chunk in missing
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _download_stream(self, response: requests.Response):
+        self.bytes_done = 0
+        with open(self.part_path, "wb") as file:
+            for block in self._iter_blocks(response):
+                file.write(block)
+                self._add_progress(len(block))
+
+    def _download_whole(self, response: requests.Response):
+        content_length = response.headers.get("Content-Length")
+        self.size = int(content_length) if content_length else None
+        try:
+            self._download_stream(response)
+        except APIException:
+            # Without range support a download can only be repeated from the start
+            self._with_retries(lambda: self._download_stream(self._get()))
+
+    def _verify(self):
+        size = os.path.getsize(self.part_path)
+        if self.size is not None and size != self.size:
+            raise CrowdinException(
+                detail="Downloaded {0} bytes instead of {1}".format(size, self.size)
+            )
+
+        if self.checksum is None:
+            return
+
+        content_hash = hashlib.new(self.hash_name)
+        with open(self.part_path, "rb") as file:
+            for block in iter(lambda: file.read(self.block_size), b""):
+                content_hash.update(block)
+
+        if content_hash.hexdigest() != self.checksum.lower():
+            for path in (self.part_path, self.state_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            raise CrowdinException(detail="The checksum of the downloaded file does not match")
+
+    def _probe(self) -> requests.Response:
+        return self._get(headers={"Range": "bytes=0-{0}".format(self.chunk_size - 1)})
+
+    def run(self) -> str:
+        """Download the file, return its path."""
+        response = self._with_retries(self._probe)
+
+        content_range = _content_range_re.match(response.headers.get("Content-Range", ""))
+        if response.status_code != status.HTTP_206_PARTIAL_CONTENT:
+            self._download_whole(response)
+        elif content_range is None or content_range.group(3) == "*":
+            # Without the total size the file cannot be split in ranges
+            response.close()
+            self._download_whole(self._with_retries(self._get))
+        else:
+            self.size = int(content_range.group(3))
+            self.etag = response.headers.get("ETag")
+            self._download_ranges(response)
+
+        self._verify()
+        os.replace(self.part_path, self.path)
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
+
+        return self.path
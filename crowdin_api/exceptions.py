@@ -21,6 +21,7 @@ class CrowdinException(Exception):
 
 class APIException(CrowdinException):
     default_http_status = None
+    default_should_retry = None
     template = (
         "http_status={exc.http_status}, "
         "request_id={exc.request_id}, "
@@ -43,6 +44,9 @@ class APIException(CrowdinException):
         self.source_headers = source_headers or {}
         self.http_status = http_status or self.default_http_status
 
+        if should_retry is None:
+            should_retry = self.default_should_retry
+
         if should_retry is None:
             if (
                 http_status is None
@@ -90,9 +94,21 @@ class MethodNotAllowed(APIException):
 
 class Throttled(APIException):
     default_http_status = status.HTTP_429_TOO_MANY_REQUESTS
+    default_should_retry = True
     detail = "Request was throttled."
 
 
 class ValidationError(APIException):
     default_http_status = status.HTTP_400_BAD_REQUEST
     detail = "Invalid input."
+
+
+class JobFailed(CrowdinException):
+    """An asynchronous operation such as a build or an export failed or was canceled."""
+
+    def __init__(self, response):
+        self.response = response
+        data = response["data"]
+        super().__init__(
+            detail="Job {0} {1}".format(data.get("identifier", data.get("id")), data["status"])
+        )
@@ -1,6 +1,89 @@
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 
 
+def get_file_content(size: int) -> bytes:
+    return bytes(index % 251 for index in range(size))
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path.startswith("/files/"):
+            return self.send_file()
+
+        body = b'{"data": {"id": 1}}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_file(self):
+        """Send `/files/<size>` with range support, `/files/<size>/plain` without."""
+        parts = self.path.split("/")
+        content = get_file_content(int(parts[2]))
+        byte_range = self.headers.get("Range")
+
+        if byte_range and parts[-1] != "plain":
+            start, end = byte_range[len("bytes="):].split("-")
+            start, end = int(start), min(int(end), len(content) - 1)
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", "bytes {0}-{1}/{2}".format(start, end, len(content))
+            )
+            content = content[start:end + 1]
+        else:
+            self.send_response(200)
+
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("ETag", '"{0}"'.format(parts[2]))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding") != "chunked":
+            return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        body = b""
+        size = int(self.rfile.readline(), 16)
+        while size:
+            body += self.rfile.read(size)
+            self.rfile.readline()
+            size = int(self.rfile.readline(), 16)
+        self.rfile.readline()
+        return body
+
+    def do_POST(self):
+        content = self.read_body()
+        body = json.dumps(
+            {
+                "data": {
+                    "id": 1,
+                    "fileName": self.headers.get("Crowdin-API-FileName"),
+                    "contentType": self.headers.get("Content-Type"),
+                    "chunked": self.headers.get("Transfer-Encoding") == "chunked",
+                    "size": len(content),
+                    "sha256": hashlib.sha256(content).hexdigest(),
+                }
+            }
+        ).encode()
+        self.send_response(201)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
 @pytest.fixture()
 def base_absolut_url():
     return "https://api.crowdin.com/api/v2/"
@@ -9,3 +92,22 @@ def base_absolut_url():
 @pytest.fixture()
 def base_url():
     return "api.crowdin.com/api/v2/"
+
+
+@pytest.fixture()
+def server_url():
+    """
+    Base url of a local HTTP/1.1 server.
+
+    GET requests are answered with a small JSON body, or with `get_file_content` under
+    `/files/<size>`, POST requests with the size and hash of the request body.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield "http://127.0.0.1:{0}/api/v2/".format(server.server_port)
+
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,270 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from crowdin_api.exceptions import CrowdinException, JobFailed
+
+JobCheck = Callable[[], Union[Dict, Awaitable[Dict]]]
+JobCallback = Callable[[Future], None]
+
+FINISHED_STATUSES = ("finished",)
+FAILED_STATUSES = ("failed", "canceled", "cancelled")
+
+
+class _BaseJobPoller:
+    def __init__(
+        self,
+        initial_delay: Union[int, float] = 1,
+        max_delay: Union[int, float] = 30,
+        multiplier: Union[int, float] = 2,
+        timeout: Union[int, float, None] = None,
+    ):
+        if initial_delay <= 0 or max_delay < initial_delay or multiplier < 1:
+            raise ValueError(
+                "The delays must be positive, max_delay at least initial_delay and multiplier "
+                "at least 1."
+            )
+
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.timeout = timeout
+
+    @staticmethod
+    def is_done(response: Dict) -> bool:
+        """Whether the status response is final, raises JobFailed for failed jobs."""
+        status = response["data"]["status"]
+        if status in FAILED_STATUSES:
+            raise JobFailed(response)
+        return status in FINISHED_STATUSES
+
+    def _get_deadline(self, timeout: Union[int, float, None]) -> Optional[float]:
+        timeout = self.timeout if timeout is None else timeout
+        return None if timeout is None else time.monotonic() + timeout
+
+    def _get_next_check(self, delay: float, deadline: Optional[float]) -> Optional[float]:
+        """Return the time of the next check, None once the deadline is reached."""
+        now = time.monotonic()
+        if deadline is not None and now >= deadline:
+            return None
+        due = now + delay
+        return due if deadline is None else min(due, deadline)
+
+    def _get_first_check(self, deadline: Optional[float]) -> float:
+        return self._get_next_check(self.initial_delay, deadline) or time.monotonic()
+
+    def _get_timeout_error(self, response: Dict) -> CrowdinException:
+        return CrowdinException(
+            detail="Job {0} did not finish in time, last status: {1}".format(
+                response["data"].get("identifier", response["data"].get("id")),
+                response["data"]["status"],
+            )
+        )
+
+    def _after_check(
+        self, response: Dict, delay: float, deadline: Optional[float]
+    ) -> Tuple[Optional[float], float]:
+        """
+        Return the time of the next check and the delay before it, None once the job is done.
+
+        Raises JobFailed for failed jobs and CrowdinException once the deadline is reached.
+        """
+        if self.is_done(response):
+            return None, delay
+
+        delay = min(delay * self.multiplier, self.max_delay)
+        due = self._get_next_check(delay, deadline)
+        if due is None:
+            raise self._get_timeout_error(response)
+        return due, delay
+
+
+class _Job:
+    __slots__ = ("check", "future", "delay", "deadline")
+
+    def __init__(self, check: JobCheck, future: Future, delay: float, deadline: Optional[float]):
+        self.check = check
+        self.future = future
+        self.delay = delay
+        self.deadline = deadline
+
+
+class JobPoller(_BaseJobPoller):
+    """
+    Waits for asynchronous operations such as builds, exports, imports and reports.
+
+    `wait` takes a callable returning the status of one operation, e.g.
+
+        poller.wait(partial(client.reports.check_report_generation_status, reportId=report_id))
+
+    and returns a future resolved with the final status response. The status is checked after
+    `initial_delay` seconds, then `multiplier` times later each time up to `max_delay`. Jobs
+    which do not finish within `timeout` seconds fail with CrowdinException, failed and canceled
+    ones with JobFailed.
+
+    All jobs are scheduled by a single thread, status checks run on `max_workers` threads, so
+    waiting for many jobs at once does not take a thread per job.
+    """
+
+    def __init__(
+        self,
+        initial_delay: Union[int, float] = 1,
+        max_delay: Union[int, float] = 30,
+        multiplier: Union[int, float] = 2,
+        timeout: Union[int, float, None] = None,
+        max_workers: int = 4,
+    ):
+        super().__init__(
+            initial_delay=initial_delay, max_delay=max_delay, multiplier=multiplier, timeout=timeout
+        )
+        self.max_workers = max_workers
+        self._queue: List = []
+        self._futures = set()
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._executor = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        """Number of jobs waited for."""
+        return len(self._futures)
+
+    def wait(
+        self,
+        check: Callable[[], Dict],
+        callback: Optional[JobCallback] = None,
+        timeout: Union[int, float, None] = None,
+    ) -> Future:
+        """Wait for a job, `callback` is called with the future once it is done."""
+        with self._condition:
+            if self._closed:
+                raise CrowdinException(detail="The job poller is closed")
+
+            future = Future()
+            self._futures.add(future)
+            future.add_done_callback(self._futures.discard)
+            if callback is not None:
+                future.add_done_callback(callback)
+
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="crowdin-jobs"
+                )
+                self._thread = threading.Thread(
+                    target=self._run, name="crowdin-job-scheduler", daemon=True
+                )
+                self._thread.start()
+
+            job = _Job(check, future, self.initial_delay, self._get_deadline(timeout))
+            self._schedule(job, self._get_first_check(job.deadline))
+
+        return future
+
+    def _schedule(self, job: _Job, due: float):
+        heapq.heappush(self._queue, (due, next(self._counter), job))
+        self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._queue:
+                        timeout = self._queue[0][0] - time.monotonic()
+                        if timeout <= 0:
+                            break
+                    else:
+                        timeout = None
+                    self._condition.wait(timeout)
+
+                if self._closed:
+                    return
+                _, _, job = heapq.heappop(self._queue)
+
+            if not job.future.cancelled():
+                self._executor.submit(self._check, job)
+
+    def _check(self, job: _Job):
+        try:
+            response = job.check()
+            due, job.delay = self._after_check(response, job.delay, job.deadline)
+            if due is not None:
+                with self._condition:
+                    if not self._closed:
+                        self._schedule(job, due)
+                        return
+                raise CrowdinException(detail="The job poller is closed")
+        except BaseException as err:
+            if job.future.set_running_or_notify_cancel():
+                job.future.set_exception(err)
+            return
+
+        if job.future.set_running_or_notify_cancel():
+            job.future.set_result(response)
+
+    def close(self):
+        """Stop waiting, jobs not done yet are canceled."""
+        with self._condition:
+            self._closed = True
+            queue, self._queue = self._queue, []
+            self._condition.notify()
+
+        for _, _, job in queue:
+            job.future.cancel()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def __enter__(self) -> "JobPoller":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class AsyncJobPoller(_BaseJobPoller):
+    """
+    `JobPoller` for asyncio, `check` returns an awaitable status response.
+
+    Each job is a task sleeping between status checks on the event loop, `wait` returns the task.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tasks = set()
+
+    def __len__(self) -> int:
+        """Number of jobs waited for."""
+        return len(self._tasks)
+
+    def wait(
+        self,
+        check: Callable[[], Awaitable[Dict]],
+        callback: Optional[Callable[[asyncio.Future], None]] = None,
+        timeout: Union[int, float, None] = None,
+    ) -> asyncio.Task:
+        task = asyncio.ensure_future(self._wait(check, self._get_deadline(timeout)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        if callback is not None:
+            task.add_done_callback(callback)
+        return task
+
+    async def _wait(self, check: Callable[[], Awaitable[Dict]], deadline: Optional[float]):
+        delay = self.initial_delay
+        due = self._get_first_check(deadline)
+
+        while due is not None:
+            await asyncio.sleep(max(due - time.monotonic(), 0))
+            response = await check()
+            due, delay = self._after_check(response, delay, deadline)
+        return response
+
+    def close(self):
+        """Stop waiting, jobs not done yet are canceled."""
+        for task in list(self._tasks):
+            task.cancel()
@@ -64,32 +64,81 @@ class CrowdinJSONDecoder(json.JSONDecoder):
     def _parse_datetime(self, value):
         match = self.datetime_re.match(value)
         if match:
-            kw = match.groupdict()
-            kw["microsecond"] = kw["microsecond"] and kw["microsecond"].ljust(6, "0")
-            tzinfo = self._get_timezone(kw.pop("tzinfo"))
-            kw = {k: int(v) for k, v in kw.items() if v is not None}
-            kw["tzinfo"] = tzinfo
-            return datetime.datetime(**kw)
+            year, month, day, hour, minute, second, microsecond, tzinfo = match.groups()
+
+            try:
+                timezone = self._timezones[tzinfo]
+            except KeyError:
+                timezone = self._timezones[tzinfo] = self._get_timezone(tzinfo)
+
+            return datetime.datetime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour),
+                int(minute),
+                int(second) if second else 0,
+                int(microsecond.ljust(6, "0")) if microsecond else 0,
+                tzinfo=timezone,
+            )
 
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, object_hook=self.object_hook, **kwargs)
+        super().__init__(*args, object_pairs_hook=self.object_pairs_hook, **kwargs)
+        self._timezones = {}
 
-    def object_hook(self, parsed_object):
-        for key, value in parsed_object.items():
-            if not isinstance(value, (str, bytes)):
-                continue
+    def object_pairs_hook(self, pairs):
+        """
+        Build the object and convert datetime strings.
 
-            date_value = self._parse_datetime(value)
+        Every datetime starts with a four digit year followed by "-", so the regex only runs on
+        values passing that cheap check instead of on every string.
+        """
+        parsed_object = dict(pairs)
 
-            if isinstance(date_value, datetime.datetime):
-                parsed_object[key] = date_value
+        for key, value in pairs:
+            if value.__class__ is str and value[4:5] == "-" and value[:4].isdigit():
+                date_value = self._parse_datetime(value)
+
+                if date_value is not None:
+                    parsed_object[key] = date_value
 
         return parsed_object
 
 
+_decoder = CrowdinJSONDecoder()
+
+
+_encoder = CrowdinJSONEncoder()
+_plain_param_types = frozenset((str, int, float, bool))
+
+
+def _encode_param(value):
+    if value.__class__ in _plain_param_types:
+        return value
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_encode_param(item) for item in value if item is not None]
+
+    if isinstance(value, dict):
+        return {key: _encode_param(item) for key, item in value.items() if item is not None}
+
+    if isinstance(value, (datetime.datetime, Enum, Sorting)):
+        return _encode_param(_encoder.default(value))
+
+    return value
+
+
+def encode_params(params):
+    """Drop None values and convert datetimes, enums and sorting to their string values."""
+    return {key: _encode_param(value) for key, value in params.items() if value is not None}
+
+
 def dumps(obj):
     return json.dumps(obj, cls=CrowdinJSONEncoder)
 
 
 def loads(s):
-    return json.loads(s, cls=CrowdinJSONDecoder)
+    if isinstance(s, (bytes, bytearray)):
+        s = s.decode(json.detect_encoding(s), "surrogatepass")
+
+    return _decoder.decode(s)
@@ -0,0 +1,277 @@
+import abc
+import os
+import threading
+import time
+from typing import List, Optional, Union
+
+from crowdin_api import status
+from crowdin_api.exceptions import CrowdinException
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+class RateLimiter(metaclass=abc.ABCMeta):
+    """
+    Client-side request limiter.
+
+    `APIRequester` enters the limiter around every HTTP request, `acquire` blocks until the
+    request is allowed and `release` is called once the response is received.
+    """
+
+    @abc.abstractmethod
+    def acquire(self):
+        """Block until the request is allowed."""
+
+    @abc.abstractmethod
+    def release(self):
+        """Called once the response of an acquired request is received."""
+
+    def record(self, status_code: int, latency: float):
+        """Called with the response status and latency of every request, before `release`."""
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+class _TokenBucket:
+    def __init__(self, requests_per_second: Union[int, float], burst: Optional[int] = None):
+        if requests_per_second <= 0:
+            raise ValueError("The requests_per_second must be greater than 0.")
+
+        self.rate = requests_per_second
+        self.capacity = max(burst or 1, 1)
+
+    def take(self, tokens: float, updated_at: float, now: float):
+        """
+        Take a token, return the new bucket state and the time to wait before sending.
+
+        The token is reserved even if the bucket is empty, the balance goes negative and the
+        caller waits until it is paid off.
+        """
+        tokens = min(self.capacity, tokens + (now - updated_at) * self.rate) - 1
+        return tokens, now, max(-tokens, 0) / self.rate
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """
+    Token bucket shared by all threads of the process.
+
+    Allows `requests_per_second` on average with bursts of up to `burst` requests, and at most
+    `max_in_flight` concurrent requests.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Union[int, float],
+        burst: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ):
+        self._bucket = _TokenBucket(requests_per_second=requests_per_second, burst=burst)
+        self._tokens = float(self._bucket.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+
+    def acquire(self):
+        if self._in_flight is not None:
+            self._in_flight.acquire()
+
+        with self._lock:
+            self._tokens, self._updated_at, wait = self._bucket.take(
+                self._tokens, self._updated_at, time.monotonic()
+            )
+
+        if wait:
+            time.sleep(wait)
+
+    def release(self):
+        if self._in_flight is not None:
+            self._in_flight.release()
+
+
+class FileRateLimiter(RateLimiter):
+    """
+    Token bucket shared by all processes on the host.
+
+    The bucket state is kept in the file at `path` and guarded with `flock`. Concurrency is
+    limited with `max_in_flight` slot files next to it, a slot is held by locking its file so it
+    is freed automatically if a process dies. Only available on POSIX systems.
+    """
+
+    poll_interval = 0.01
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        requests_per_second: Union[int, float],
+        burst: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ):
+        if fcntl is None:  # pragma: no cover
+            raise CrowdinException(detail="FileRateLimiter requires fcntl support")
+
+        self.path = os.fspath(path)
+        self.max_in_flight = max_in_flight
+        self._bucket = _TokenBucket(requests_per_second=requests_per_second, burst=burst)
+        self._local = threading.local()
+
+    def _slot_path(self, slot: int) -> str:
+        return f"{self.path}.slot{slot}"
+
+    def _acquire_slot(self) -> int:
+        while True:
+            for slot in range(self.max_in_flight):
+                fd = os.open(self._slot_path(slot), os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    os.close(fd)
+                    continue
+                return fd
+
+            time.sleep(self.poll_interval)
+
+    def _take_token(self) -> float:
+        with open(self.path, "a+") as bucket_file:
+            fcntl.flock(bucket_file, fcntl.LOCK_EX)
+            try:
+                bucket_file.seek(0)
+                state = bucket_file.read().split()
+                now = time.time()
+                if len(state) == 2:
+                    tokens, updated_at = float(state[0]), float(state[1])
+                else:
+                    tokens, updated_at = float(self._bucket.capacity), now
+
+                tokens, updated_at, wait = self._bucket.take(tokens, updated_at, now)
+
+                bucket_file.seek(0)
+                bucket_file.truncate()
+                bucket_file.write(f"{tokens} {updated_at}")
+                bucket_file.flush()
+            finally:
+                fcntl.flock(bucket_file, fcntl.LOCK_UN)
+
+        return wait
+
+    @property
+    def _held_slots(self) -> List[int]:
+        if not hasattr(self._local, "slots"):
+            self._local.slots = []
+        return self._local.slots
+
+    def acquire(self):
+        if self.max_in_flight:
+            self._held_slots.append(self._acquire_slot())
+
+        try:
+            wait = self._take_token()
+            if wait:
+                time.sleep(wait)
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self):
+        if self.max_in_flight and self._held_slots:
+            fd = self._held_slots.pop()
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+
+class AdaptiveConcurrencyLimiter(RateLimiter):
+    """
+    AIMD controller of the number of concurrent requests.
+
+    The limit grows by `increase` per `limit` successful responses while the smoothed latency
+    stays under `max_latency`, and is multiplied by `decrease_factor` on throttled and 5xx
+    responses. Responses to requests sent before the last decrease are ignored so one burst of
+    errors cuts the limit only once.
+    """
+
+    decrease_statuses = (status.HTTP_429_TOO_MANY_REQUESTS,)
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: Union[int, float] = 1,
+        decrease_factor: float = 0.5,
+        max_latency: Optional[float] = None,
+        latency_smoothing: float = 0.2,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "The limits must satisfy 1 <= min_limit <= initial_limit <= max_limit."
+            )
+
+        if not 0 < decrease_factor < 1:
+            raise ValueError("The decrease_factor must be between 0 and 1.")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.max_latency = max_latency
+        self.latency_smoothing = latency_smoothing
+
+        self._limit = float(initial_limit)
+        self._latency = None
+        self._in_flight = 0
+        self._decreased_at = None
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Number of requests currently allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Exponentially smoothed response latency in seconds."""
+        return self._latency
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self):
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    def release(self):
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    def _should_decrease(self, status_code: int) -> bool:
+        return (
+            status_code in self.decrease_statuses
+            or status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+    def record(self, status_code: int, latency: float):
+        now = time.monotonic()
+
+        with self._condition:
+            if self._latency is None:
+                self._latency = latency
+            else:
+                self._latency += self.latency_smoothing * (latency - self._latency)
+
+            if self._should_decrease(status_code):
+                if self._decreased_at is None or now - latency >= self._decreased_at:
+                    self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                    self._decreased_at = now
+            elif self.max_latency is None or self._latency <= self.max_latency:
+                self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+                self._condition.notify_all()
@@ -0,0 +1,103 @@
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional, Type
+
+from crowdin_api.client import CrowdinClient
+from crowdin_api.connection import ConnectionPool
+
+
+class ClientRegistry:
+    """
+    Clients of many tenants sharing one connection pool.
+
+    `get` returns the client of a token and organization, creating it on first use. All clients
+    send requests through `connection_pool`, which keeps up to `pool_maxsize` connections for
+    each of the `pool_connections` most recently used API hosts, so clients only hold their
+    headers and the number of open sockets does not grow with the number of tenants. Above
+    `max_clients` the least recently used clients are dropped, a thread still using one can
+    finish its requests.
+
+        registry = ClientRegistry(max_clients=500, timeout=30)
+        registry.get(token="__token__", organization="acme").projects.list_projects()
+
+    Other keyword arguments are passed to every client, except the per-account options in
+    `per_account_options`, whose objects would be shared by all tenants. Response caches key
+    their entries by token and transports get the token with each request, so both can be
+    shared.
+    """
+
+    per_account_options = ("storage_cache",)
+
+    def __init__(
+        self,
+        max_clients: int = 100,
+        connection_pool: Optional[ConnectionPool] = None,
+        client_class: Type[CrowdinClient] = CrowdinClient,
+        **client_options
+    ):
+        if max_clients < 1:
+            raise ValueError("The max_clients must be greater than or equal to 1.")
+
+        shared = sorted(set(self.per_account_options).intersection(client_options))
+        if shared:
+            raise ValueError(
+                "The {0} option belongs to one account and cannot be shared by the clients of "
+                "a registry.".format(", ".join(shared))
+            )
+
+        self.max_clients = max_clients
+        self.connection_pool = connection_pool or ConnectionPool()
+        self.client_class = client_class
+        self.client_options = client_options
+        self._clients = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(token: str, organization: Optional[str]) -> Hashable:
+        return token, organization
+
+    def get(self, token: str, organization: Optional[str] = None) -> CrowdinClient:
+        key = self._get_key(token, organization)
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+
+            client = self._clients[key] = self.client_class(
+                token=token,
+                organization=organization,
+                connection_pool=self.connection_pool,
+                **self.client_options
+            )
+            while len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+
+        return client
+
+    def remove(self, token: str, organization: Optional[str] = None):
+        with self._lock:
+            client = self._clients.pop(self._get_key(token, organization), None)
+
+        if client is not None:
+            client.close()
+
+    def close(self):
+        """Close all clients and the shared connection pool."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+
+        for client in clients:
+            client.close()
+        self.connection_pool.close()
+
+    def __len__(self):
+        return len(self._clients)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,14 +1,23 @@
+import asyncio
+import copy
+import hashlib
 import json
+import threading
 import logging
 import mimetypes
 import os
 import time
-from copy import copy
-from typing import Dict, IO, List, Optional, Union
-from urllib.parse import urljoin, quote
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from typing import Callable, Dict, Hashable, IO, Iterator, List, Optional, Union
+from urllib.parse import urlencode, urljoin, quote
 
 import requests
 from crowdin_api import status
+from crowdin_api.cache import ResponseCache, TTLCache
+from crowdin_api.connection import ConnectionPool
+from crowdin_api.download import RangedDownload
 from crowdin_api.exceptions import (
     APIException,
     AuthenticationFailed,
@@ -20,7 +29,12 @@ from crowdin_api.exceptions import (
     Throttled,
     ValidationError,
 )
-from crowdin_api.parser import dumps, loads
+from crowdin_api.parser import dumps, encode_params, loads
+from crowdin_api.rate_limit import RateLimiter
+from crowdin_api.retry import RetryPolicy
+from crowdin_api.steps import Steps, async_run_steps, run_steps
+from crowdin_api.transport import RequestsTransport, Transport
+from crowdin_api.typing import ProgressCallback
 
 logger = logging.getLogger("crowdin")
 
@@ -40,6 +54,9 @@ class APIRequester:
     default_exception = APIException
     default_file_content_type = "application/octet-stream"
     default_headers = {"Content-Type": "application/json"}
+    mutating_methods = ("post", "put", "patch", "delete")
+
+    is_async = False
 
     def __init__(
         self,
@@ -49,24 +66,138 @@ class APIRequester:
         max_retries: int = 5,
         default_headers: Optional[Dict] = None,
         extended_params: Optional[Dict] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        ttl_cache: Optional[TTLCache] = None,
+        coalesce_requests: bool = False,
+        connection_pool: Optional[ConnectionPool] = None,
+        transport: Optional[Transport] = None,
     ):
         self.base_url = base_url
         self._session = requests.Session()
+        self._owns_connection_pool = connection_pool is None
+        self._connection_pool = connection_pool or self._create_connection_pool()
+        self.session.mount("https://", self._connection_pool)
+        self.session.mount("http://", self._connection_pool)
+        self._transport = transport or RequestsTransport(self.session)
         self._retry_delay = retry_delay
         self._max_retries = max_retries
+        self._retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries, base_delay=retry_delay
+        )
+        self._rate_limiter = rate_limiter
+        self._response_cache = response_cache
+        self._ttl_cache = ttl_cache
+        self._coalesce_requests = coalesce_requests
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
+        self._download_session = None
+        self._coalescing_hits = 0
+        self._coalescing_misses = 0
         self._extended_params = {} if extended_params is None else extended_params
         if not isinstance(self._extended_params, dict):
             raise TypeError(f"extended_params must be dict, not {type(self._extended_params)}")
 
-        headers = copy(self.default_headers)
+        headers = copy.copy(self.default_headers)
         headers.update(default_headers or {})
-        self.session.headers.update(headers)
+        if transport is None:
+            self.session.headers.update(headers)
+            self._transport_headers = {}
+        else:
+            # A transport passed in may be shared with requesters of other accounts
+            self._transport_headers = headers
+        # Responses cached for one account must not be served to another one sharing the cache
+        self._credentials_fingerprint = hashlib.sha256(
+            headers.get("Authorization", "").encode("utf-8")
+        ).hexdigest()
         self._timeout = timeout
 
+        if self._connection_pool.warm_up and transport is None:
+            self.warm_up()
+
     @property
     def session(self) -> requests.Session:
         return self._session
 
+    @property
+    def transport(self) -> Transport:
+        return self._transport
+
+    def _create_connection_pool(self) -> ConnectionPool:
+        return ConnectionPool()
+
+    @property
+    def connection_pool(self) -> ConnectionPool:
+        return self._connection_pool
+
+    @property
+    def connection_stats(self) -> Dict[str, Union[int, float]]:
+        """Number of requests sent, connections opened and requests sent over an open one."""
+        return self._connection_pool.stats
+
+    def warm_up(self, connections: Optional[int] = None) -> int:
+        """Open connections to the API in advance, return the number of connections opened."""
+        settings = self.session.merge_environment_settings(self.base_url, {}, None, None, None)
+        return self._connection_pool.warm_up_connections(
+            self.base_url,
+            connections,
+            verify=settings["verify"],
+            proxies=settings["proxies"],
+            cert=settings["cert"],
+        )
+
+    @property
+    def download_session(self) -> requests.Session:
+        """Session without the API headers, download links are signed and need no token."""
+        if self._download_session is None:
+            self._download_session = requests.Session()
+            self._download_session.mount("https://", self._connection_pool)
+            self._download_session.mount("http://", self._connection_pool)
+        return self._download_session
+
+    def download(
+        self,
+        url: str,
+        path: Union[str, os.PathLike],
+        chunk_size: int = 8 * 1024 * 1024,
+        concurrency: int = 4,
+        checksum: Optional[str] = None,
+        hash_name: str = "sha256",
+        progress: Optional[ProgressCallback] = None,
+    ) -> str:
+        """
+        Download a file, e.g. the url of a build or an export, to `path`, return the path.
+
+        See `RangedDownload` for the parallel, resumable download in `chunk_size` parts.
+        """
+        return RangedDownload(
+            self.download_session,
+            url,
+            path,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            checksum=checksum,
+            hash_name=hash_name,
+            progress=progress,
+            retry_policy=self._retry_policy,
+            timeout=self._timeout,
+            exception_map=self.exception_map,
+            **self._extended_params
+        ).run()
+
+    def iter_download(self, url: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Stream the content of a download link in chunks, e.g. to extract it on the way."""
+        response = self.download_session.get(
+            url, stream=True, timeout=self._timeout, **self._extended_params
+        )
+        with response:
+            if response.status_code != status.HTTP_200_OK:
+                raise self.exception_map.get(response.status_code, self.default_exception)(
+                    http_status=response.status_code, headers=response.headers
+                )
+            yield from response.iter_content(chunk_size)
+
     def _clear_data(self, data: Optional[Union[Dict, List]] = None) -> Optional[Union[Dict, List]]:
         if data is None:
             return data
@@ -94,40 +225,112 @@ class APIRequester:
 
         return result
 
-    def _request(
-        self,
-        method: str,
-        path: str,
-        params: Optional[Dict] = None,
-        headers: Optional[Dict] = None,
-        request_data: Optional[Dict] = None,
-        file: IO = None,
-        **kwargs
-    ):
+    @staticmethod
+    def _get_query_string(params: Dict) -> str:
+        return urlencode(sorted(params.items()), doseq=True)
+
+    def _get_ttl_cache_key(
+        self, method: str, path: str, params: Optional[Dict]
+    ) -> Optional[Hashable]:
+        """Return the key of a cacheable request, None if the response should not be cached."""
+        if self._ttl_cache is None or method.lower() != "get" or not self._ttl_cache.get_ttl(path):
+            return None
+
+        return (
+            self.base_url,
+            self._credentials_fingerprint,
+            self._get_query_string(encode_params(params or {})),
+        )
+
+    def _get_coalescing_key(
+        self, method: str, path: str, params: Optional[Dict], headers: Optional[Dict], kwargs: Dict
+    ) -> Optional[Hashable]:
+        """Return the key identical GET requests share, None if the request is not coalesced."""
+        if not self._coalesce_requests or method.lower() != "get" or kwargs:
+            return None
+
+        return (
+            path,
+            self._get_query_string(encode_params(params or {})),
+            tuple(sorted((headers or {}).items())),
+        )
+
+    def _join_in_flight(self, key: Hashable, create_future: Callable):
+        """Return the future of the in flight request and whether the caller has to send it."""
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._coalescing_hits += 1
+                return future, False
+
+            self._coalescing_misses += 1
+            future = self._in_flight[key] = create_future()
+            return future, True
+
+    def _leave_in_flight(self, key: Hashable):
+        with self._in_flight_lock:
+            self._in_flight.pop(key, None)
+
+    @property
+    def coalescing_stats(self) -> Dict[str, int]:
+        """Number of requests served by an identical request in flight (hits) or sent (misses)."""
+        return {"hits": self._coalescing_hits, "misses": self._coalescing_misses}
 
+    def _prepare_body(
+        self, headers: Optional[Dict], request_data: Optional[Dict], file: Optional[IO]
+    ):
+        """Return the headers and the body of the request."""
         if file and request_data:
             raise CrowdinException("API not support multipart data.")
 
         if file:
             headers = headers or {}
-            request_data = file
-            file_mime_type = mimetypes.MimeTypes().guess_type(file.name)[0]
+            # The module level database is loaded once, unlike a new MimeTypes instance
+            file_mime_type = mimetypes.guess_type(file.name)[0]
             headers["Content-Type"] = file_mime_type or self.default_file_content_type
             headers["Crowdin-API-FileName"] = quote(os.path.basename(file.name))
-        elif request_data is not None:
-            request_data = dumps(self._clear_data(request_data))
+            return headers, file
 
-        kwargs = {**self._extended_params, **kwargs}
-        result = self.session.request(
-            method,
-            urljoin(self.base_url, path),
-            params=loads(dumps(self._clear_data(params or {}))),
-            headers=headers,
-            data=request_data,
-            timeout=self._timeout,
-            **kwargs
-        )
+        if request_data is not None:
+            return headers, dumps(self._clear_data(request_data))
+
+        return headers, None
+
+    def _get_cached_etag(self, method: str, url: str, params: Dict, headers: Optional[Dict]):
+        """Return the response cache key and the stored ETag and content of a GET request."""
+        if (
+            self._response_cache is None
+            or method.lower() != "get"
+            or "If-None-Match" in (headers or {})
+        ):
+            return None, None
+
+        cache_key = (url, self._credentials_fingerprint, self._get_query_string(params))
+        return cache_key, self._response_cache.get(cache_key)
 
+    def _store_response(self, cache_key: Hashable, result, content):
+        if result.status_code != status.HTTP_200_OK:
+            return
+
+        if result.headers.get("ETag"):
+            self._response_cache.set(cache_key, result.headers["ETag"], content)
+        else:
+            self._response_cache.delete(cache_key)
+
+    def _send_request(self, method: str, url: str, headers: Optional[Dict], **kwargs):
+        if self._transport_headers:
+            headers = {**self._transport_headers, **(headers or {})}
+
+        with self._rate_limiter or nullcontext():
+            started = time.monotonic()
+            result = self._transport.request(
+                method, url, headers=headers, timeout=self._timeout, **kwargs
+            )
+            if self._rate_limiter is not None:
+                self._rate_limiter.record(result.status_code, time.monotonic() - started)
+        return result
+
+    def _parse_response(self, result, headers: Optional[Dict]):
         status_code = result.status_code
         content = result.content
 
@@ -142,7 +345,82 @@ class APIRequester:
         except json.decoder.JSONDecodeError:
             raise ParsingError(context=content, http_status=status_code, headers=result.headers)
 
-    def request(
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        request_data: Optional[Dict] = None,
+        file: IO = None,
+        **kwargs
+    ):
+        headers, request_data = self._prepare_body(headers, request_data, file)
+
+        url = urljoin(self.base_url, path)
+        params = encode_params(params or {})
+        cache_key, cached = self._get_cached_etag(method, url, params, headers)
+        if cached is not None:
+            headers = {**(headers or {}), "If-None-Match": cached[0]}
+
+        result = self._send_request(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            data=request_data,
+            **{**self._extended_params, **kwargs}
+        )
+
+        if self._ttl_cache is not None and method.lower() in self.mutating_methods:
+            self._ttl_cache.invalidate(path)
+
+        if cached is not None and result.status_code == status.HTTP_304_NOT_MODIFIED:
+            return cached[1]
+
+        content = self._parse_response(result, headers)
+        if cache_key is not None:
+            self._store_response(cache_key, result, content)
+        return content
+
+    @property
+    def ttl_cache(self) -> Optional[TTLCache]:
+        return self._ttl_cache
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        return self._response_cache
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self._retry_policy
+
+    def _handle_retry(
+        self, err: APIException, num_retries: int, started: float, method: str, path: str
+    ) -> float:
+        """Re-raise the error if the request should not be retried, return the delay otherwise."""
+        retry_delay = self._retry_policy.get_delay(
+            err, num_retries=num_retries, elapsed=time.monotonic() - started
+        )
+        if retry_delay is None:
+            raise err
+
+        logger.info(
+            "Initiating retry {num_retries} for request {method} {path} "
+            "after sleeping {retry_delay} seconds.".format(
+                retry_delay=round(retry_delay, 3),
+                num_retries=num_retries,
+                method=method,
+                path=path,
+            )
+        )
+        return retry_delay
+
+    def _send(
         self,
         method,
         path,
@@ -153,6 +431,7 @@ class APIRequester:
         **kwargs
     ):
         num_retries = 0
+        started = time.monotonic()
 
         while True:
             try:
@@ -167,23 +446,196 @@ class APIRequester:
                 )
             except APIException as err:
                 num_retries += 1
+                time.sleep(self._handle_retry(err, num_retries, started, method, path))
 
-                if not err.should_retry or num_retries >= self._max_retries:
-                    raise err
+    def _coalesce(self, key: Hashable, send: Callable):
+        future, is_leader = self._join_in_flight(key, Future)
+        if not is_leader:
+            return copy.deepcopy(future.result())
 
-                logger.info(
-                    "Initiating retry {num_retries} for request {method} {path} "
-                    "after sleeping {retry_delay} seconds.".format(
-                        retry_delay=self._retry_delay,
-                        num_retries=num_retries,
-                        method=method,
-                        path=path,
-                    )
-                )
-                time.sleep(self._retry_delay)
+        try:
+            content = send()
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        else:
+            future.set_result(content)
+            return content
+        finally:
+            self._leave_in_flight(key)
+
+    def request(
+        self,
+        method,
+        path,
+        params=None,
+        headers=None,
+        request_data=None,
+        file: IO = None,
+        **kwargs
+    ):
+        ttl_cache_key = self._get_ttl_cache_key(method, path, params)
+        if ttl_cache_key is not None:
+            content = self._ttl_cache.get(path, ttl_cache_key)
+            if content is not None:
+                return content
+
+        send = partial(
+            self._send,
+            method=method,
+            path=path,
+            params=params,
+            headers=headers,
+            request_data=request_data,
+            file=file,
+            **kwargs
+        )
+        coalescing_key = self._get_coalescing_key(method, path, params, headers, kwargs)
+        content = send() if coalescing_key is None else self._coalesce(coalescing_key, send)
+
+        if ttl_cache_key is not None and content is not None:
+            self._ttl_cache.set(path, ttl_cache_key, content)
+        return content
+
+    def run_steps(self, steps: Steps):
+        """Run a flow of resource calls, see `crowdin_api.steps`."""
+        return run_steps(steps)
 
     def close(self):
+        download_session = getattr(self, "_download_session", None)
+        if download_session is not None:
+            download_session.adapters.clear()
+            download_session.close()
+
+        if not getattr(self, "_owns_connection_pool", True):
+            # A pool passed in may be shared with other requesters, it is closed by its owner
+            self.session.adapters.clear()
         self.session.close()
 
     def __del__(self):
         self.close()
+
+
+class AsyncAPIRequester(APIRequester):
+    """Asyncio HTTP wrapper.
+
+    `request` is a coroutine, so every resource method called through this requester returns
+    an awaitable. Blocking I/O runs on a bounded thread pool, which lets a single event loop keep
+    up to `max_concurrency` requests in flight.
+    """
+
+    is_async = True
+
+    def __init__(self, *args, max_concurrency: int = 100, **kwargs):
+        self._max_concurrency = max_concurrency
+        super().__init__(*args, **kwargs)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="crowdin-api"
+        )
+
+    def _create_connection_pool(self) -> ConnectionPool:
+        return ConnectionPool(pool_maxsize=self._max_concurrency)
+
+    async def _send(
+        self,
+        method,
+        path,
+        params=None,
+        headers=None,
+        request_data=None,
+        file: IO = None,
+        **kwargs
+    ):
+        loop = asyncio.get_running_loop()
+        num_retries = 0
+        started = time.monotonic()
+
+        while True:
+            try:
+                return await loop.run_in_executor(
+                    self._executor,
+                    partial(
+                        self._request,
+                        method=method,
+                        path=path,
+                        params=params,
+                        headers=headers,
+                        request_data=request_data,
+                        file=file,
+                        **kwargs
+                    ),
+                )
+            except APIException as err:
+                num_retries += 1
+                await asyncio.sleep(self._handle_retry(err, num_retries, started, method, path))
+
+    async def download(self, url: str, path: Union[str, os.PathLike], **kwargs) -> str:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(super().download, url, path, **kwargs)
+        )
+
+    async def _coalesce(self, key: Hashable, send: Callable):
+        future, is_leader = self._join_in_flight(key, asyncio.get_running_loop().create_future)
+        if not is_leader:
+            return copy.deepcopy(await asyncio.shield(future))
+
+        try:
+            content = await send()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as err:
+            future.set_exception(err)
+            # Followers re-raise it, do not report it as never retrieved
+            future.exception()
+            raise
+        else:
+            future.set_result(content)
+            return content
+        finally:
+            self._leave_in_flight(key)
+
+    async def request(
+        self,
+        method,
+        path,
+        params=None,
+        headers=None,
+        request_data=None,
+        file: IO = None,
+        **kwargs
+    ):
+        ttl_cache_key = self._get_ttl_cache_key(method, path, params)
+        if ttl_cache_key is not None:
+            content = self._ttl_cache.get(path, ttl_cache_key)
+            if content is not None:
+                return content
+
+        send = partial(
+            self._send,
+            method=method,
+            path=path,
+            params=params,
+            headers=headers,
+            request_data=request_data,
+            file=file,
+            **kwargs
+        )
+        coalescing_key = self._get_coalescing_key(method, path, params, headers, kwargs)
+        if coalescing_key is None:
+            content = await send()
+        else:
+            content = await self._coalesce(coalescing_key, send)
+
+        if ttl_cache_key is not None and content is not None:
+            self._ttl_cache.set(path, ttl_cache_key, content)
+        return content
+
+    async def run_steps(self, steps: Steps):
+        return await async_run_steps(steps)
+
+    def close(self):
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+        super().close()
@@ -0,0 +1,100 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional, Union
+
+from crowdin_api import status
+from crowdin_api.exceptions import APIException
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter.
+
+    The delay before retry `n` is a random value between 0 and `base_delay * 2 ** (n - 1)`,
+    capped by `max_delay`. For throttled and unavailable responses the delay requested by the
+    server (`Retry-After` or `X-RateLimit-Reset` headers) is used instead, the request is not
+    retried when the server asks to wait longer than `max_delay`. Retries stop after
+    `max_retries` attempts or once `max_retry_time` seconds would be exceeded.
+
+    Subclass and override `get_delay` to plug in another strategy.
+    """
+
+    retry_after_statuses = (
+        status.HTTP_429_TOO_MANY_REQUESTS,
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        base_delay: Union[int, float] = 0.1,
+        max_delay: Union[int, float] = 30,
+        max_retry_time: Union[int, float, None] = None,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_time = max_retry_time
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+
+    def get_backoff(self, num_retries: int) -> float:
+        delay = min(self.max_delay, self.base_delay * 2 ** (num_retries - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def get_server_delay(self, error: APIException) -> Optional[float]:
+        if not self.respect_retry_after or error.http_status not in self.retry_after_statuses:
+            return None
+
+        retry_after = _get_header(error.headers, "Retry-After")
+        if retry_after is not None:
+            try:
+                return max(float(retry_after), 0)
+            except ValueError:
+                pass
+
+            try:
+                return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0)
+            except (TypeError, ValueError):
+                pass
+
+        reset = _get_header(error.headers, "X-RateLimit-Reset")
+        if reset is not None:
+            try:
+                reset = float(reset)
+            except ValueError:
+                return None
+
+            # Either a unix timestamp or a number of seconds
+            return max(reset - time.time(), 0) if reset > 10 ** 9 else max(reset, 0)
+
+        return None
+
+    def get_delay(
+        self, error: APIException, num_retries: int, elapsed: float = 0
+    ) -> Optional[float]:
+        """Return the number of seconds to wait before retrying, None to give up."""
+        if not error.should_retry or num_retries >= self.max_retries:
+            return None
+
+        delay = self.get_server_delay(error)
+        if delay is None:
+            delay = self.get_backoff(num_retries)
+        elif delay > self.max_delay:
+            # Retrying earlier than requested by the server would be throttled again
+            return None
+
+        if self.max_retry_time is not None and elapsed + delay > self.max_retry_time:
+            return None
+
+        return delay
+
+
+def _get_header(headers: Mapping, name: str) -> Optional[str]:
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    return value
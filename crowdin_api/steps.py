@@ -0,0 +1,75 @@
+"""
+Flows shared by the sync and async requesters.
+
+A flow is a generator which yields calls without arguments, e.g. `partial(resource.get_storage,
+storageId=1)`, and is sent the result of each call or thrown its exception. `run_steps` makes the
+calls, `async_run_steps` makes them and awaits their results, so one generator serves both
+requesters and only the runners differ where they await.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Generator, Union
+
+Step = Union[Callable[[], Any], "Sleep", "Blocking"]
+Steps = Generator[Step, Any, Any]
+
+
+class Sleep:
+    """Wait `delay` seconds, with `asyncio.sleep` in async flows."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def __call__(self):
+        time.sleep(self.delay)
+
+    def __await__(self):
+        return asyncio.sleep(self.delay).__await__()
+
+
+class Blocking:
+    """A blocking call, run in the default executor of the event loop in async flows."""
+
+    def __init__(self, func: Callable[[], Any]):
+        self.func = func
+
+    def __call__(self):
+        return self.func()
+
+    def __await__(self):
+        return asyncio.get_running_loop().run_in_executor(None, self.func).__await__()
+
+
+def _awaitable(step: Step):
+    return step if isinstance(step, (Sleep, Blocking)) else step()
+
+
+def run_steps(steps: Steps):
+    """Run a flow, return its result."""
+    send, value = steps.send, None
+    while True:
+        try:
+            step = send(value)
+        except StopIteration as stop:
+            return stop.value
+
+        try:
+            send, value = steps.send, step()
+        except BaseException as err:
+            send, value = steps.throw, err
+
+
+async def async_run_steps(steps: Steps):
+    """Run a flow, awaiting the result of each call, return its result."""
+    send, value = steps.send, None
+    while True:
+        try:
+            step = send(value)
+        except StopIteration as stop:
+            return stop.value
+
+        try:
+            send, value = steps.send, await _awaitable(step)
+        except BaseException as err:
+            send, value = steps.throw, err
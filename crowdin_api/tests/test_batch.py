@@ -0,0 +1,219 @@
+import asyncio
+import threading
+import time
+from functools import partial
+from unittest import mock
+
+import pytest
+from crowdin_api.api_resources.enums import PatchOperation
+from crowdin_api.api_resources.string_translations.resource import StringTranslationsResource
+from crowdin_api.batch import AsyncBatchExecutor, BatchExecutor, BatchResult
+from crowdin_api.exceptions import APIException, CrowdinException, ValidationError
+from crowdin_api.parser import dumps
+from crowdin_api.requester import APIRequester
+
+
+class Abort(BaseException):
+    pass
+
+
+def make_operations(amount, start=0):
+    return (
+        {"op": PatchOperation.ADD, "path": "/-", "value": {"stringId": index, "text": "x"}}
+        for index in range(start, start + amount)
+    )
+
+
+def get_ids(data):
+    return [operation["value"]["stringId"] for operation in data]
+
+
+class RecordingSend:
+    """Batch endpoint rejecting chunks with the given string ids."""
+
+    def __init__(self, rejected=(), error=ValidationError):
+        self.rejected = set(rejected)
+        self.error = error
+        self.chunks = []
+        self.lock = threading.Lock()
+
+    def __call__(self, data):
+        with self.lock:
+            self.chunks.append(get_ids(data))
+        if self.rejected.intersection(get_ids(data)):
+            raise self.error()
+        return {"data": [{"data": {"id": string_id}} for string_id in get_ids(data)]}
+
+
+class TestChunks:
+    def test_count(self):
+        result = BatchResult()
+        chunks = list(BatchExecutor(max_operations=4).iter_chunks(make_operations(10), result))
+
+        assert [(start, get_ids(chunk)) for start, chunk in chunks] == [
+            (0, [0, 1, 2, 3]),
+            (4, [4, 5, 6, 7]),
+            (8, [8, 9]),
+        ]
+        assert result.total == 10
+
+    def test_size(self):
+        operations = list(make_operations(10))
+        size = len(dumps(operations[:3]))
+
+        chunks = list(BatchExecutor(max_size=size).iter_chunks(operations, BatchResult()))
+
+        assert [len(chunk) for _, chunk in chunks] == [3, 3, 3, 1]
+        assert all(len(dumps(chunk)) <= size for _, chunk in chunks)
+
+    def test_operation_over_size_sent_alone(self):
+        chunks = list(BatchExecutor(max_size=10).iter_chunks(make_operations(2), BatchResult()))
+
+        assert [len(chunk) for _, chunk in chunks] == [1, 1]
+
+    def test_lazy(self):
+        consumed = []
+
+        def operations():
+            for operation in make_operations(1000):
+                consumed.append(operation)
+                yield operation
+
+        chunks = BatchExecutor(max_operations=10).iter_chunks(operations(), BatchResult())
+        next(chunks)
+
+        assert len(consumed) == 11
+
+    @pytest.mark.parametrize(
+        "in_params", ({"max_operations": 0}, {"max_size": 0}, {"concurrency": 0})
+    )
+    def test_invalid(self, in_params):
+        with pytest.raises(ValueError):
+            BatchExecutor(**in_params)
+
+
+class TestBatchExecutor:
+    def test_run(self):
+        send = RecordingSend()
+
+        result = BatchExecutor(max_operations=100, concurrency=4).run(
+            send, make_operations(1050)
+        )
+
+        assert result.ok
+        assert result.total == result.succeeded == 1050
+        assert len(send.chunks) == 11
+        assert [item["data"]["id"] for item in result.data] == list(range(1050))
+        result.raise_for_errors()
+
+    def test_concurrency(self):
+        in_flight = []
+        max_in_flight = []
+        lock = threading.Lock()
+
+        def send(data):
+            with lock:
+                in_flight.append(1)
+                max_in_flight.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.pop()
+            return {"data": []}
+
+        BatchExecutor(max_operations=1, concurrency=3).run(send, make_operations(20))
+
+        assert max(max_in_flight) == 3
+
+    def test_rejected_operations_isolated(self):
+        send = RecordingSend(rejected={5, 13})
+
+        result = BatchExecutor(max_operations=8).run(send, make_operations(16))
+
+        assert sorted(result.errors) == [5, 13]
+        assert sorted(get_ids(result.failed_operations.values())) == [5, 13]
+        assert all(isinstance(error, ValidationError) for error in result.errors.values())
+        assert result.succeeded == 14
+        assert [item["data"]["id"] for item in result.data] == [
+            index for index in range(16) if index not in (5, 13)
+        ]
+        with pytest.raises(CrowdinException, match="2 of 16 operations failed, the first one"):
+            result.raise_for_errors()
+
+    @pytest.mark.parametrize(
+        "error", (partial(APIException, http_status=503), partial(CrowdinException, "Timeout"))
+    )
+    def test_failed_chunk_not_split(self, error):
+        send = RecordingSend(rejected={1}, error=error)
+
+        result = BatchExecutor(max_operations=4).run(send, make_operations(8))
+
+        assert sorted(result.errors) == [0, 1, 2, 3]
+        assert sorted(send.chunks) == [[0, 1, 2, 3], [4, 5, 6, 7]]
+
+    def test_split_disabled(self):
+        send = RecordingSend(rejected={1})
+
+        result = BatchExecutor(max_operations=4, split_rejected=False).run(
+            send, make_operations(4)
+        )
+
+        assert sorted(result.errors) == [0, 1, 2, 3]
+        assert len(send.chunks) == 1
+
+    def test_abort_raised(self):
+        def send(data):
+            raise Abort
+
+        with pytest.raises(Abort):
+            BatchExecutor(max_operations=1, concurrency=1).run(send, make_operations(5))
+
+    @mock.patch("crowdin_api.requester.APIRequester.request")
+    def test_resource(self, m_request, base_absolut_url):
+        m_request.return_value = {"data": []}
+        resource = StringTranslationsResource(requester=APIRequester(base_url=base_absolut_url))
+
+        result = BatchExecutor(max_operations=2).run(
+            partial(resource.translation_batch_operations, project_id=1), make_operations(3)
+        )
+
+        assert result.ok
+        assert m_request.call_count == 2
+        assert m_request.call_args_list[0].kwargs["path"] == "projects/1/translations"
+
+
+class TestAsyncBatchExecutor:
+    def test_run(self):
+        send = RecordingSend(rejected={7})
+
+        async def async_send(data):
+            await asyncio.sleep(0)
+            return send(data)
+
+        result = asyncio.run(
+            AsyncBatchExecutor(max_operations=5, concurrency=2).run(
+                async_send, make_operations(23)
+            )
+        )
+
+        assert result.total == 23
+        assert list(result.errors) == [7]
+        assert len(result.data) == 22
+
+    def test_error_cancels_pending(self):
+        started = []
+
+        async def send(data):
+            started.append(data)
+            if len(started) == 3:
+                raise Abort
+            await asyncio.sleep(10)
+
+        async def run():
+            with pytest.raises(Abort):
+                await AsyncBatchExecutor(max_operations=1, concurrency=3).run(
+                    send, make_operations(10)
+                )
+
+        asyncio.run(run())
+
+        assert len(started) == 3
@@ -0,0 +1,159 @@
+from unittest import mock
+
+import pytest
+from crowdin_api.cache import ResponseCache, StorageCache, TTLCache
+
+
+class TestResponseCache:
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
+
+    def test_get_set(self):
+        cache = ResponseCache()
+        assert cache.get("key") is None
+
+        cache.set("key", '"etag"', b"{}")
+        assert cache.get("key") == ('"etag"', b"{}")
+        assert len(cache) == 1
+
+        cache.delete("key")
+        cache.delete("key")
+        assert cache.get("key") is None
+
+    def test_get_copy(self):
+        cache = ResponseCache()
+        content = {"data": {"id": 1}}
+        cache.set("key", '"etag"', content)
+        content["data"]["id"] = 2
+
+        cache.get("key")[1]["data"]["id"] = 3
+
+        assert cache.get("key") == ('"etag"', {"data": {"id": 1}})
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", "1", b"a")
+        cache.set("b", "1", b"b")
+        cache.get("a")
+        cache.set("c", "1", b"c")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == ("1", b"a")
+        assert cache.get("c") == ("1", b"c")
+
+    def test_clear(self):
+        cache = ResponseCache()
+        cache.set("a", "1", b"a")
+        cache.clear()
+
+        assert len(cache) == 0
+
+
+class TestTTLCache:
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError):
+            TTLCache(max_entries=0)
+
+    @pytest.mark.parametrize(
+        "path, ttl",
+        (
+            ("languages", 3600),
+            ("/languages/uk/", 3600),
+            ("projects/1", 60),
+            ("projects", None),
+            ("projects/1/strings", None),
+            ("user", 600),
+        ),
+    )
+    def test_get_ttl(self, path, ttl):
+        assert TTLCache().get_ttl(path) == ttl
+
+    @mock.patch("time.monotonic")
+    def test_get_set(self, m_monotonic):
+        m_monotonic.return_value = 100
+        cache = TTLCache(ttl={"languages": 10})
+        content = {"data": [{"id": "uk"}]}
+
+        cache.set("languages", "limit=25", content)
+        cache.set("projects", "", {"data": []})
+        assert len(cache) == 1
+
+        content["data"].clear()
+        result = cache.get("languages", "limit=25")
+        assert result == {"data": [{"id": "uk"}]}
+        result["data"].clear()
+        assert cache.get("languages", "limit=25") == {"data": [{"id": "uk"}]}
+        assert cache.get("languages", "limit=50") is None
+
+        m_monotonic.return_value = 110
+        assert cache.get("languages", "limit=25") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = TTLCache(ttl={"languages/*": 10}, max_entries=2)
+        cache.set("languages/a", "", "a")
+        cache.set("languages/b", "", "b")
+        cache.get("languages/a", "")
+        cache.set("languages/c", "", "c")
+
+        assert cache.get("languages/b", "") is None
+        assert cache.get("languages/a", "") == "a"
+        assert cache.get("languages/c", "") == "c"
+
+    def test_invalidate(self):
+        cache = TTLCache(ttl={"projects": 10, "projects/*": 10, "projects/*/files": 10})
+        for path in ("projects", "projects/1", "projects/2", "projects/1/files"):
+            cache.set(path, "", path)
+
+        cache.invalidate("projects/1")
+        assert cache.get("projects", "") is None
+        assert cache.get("projects/1", "") is None
+        assert cache.get("projects/1/files", "") is None
+        assert cache.get("projects/2", "") == "projects/2"
+
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestStorageCache:
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError):
+            StorageCache(max_entries=0)
+
+    @mock.patch("time.monotonic")
+    def test_get_set(self, m_monotonic):
+        m_monotonic.return_value = 100
+        cache = StorageCache(ttl=10)
+
+        cache.set("key", 1)
+        assert cache.get("key") == 1
+        assert cache.get("other") is None
+
+        m_monotonic.return_value = 110
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = StorageCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_delete_clear(self):
+        cache = StorageCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        cache.delete("a")
+        assert cache.get("a") is None
+        assert len(cache) == 1
+
+        cache.clear()
+        assert len(cache) == 0
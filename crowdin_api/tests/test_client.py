@@ -1,7 +1,15 @@
+import asyncio
+import subprocess
+import sys
 from unittest import mock
 
 import pytest
-from crowdin_api import CrowdinClient
+from crowdin_api import AsyncCrowdinClient, CrowdinClient
+from crowdin_api.cache import ResponseCache, StorageCache, TTLCache
+from crowdin_api.connection import ConnectionPool
+from crowdin_api.rate_limit import TokenBucketRateLimiter
+from crowdin_api.requester import AsyncAPIRequester
+from crowdin_api.retry import RetryPolicy
 
 
 class MockCrowdinClientEnterprise(CrowdinClient):
@@ -131,6 +139,13 @@ class TestCrowdinClient:
             max_retries=client.MAX_RETRIES,
             default_headers=client.get_default_headers(),
             extended_params=client.EXTENDED_REQUEST_PARAMS,
+            retry_policy=None,
+            rate_limiter=None,
+            response_cache=None,
+            ttl_cache=None,
+            coalesce_requests=False,
+            connection_pool=None,
+            transport=None,
         )
 
     @mock.patch("crowdin_api.client.CrowdinClient.API_REQUESTER_CLASS")
@@ -155,8 +170,76 @@ class TestCrowdinClient:
             max_retries=max_retries,
             default_headers=client.get_default_headers(),
             extended_params=client.EXTENDED_REQUEST_PARAMS,
+            retry_policy=None,
+            rate_limiter=None,
+            response_cache=None,
+            ttl_cache=None,
+            coalesce_requests=False,
+            connection_pool=None,
+            transport=None,
         )
 
+    @mock.patch("crowdin_api.client.CrowdinClient.API_REQUESTER_CLASS")
+    def test_api_requestor_retry_policy(self, m_APIRequester):
+        retry_policy = RetryPolicy(max_retries=10)
+
+        CrowdinClient(retry_policy=retry_policy).get_api_requestor()
+
+        assert m_APIRequester.call_args.kwargs["retry_policy"] is retry_policy
+
+    def test_resources_cached(self):
+        client = CrowdinClient(project_id=1)
+
+        assert client.source_strings is client.source_strings
+        assert client.source_strings is not client.translations
+
+        client.PROJECT_ID = 2
+        assert client.source_strings.project_id == 2
+
+    def test_for_project(self):
+        client = CrowdinClient(project_id=1)
+        project_client = client.for_project(2)
+
+        assert project_client is client.for_project(2)
+        assert project_client.PROJECT_ID == 2
+        assert client.PROJECT_ID == 1
+        assert project_client.get_api_requestor() is client.get_api_requestor()
+        assert project_client.source_strings.project_id == 2
+        assert project_client.source_strings is client.for_project(2).source_strings
+        assert client.source_strings.project_id == 1
+
+    @mock.patch("crowdin_api.client.CrowdinClient.API_REQUESTER_CLASS")
+    def test_api_requestor_response_cache(self, m_APIRequester):
+        response_cache = ResponseCache()
+
+        CrowdinClient(response_cache=response_cache).get_api_requestor()
+
+        assert m_APIRequester.call_args.kwargs["response_cache"] is response_cache
+
+    @mock.patch("crowdin_api.client.CrowdinClient.API_REQUESTER_CLASS")
+    def test_api_requestor_ttl_cache(self, m_APIRequester):
+        ttl_cache = TTLCache(ttl={"languages": 60})
+
+        CrowdinClient(ttl_cache=ttl_cache).get_api_requestor()
+
+        assert m_APIRequester.call_args.kwargs["ttl_cache"] is ttl_cache
+
+    @mock.patch("crowdin_api.client.CrowdinClient.API_REQUESTER_CLASS")
+    def test_api_requestor_rate_limiter(self, m_APIRequester):
+        rate_limiter = TokenBucketRateLimiter(requests_per_second=10)
+
+        CrowdinClient(rate_limiter=rate_limiter).get_api_requestor()
+
+        assert m_APIRequester.call_args.kwargs["rate_limiter"] is rate_limiter
+
+    def test_api_requestor_connection_pool(self):
+        connection_pool = ConnectionPool(pool_maxsize=32)
+
+        requester = CrowdinClient(connection_pool=connection_pool).get_api_requestor()
+
+        assert requester.connection_pool is connection_pool
+        assert requester.session.get_adapter("https://api.crowdin.com") is connection_pool
+
     @pytest.mark.parametrize(
         "property_name, class_name",
         (
@@ -174,7 +257,6 @@ class TestCrowdinClient:
             ("security_logs", "SecurityLogsResource"),
             ("source_files", "SourceFilesResource"),
             ("source_strings", "SourceStringsResource"),
-            ("storages", "StoragesResource"),
             ("string_comments", "StringCommentsResource"),
             ("string_translations", "StringTranslationsResource"),
             ("style_guides", "StyleGuidesResource"),
@@ -211,6 +293,29 @@ class TestCrowdinClient:
                 requester="api_requestor", project_id=1, page_size=25
             )
 
+    @pytest.mark.parametrize("client_class", (CrowdinClient, MockCrowdinClientEnterprise))
+    @mock.patch(
+        "crowdin_api.client.CrowdinClient.get_api_requestor",
+        return_value="api_requestor",
+    )
+    def test_storages_resource(self, _m_api_requestor, client_class):
+        storage_cache = StorageCache()
+
+        with mock.patch("crowdin_api.api_resources.StoragesResource") as m_resource:
+            client_class().storages
+            m_resource.assert_called_once_with(
+                requester="api_requestor", page_size=25, storage_cache=None
+            )
+
+        with mock.patch("crowdin_api.api_resources.StoragesResource") as m_resource:
+            client_class(project_id=1, storage_cache=storage_cache).storages
+            m_resource.assert_called_once_with(
+                requester="api_requestor",
+                project_id=1,
+                page_size=25,
+                storage_cache=storage_cache,
+            )
+
     @mock.patch("crowdin_api.client.CrowdinClient.get_api_requestor")
     def test_graphql(self, mock_get_requestor):
         """Test GraphQL functionality with basic request validation."""
@@ -251,7 +356,6 @@ class TestCrowdinClientEnterprise:
             ("security_logs", "SecurityLogsResource"),
             ("source_files", "SourceFilesResource"),
             ("source_strings", "SourceStringsResource"),
-            ("storages", "StoragesResource"),
             ("string_comments", "StringCommentsResource"),
             ("string_translations", "StringTranslationsResource"),
             ("style_guides", "StyleGuidesResource"),
@@ -292,3 +396,98 @@ class TestCrowdinClientEnterprise:
             m_resource.assert_called_once_with(
                 requester="api_requestor", project_id=1, page_size=25
             )
+
+
+class TestAsyncCrowdinClient:
+    @mock.patch("crowdin_api.client.AsyncCrowdinClient.API_REQUESTER_CLASS")
+    def test_api_requestor(self, m_APIRequester):
+        client = AsyncCrowdinClient(max_concurrency=10)
+
+        assert client.get_api_requestor() is client.get_api_requestor()
+        m_APIRequester.assert_called_once_with(
+            base_url=client.url,
+            timeout=client.TIMEOUT,
+            retry_delay=client.RETRY_DELAY,
+            max_retries=client.MAX_RETRIES,
+            default_headers=client.get_default_headers(),
+            extended_params=client.EXTENDED_REQUEST_PARAMS,
+            retry_policy=None,
+            rate_limiter=None,
+            response_cache=None,
+            ttl_cache=None,
+            coalesce_requests=False,
+            connection_pool=None,
+            transport=None,
+            max_concurrency=10,
+        )
+
+    def test_resources_use_async_requester(self):
+        client = AsyncCrowdinClient(project_id=1)
+
+        assert isinstance(client.source_strings.requester, AsyncAPIRequester)
+        assert client.translations.requester is client.storages.requester
+
+    def test_request(self, requests_mock):
+        requests_mock.get("https://api.crowdin.com/api/v2/projects/1", text='{"data": {"id": 1}}')
+
+        async def run():
+            async with AsyncCrowdinClient(token="token") as client:
+                response = await client.projects.get_project(projectId=1)
+            return client, response
+
+        client, response = asyncio.run(run())
+
+        assert response == {"data": {"id": 1}}
+        assert client._api_requestor is None
+
+
+def _run_python(code: str) -> str:
+    return subprocess.check_output([sys.executable, "-c", code], text=True).strip()
+
+
+def test_resources_loaded_lazily():
+    loaded = _run_python(
+        "import sys\n"
+        "import crowdin_api\n"
+        "print([name for name in sys.modules if name.startswith('crowdin_api.api_resources.')])"
+    )
+    assert loaded == "[]"
+
+    loaded = _run_python(
+        "import sys\n"
+        "import crowdin_api\n"
+        "crowdin_api.CrowdinClient(token='token').languages\n"
+        "print(any(name.startswith('crowdin_api.api_resources.reports') for name in sys.modules))"
+    )
+    assert loaded == "False"
+
+
+@pytest.mark.benchmark
+def test_import_time_benchmark():
+    def import_time(load_resources: bool) -> float:
+        return float(
+            _run_python(
+                "import time\n"
+                "started = time.perf_counter()\n"
+                "import crowdin_api\n"
+                "from crowdin_api import api_resources\n"
+                f"if {load_resources}:\n"
+                "    [getattr(api_resources, name) for name in api_resources.__all__]\n"
+                "print(time.perf_counter() - started)"
+            )
+        )
+
+    lazy = min(import_time(load_resources=False) for _ in range(3))
+    eager = min(import_time(load_resources=True) for _ in range(3))
+    assert lazy < eager
+
+
+def test_api_resources_module():
+    from crowdin_api import api_resources
+
+    assert api_resources.ProjectsResource.__name__ == "ProjectsResource"
+    assert "ProjectsResource" in dir(api_resources)
+    assert api_resources.__all__ == list(api_resources._resource_modules)
+
+    with pytest.raises(AttributeError):
+        api_resources.UnknownResource
@@ -0,0 +1,119 @@
+import socket
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from crowdin_api.connection import ConnectionPool
+from crowdin_api.requester import APIRequester, AsyncAPIRequester
+
+
+class TestConnectionPool:
+    def test_init(self):
+        connection_pool = ConnectionPool(pool_connections=2, pool_maxsize=20, warm_up=50)
+
+        assert connection_pool._pool_connections == 2
+        assert connection_pool._pool_maxsize == 20
+        assert connection_pool.warm_up == 20
+
+    def test_init_invalid_pool_maxsize(self):
+        with pytest.raises(ValueError):
+            ConnectionPool(pool_maxsize=0)
+
+    def test_socket_options(self):
+        keep_alive = (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        connection_pool = ConnectionPool(keep_alive_idle=30)
+        options = connection_pool.get_socket_options()
+
+        assert keep_alive not in ConnectionPool().get_socket_options()
+        assert keep_alive in options
+        assert connection_pool.poolmanager.connection_pool_kw["socket_options"] == options
+
+    def test_connections_reused(self, server_url):
+        requester = APIRequester(base_url=server_url)
+
+        for _ in range(5):
+            assert requester.request(method="get", path="projects/1") == {"data": {"id": 1}}
+
+        assert requester.connection_stats == {
+            "requests": 5,
+            "connections": 1,
+            "reused": 4,
+            "reuse_ratio": 0.8,
+        }
+
+    def test_keep_alive_disabled(self, server_url):
+        requester = APIRequester(
+            base_url=server_url, connection_pool=ConnectionPool(keep_alive=False)
+        )
+
+        for _ in range(3):
+            requester.request(method="get", path="projects/1")
+
+        assert requester.connection_stats["connections"] == 3
+        assert requester.connection_stats["reused"] == 0
+
+    def test_pool_maxsize(self, server_url):
+        requester = APIRequester(
+            base_url=server_url, connection_pool=ConnectionPool(pool_maxsize=4, pool_block=True)
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: requester.request("get", "projects/1"), range(40)))
+
+        stats = requester.connection_stats
+        assert stats["requests"] == 40
+        assert stats["connections"] <= 4
+
+    def test_warm_up(self, server_url):
+        requester = APIRequester(base_url=server_url, connection_pool=ConnectionPool(warm_up=3))
+
+        assert requester.connection_stats["connections"] == 3
+        assert requester.warm_up() == 0
+
+        for _ in range(3):
+            requester.request(method="get", path="projects/1")
+
+        assert requester.connection_stats["connections"] == 3
+        assert requester.connection_stats["reused"] == 3
+
+    def test_warm_up_failure(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        requester = APIRequester(base_url="http://127.0.0.1:{0}/api/v2/".format(port))
+
+        assert requester.warm_up(2) == 0
+
+    def test_stats_of_dropped_pools(self, server_url):
+        requester = APIRequester(
+            base_url=server_url, connection_pool=ConnectionPool(pool_connections=1)
+        )
+
+        requester.request(method="get", path="projects/1")
+        requester.session.get(server_url.replace("127.0.0.1", "localhost"))
+
+        assert requester.connection_stats["connections"] == 2
+
+        requester.close()
+        assert requester.connection_stats["connections"] == 2
+
+    def test_shared_pool_not_closed(self, server_url):
+        connection_pool = ConnectionPool()
+        requester = APIRequester(base_url=server_url, connection_pool=connection_pool)
+        other_requester = APIRequester(base_url=server_url, connection_pool=connection_pool)
+
+        requester.request(method="get", path="projects/1")
+        requester.close()
+        other_requester.request(method="get", path="projects/1")
+
+        assert connection_pool.stats["connections"] == 1
+        assert connection_pool.stats["reused"] == 1
+
+    def test_async_requester_pool(self, base_absolut_url):
+        requester = AsyncAPIRequester(base_url=base_absolut_url, max_concurrency=7)
+        connection_pool = ConnectionPool()
+
+        assert requester.connection_pool._pool_maxsize == 7
+        assert AsyncAPIRequester(
+            base_url=base_absolut_url, connection_pool=connection_pool
+        ).connection_pool is connection_pool
@@ -0,0 +1,223 @@
+import asyncio
+import hashlib
+import json
+from unittest import mock
+from urllib.parse import urljoin
+
+import pytest
+import requests
+from crowdin_api.download import RangedDownload
+from crowdin_api.exceptions import APIException, CrowdinException, NotFound
+from crowdin_api.fixtures import get_file_content
+from crowdin_api.requester import APIRequester, AsyncAPIRequester
+from crowdin_api.retry import RetryPolicy
+
+SIZE = 10000
+
+
+@pytest.fixture
+def file_url(server_url):
+    return urljoin(server_url, "/files/{0}".format(SIZE))
+
+
+class TestRangedDownload:
+    def test_ranges(self, file_url, tmp_path):
+        path = tmp_path / "build.zip"
+        session = requests.Session()
+        progress = mock.Mock()
+
+        with mock.patch.object(session, "get", wraps=session.get) as m_get:
+            result = RangedDownload(
+                session, file_url, path, chunk_size=3000, concurrency=3, progress=progress
+            ).run()
+
+        assert result == str(path)
+        assert path.read_bytes() == get_file_content(SIZE)
+        assert sorted(call.kwargs["headers"]["Range"] for call in m_get.call_args_list) == [
+            "bytes=0-2999",
+            "bytes=3000-5999",
+            "bytes=6000-8999",
+            "bytes=9000-9999",
+        ]
+        assert progress.call_args_list[-1] == mock.call(SIZE, SIZE)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["build.zip"]
+
+    def test_without_ranges(self, file_url, tmp_path):
+        path = tmp_path / "build.zip"
+        checksum = hashlib.sha256(get_file_content(SIZE)).hexdigest()
+
+        RangedDownload(
+            requests.Session(), file_url + "/plain", path, chunk_size=3000, checksum=checksum
+        ).run()
+
+        assert path.read_bytes() == get_file_content(SIZE)
+
+    def test_unknown_size(self, file_url, tmp_path):
+        path = tmp_path / "build.zip"
+        session = requests.Session()
+        get = session.get
+
+        def get_without_size(url, headers=None, **kwargs):
+            response = get(url, headers=headers, **kwargs)
+            if "Content-Range" in response.headers:
+                response.headers["Content-Range"] = "bytes 0-2999/*"
+            return response
+
+        with mock.patch.object(session, "get", side_effect=get_without_size) as m_get:
+            RangedDownload(session, file_url, path, chunk_size=3000).run()
+
+        assert path.read_bytes() == get_file_content(SIZE)
+        # The probe, then the whole file without a range
+        assert [call.kwargs["headers"] for call in m_get.call_args_list] == [
+            {"Range": "bytes=0-2999"},
+            None,
+        ]
+
+    def test_resume(self, file_url, tmp_path):
+        path = tmp_path / "build.zip"
+        content = get_file_content(SIZE)
+        (tmp_path / "build.zip.part").write_bytes(content[:6000] + b"\0" * 4000)
+        (tmp_path / "build.zip.part.json").write_text(
+            json.dumps({"size": SIZE, "etag": '"10000"', "chunk_size": 3000, "done": [0, 1]})
+        )
+        session = requests.Session()
+        progress = mock.Mock()
+
+        with mock.patch.object(session, "get", wraps=session.get) as m_get:
+            RangedDownload(session, file_url, path, chunk_size=3000, progress=progress).run()
+
+        assert path.read_bytes() == content
+        # The probe and the two missing chunks
+        assert m_get.call_count == 3
+        assert progress.call_args_list[0] == mock.call(6000, SIZE)
+
+    def test_state_of_other_file_ignored(self, file_url, tmp_path):
+        path = tmp_path / "build.zip"
+        (tmp_path / "build.zip.part").write_bytes(b"\1" * SIZE)
+        (tmp_path / "build.zip.part.json").write_text(
+            json.dumps({"size": SIZE, "etag": '"other"', "chunk_size": 3000, "done": [0, 1, 2]})
+        )
+
+        RangedDownload(requests.Session(), file_url, path, chunk_size=3000).run()
+
+        assert path.read_bytes() == get_file_content(SIZE)
+
+    def test_failed_chunk_retried(self, file_url, tmp_path):
+        path = tmp_path / "build.zip"
+        session = requests.Session()
+        get = session.get
+        failures = []
+
+        def flaky_get(url, headers, **kwargs):
+            if headers["Range"] == "bytes=3000-5999" and not failures:
+                failures.append(headers)
+                raise requests.ConnectionError("Connection reset")
+            return get(url, headers=headers, **kwargs)
+
+        with mock.patch.object(session, "get", side_effect=flaky_get):
+            RangedDownload(
+                session,
+                file_url,
+                path,
+                chunk_size=3000,
+                retry_policy=RetryPolicy(base_delay=0, jitter=False),
+            ).run()
+
+        assert failures
+        assert path.read_bytes() == get_file_content(SIZE)
+
+    def test_failed_download_resumable(self, file_url, tmp_path):
+        path = tmp_path / "build.zip"
+        session = requests.Session()
+        get = session.get
+
+        def failing_get(url, headers, **kwargs):
+            if headers["Range"] == "bytes=6000-8999":
+                raise requests.ConnectionError("Connection reset")
+            return get(url, headers=headers, **kwargs)
+
+        download = RangedDownload(
+            session, file_url, path, chunk_size=3000, concurrency=1, retry_policy=RetryPolicy(0)
+        )
+        with mock.patch.object(session, "get", side_effect=failing_get):
+            with pytest.raises(APIException):
+                download.run()
+
+        state = json.loads((tmp_path / "build.zip.part.json").read_text())
+        assert {0, 1} <= set(state["done"]) and 2 not in state["done"]
+        assert not path.exists()
+
+        RangedDownload(session, file_url, path, chunk_size=3000).run()
+        assert path.read_bytes() == get_file_content(SIZE)
+
+    def test_checksum_mismatch(self, file_url, tmp_path):
+        path = tmp_path / "build.zip"
+
+        with pytest.raises(CrowdinException, match="checksum"):
+            RangedDownload(requests.Session(), file_url, path, checksum="0" * 64).run()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_not_found(self, tmp_path):
+        session = requests.Session()
+        response = mock.Mock(status_code=404, headers={})
+
+        with mock.patch.object(session, "get", return_value=response) as m_get:
+            with pytest.raises(NotFound):
+                RangedDownload(
+                    session,
+                    "https://example.com/build.zip",
+                    tmp_path / "build.zip",
+                    exception_map={404: NotFound},
+                ).run()
+
+        m_get.assert_called_once()
+        response.close.assert_called_once()
+
+    @pytest.mark.parametrize("in_params", ({"chunk_size": 0}, {"concurrency": 0}))
+    def test_invalid(self, tmp_path, in_params):
+        with pytest.raises(ValueError):
+            RangedDownload(requests.Session(), "https://example.com", tmp_path / "f", **in_params)
+
+
+class TestRequesterDownload:
+    def test_download(self, server_url, file_url, tmp_path):
+        requester = APIRequester(
+            base_url=server_url, default_headers={"Authorization": "Bearer token"}
+        )
+
+        assert requester.download(file_url, tmp_path / "build.zip", chunk_size=4096) == str(
+            tmp_path / "build.zip"
+        )
+        assert (tmp_path / "build.zip").read_bytes() == get_file_content(SIZE)
+        # The token is not sent to download links
+        assert "Authorization" not in requester.download_session.headers
+        assert requester.download_session.get_adapter(file_url) is requester.connection_pool
+        assert requester.connection_stats["reused"] > 0
+
+        requester.close()
+        assert requester.download_session.adapters == {}
+
+    def test_async_download(self, server_url, file_url, tmp_path):
+        requester = AsyncAPIRequester(base_url=server_url)
+
+        path = asyncio.run(requester.download(file_url, tmp_path / "build.zip"))
+
+        assert path == str(tmp_path / "build.zip")
+        assert (tmp_path / "build.zip").read_bytes() == get_file_content(SIZE)
+
+    def test_iter_download(self, server_url, file_url):
+        requester = APIRequester(base_url=server_url)
+
+        assert b"".join(requester.iter_download(file_url, chunk_size=1024)) == get_file_content(
+            SIZE
+        )
+
+    def test_iter_download_not_found(self, server_url):
+        requester = APIRequester(base_url=server_url)
+        response = mock.MagicMock(status_code=404, headers={})
+        response.__enter__.return_value = response
+
+        with mock.patch.object(requester.download_session, "get", return_value=response):
+            with pytest.raises(NotFound):
+                list(requester.iter_download("https://example.com/build.zip"))
@@ -3,7 +3,7 @@ from unittest.mock import Mock, PropertyMock
 
 import pytest
 from crowdin_api import status
-from crowdin_api.exceptions import APIException, CrowdinException
+from crowdin_api.exceptions import APIException, CrowdinException, NotFound, Throttled
 
 
 class TestCrowdinException:
@@ -45,6 +45,20 @@ class TestAPIException:
         )
         assert exception.should_retry == result
 
+    @pytest.mark.parametrize(
+        "exception_class,should_retry,result",
+        (
+            (Throttled, None, True),
+            (Throttled, False, False),
+            (NotFound, None, False),
+        ),
+    )
+    def test_default_should_retry(self, exception_class, should_retry, result):
+        exception = exception_class(
+            http_status=exception_class.default_http_status, should_retry=should_retry
+        )
+        assert exception.should_retry == result
+
     @pytest.mark.parametrize(
         "headers,result",
         (
@@ -0,0 +1,171 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import CancelledError
+from unittest import mock
+
+import pytest
+from crowdin_api.exceptions import CrowdinException, JobFailed, NotFound
+from crowdin_api.jobs import AsyncJobPoller, JobPoller
+
+
+def make_status(status, identifier="job"):
+    return {"data": {"identifier": identifier, "status": status, "progress": 0}}
+
+
+def make_check(*statuses, identifier="job"):
+    return mock.Mock(side_effect=[make_status(status, identifier) for status in statuses])
+
+
+class TestJobPoller:
+    def test_finished(self):
+        check = make_check("created", "inProgress", "finished")
+        callback = mock.Mock()
+
+        with JobPoller(initial_delay=0.01, max_delay=0.02) as poller:
+            future = poller.wait(check, callback=callback)
+            assert future.result(timeout=5) == make_status("finished")
+
+        assert check.call_count == 3
+        callback.assert_called_once_with(future)
+        assert len(poller) == 0
+
+    def test_many_jobs_one_scheduler(self):
+        checks = [make_check("inProgress", "finished", identifier=i) for i in range(50)]
+        threads = threading.active_count()
+
+        with JobPoller(initial_delay=0.01, max_delay=0.01, max_workers=2) as poller:
+            futures = [poller.wait(check) for check in checks]
+            # The scheduler and the workers only
+            assert threading.active_count() <= threads + 3
+            results = [future.result(timeout=5) for future in futures]
+
+        assert [result["data"]["identifier"] for result in results] == list(range(50))
+
+    @pytest.mark.parametrize("status", ("failed", "canceled"))
+    def test_failed(self, status):
+        with JobPoller(initial_delay=0.01) as poller:
+            future = poller.wait(make_check("inProgress", status))
+
+            with pytest.raises(JobFailed) as error:
+                future.result(timeout=5)
+
+        assert error.value.response == make_status(status)
+
+    def test_check_error(self):
+        with JobPoller(initial_delay=0.01) as poller:
+            future = poller.wait(mock.Mock(side_effect=NotFound()))
+
+            with pytest.raises(NotFound):
+                future.result(timeout=5)
+
+    def test_timeout(self):
+        check = mock.Mock(return_value=make_status("inProgress"))
+
+        with JobPoller(initial_delay=0.01, max_delay=1, timeout=0.1) as poller:
+            future = poller.wait(check)
+
+            with pytest.raises(CrowdinException, match="did not finish in time"):
+                future.result(timeout=5)
+
+        # Checked at the deadline instead of after the next delay
+        assert 2 <= check.call_count <= 5
+
+    def test_backoff(self):
+        poller = JobPoller(initial_delay=1, max_delay=5, multiplier=2)
+        job = mock.Mock(
+            check=make_check("inProgress", "inProgress", "inProgress", "inProgress", "finished"),
+            delay=1,
+            deadline=None,
+        )
+        poller._closed = False
+
+        with mock.patch.object(poller, "_schedule") as m_schedule:
+            for _ in range(4):
+                poller._check(job)
+
+        assert [call.args[1] for call in m_schedule.call_args_list] == [
+            pytest.approx(time.monotonic() + delay, abs=0.5) for delay in (2, 4, 5, 5)
+        ]
+
+    def test_cancel_future(self):
+        check = mock.Mock(return_value=make_status("inProgress"))
+
+        with JobPoller(initial_delay=0.05) as poller:
+            future = poller.wait(check)
+            assert future.cancel()
+            time.sleep(0.1)
+
+        check.assert_not_called()
+
+    def test_close(self):
+        poller = JobPoller(initial_delay=10)
+        future = poller.wait(mock.Mock())
+
+        poller.close()
+
+        with pytest.raises(CancelledError):
+            future.result(timeout=5)
+        with pytest.raises(CrowdinException):
+            poller.wait(mock.Mock())
+
+    @pytest.mark.parametrize(
+        "in_params",
+        ({"initial_delay": 0}, {"initial_delay": 2, "max_delay": 1}, {"multiplier": 0.5}),
+    )
+    def test_invalid(self, in_params):
+        with pytest.raises(ValueError):
+            JobPoller(**in_params)
+
+
+class TestAsyncJobPoller:
+    def test_finished(self):
+        statuses = iter(["inProgress", "finished"])
+        callback = mock.Mock()
+
+        async def check():
+            return make_status(next(statuses))
+
+        async def run():
+            poller = AsyncJobPoller(initial_delay=0.01)
+            task = poller.wait(check, callback=callback)
+            assert len(poller) == 1
+            return await task, poller
+
+        result, poller = asyncio.run(run())
+
+        assert result == make_status("finished")
+        callback.assert_called_once()
+        assert len(poller) == 0
+
+    def test_failed_and_timeout(self):
+        async def failed():
+            return make_status("failed")
+
+        async def in_progress():
+            return make_status("inProgress")
+
+        async def run():
+            poller = AsyncJobPoller(initial_delay=0.01, timeout=0.05)
+            return await asyncio.gather(
+                poller.wait(failed), poller.wait(in_progress), return_exceptions=True
+            )
+
+        failed_error, timeout_error = asyncio.run(run())
+
+        assert isinstance(failed_error, JobFailed)
+        assert "did not finish in time" in str(timeout_error)
+
+    def test_close(self):
+        async def check():
+            return make_status("inProgress")
+
+        async def run():
+            poller = AsyncJobPoller(initial_delay=10)
+            task = poller.wait(check)
+            await asyncio.sleep(0)
+            poller.close()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
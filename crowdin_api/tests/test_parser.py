@@ -1,8 +1,11 @@
 import datetime
+import json
+import timeit
 from enum import Enum
 
 import pytest
-from crowdin_api.parser import dumps, loads
+from crowdin_api.parser import CrowdinJSONDecoder, dumps, encode_params, loads
+from crowdin_api.requester import APIRequester
 from crowdin_api.sorting import Sorting, SortingOrder, SortingRule
 
 
@@ -110,3 +113,152 @@ def test_parser_default_fallback():
 
     with pytest.raises(TypeError):
         dumps({"test": UnserializableObject()})
+
+
+def test_parser_skips_non_datetime_strings():
+    result = loads(
+        '{"identifier": "2020-01-01", "text": "2020-01-04T18:20 is not a date", "id": "1988",'
+        ' "nested": [{"createdAt": "2020-01-04T18:20"}]}'
+    )
+
+    assert result == {
+        "identifier": "2020-01-01",
+        "text": "2020-01-04T18:20 is not a date",
+        "id": "1988",
+        "nested": [{"createdAt": datetime.datetime(2020, 1, 4, 18, 20)}],
+    }
+
+
+def test_parser_bytes():
+    assert loads(b'{"date": "2020-01-04T18:20:00.5Z"}') == {
+        "date": datetime.datetime(2020, 1, 4, 18, 20, 0, 500000, tzinfo=datetime.timezone.utc)
+    }
+
+
+class RegexEveryValueDecoder(CrowdinJSONDecoder):
+    """The previous decoder, matching every string value against `datetime_re`."""
+
+    def __init__(self, *args, **kwargs):
+        json.JSONDecoder.__init__(self, *args, object_hook=self.object_hook, **kwargs)
+
+    def _parse_datetime(self, value):
+        match = self.datetime_re.match(value)
+        if match:
+            kw = match.groupdict()
+            kw["microsecond"] = kw["microsecond"] and kw["microsecond"].ljust(6, "0")
+            tzinfo = self._get_timezone(kw.pop("tzinfo"))
+            kw = {k: int(v) for k, v in kw.items() if v is not None}
+            kw["tzinfo"] = tzinfo
+            return datetime.datetime(**kw)
+
+    def object_hook(self, parsed_object):
+        for key, value in parsed_object.items():
+            if isinstance(value, str):
+                date_value = self._parse_datetime(value)
+
+                if isinstance(date_value, datetime.datetime):
+                    parsed_object[key] = date_value
+
+        return parsed_object
+
+
+def _get_strings_page() -> bytes:
+    page = {
+        "data": [
+            {
+                "data": {
+                    "id": string_id,
+                    "projectId": 1,
+                    "fileId": 3,
+                    "identifier": "app.settings.button_{0}".format(string_id),
+                    "text": "Save changes made on 2020-01-01 before leaving",
+                    "context": "https://example.com/settings",
+                    "labelIds": [1, 2],
+                    "webUrl": "https://crowdin.com/editor/project/all/en-uk#1",
+                    "createdAt": "2023-09-20T11:34:40+00:00",
+                    "updatedAt": "2023-09-21T11:34:40+00:00",
+                }
+            }
+            for string_id in range(500)
+        ],
+        "pagination": {"offset": 0, "limit": 500},
+    }
+    return json.dumps(page).encode()
+
+
+def test_loads_matches_regex_decoder():
+    content = _get_strings_page()
+
+    assert loads(content) == json.loads(content, cls=RegexEveryValueDecoder)
+
+
+@pytest.mark.benchmark
+def test_loads_benchmark():
+    content = _get_strings_page()
+
+    legacy = min(
+        timeit.repeat(lambda: json.loads(content, cls=RegexEveryValueDecoder), number=5, repeat=5)
+    )
+    current = min(timeit.repeat(lambda: loads(content), number=5, repeat=5))
+    assert current < legacy
+
+
+def test_encode_params():
+    created_at = datetime.datetime(
+        1988, 1, 4, 18, 20, tzinfo=datetime.timezone(datetime.timedelta(hours=2))
+    )
+    sorting = Sorting([SortingRule(TestEnum.ID, SortingOrder.DESC)])
+
+    result = encode_params(
+        {
+            "orderBy": sorting,
+            "createdAfter": created_at,
+            "field": TestEnum.CREATED_AT,
+            "labelIds": (1, None, TestEnum.ID),
+            "filter": {"key": None, "date": created_at},
+            "croql": None,
+            "offset": 0,
+            "isHidden": False,
+        }
+    )
+
+    assert result == {
+        "orderBy": "id desc",
+        "createdAfter": "1988-01-04T18:20:00+02:00",
+        "field": "createdAt",
+        "labelIds": [1, "id"],
+        "filter": {"date": "1988-01-04T18:20:00+02:00"},
+        "offset": 0,
+        "isHidden": False,
+    }
+
+
+BENCHMARK_PARAMS = {
+    "orderBy": Sorting([SortingRule(TestEnum.CREATED_AT, SortingOrder.DESC)]),
+    "croql": None,
+    "fileId": 3,
+    "labelIds": [1, 2, 3],
+    "filter": "identifier",
+    "scope": TestEnum.ID,
+    "limit": 500,
+    "offset": 1000,
+}
+
+
+def test_encode_params_matches_round_trip():
+    clear_data = APIRequester(base_url="https://api.crowdin.com/api/v2/")._clear_data
+
+    assert encode_params(BENCHMARK_PARAMS) == loads(dumps(clear_data(BENCHMARK_PARAMS)))
+
+
+@pytest.mark.benchmark
+def test_encode_params_benchmark():
+    clear_data = APIRequester(base_url="https://api.crowdin.com/api/v2/")._clear_data
+
+    round_trip = min(
+        timeit.repeat(
+            lambda: loads(dumps(clear_data(BENCHMARK_PARAMS))), number=1000, repeat=5
+        )
+    )
+    current = min(timeit.repeat(lambda: encode_params(BENCHMARK_PARAMS), number=1000, repeat=5))
+    assert current < round_trip
@@ -0,0 +1,208 @@
+import threading
+from multiprocessing import Process
+from unittest import mock
+
+import pytest
+from crowdin_api.rate_limit import (
+    AdaptiveConcurrencyLimiter,
+    FileRateLimiter,
+    TokenBucketRateLimiter,
+)
+
+
+class TestTokenBucketRateLimiter:
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(requests_per_second=0)
+
+    @mock.patch("time.sleep")
+    @mock.patch("time.monotonic")
+    def test_acquire(self, m_monotonic, m_sleep):
+        m_monotonic.return_value = 100.0
+        limiter = TokenBucketRateLimiter(requests_per_second=10, burst=2)
+
+        limiter.acquire()
+        limiter.acquire()
+        m_sleep.assert_not_called()
+
+        def sleep(seconds):
+            m_monotonic.return_value += seconds
+
+        m_sleep.side_effect = sleep
+        limiter.acquire()
+        m_sleep.assert_called_once_with(pytest.approx(0.1))
+
+    def test_max_in_flight(self):
+        limiter = TokenBucketRateLimiter(requests_per_second=1000, burst=1000, max_in_flight=2)
+        lock = threading.Lock()
+        in_flight = []
+        max_seen = []
+        release = threading.Event()
+
+        def worker():
+            with limiter:
+                with lock:
+                    in_flight.append(1)
+                    max_seen.append(len(in_flight))
+                release.wait(0.05)
+                with lock:
+                    in_flight.pop()
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(max_seen) == 2
+
+
+def _file_limiter_worker(path, count):
+    limiter = FileRateLimiter(path, requests_per_second=1000, burst=1000, max_in_flight=1)
+    for _ in range(count):
+        with limiter:
+            pass
+
+
+class TestFileRateLimiter:
+    @mock.patch("time.sleep")
+    @mock.patch("time.time")
+    def test_acquire(self, m_time, m_sleep, tmp_path):
+        m_time.return_value = 100.0
+        path = tmp_path / "bucket"
+        limiter = FileRateLimiter(path, requests_per_second=10, burst=2)
+        other_limiter = FileRateLimiter(path, requests_per_second=10, burst=2)
+
+        limiter.acquire()
+        other_limiter.acquire()
+        m_sleep.assert_not_called()
+        assert path.read_text().split()[0] == "0.0"
+
+        def sleep(seconds):
+            m_time.return_value += seconds
+
+        m_sleep.side_effect = sleep
+        limiter.acquire()
+        m_sleep.assert_called_once_with(pytest.approx(0.1))
+
+    def test_max_in_flight(self, tmp_path):
+        path = tmp_path / "bucket"
+        limiter = FileRateLimiter(path, requests_per_second=1000, max_in_flight=1)
+        other_limiter = FileRateLimiter(path, requests_per_second=1000, max_in_flight=1)
+
+        with limiter:
+            assert limiter._held_slots
+            with mock.patch("time.sleep", side_effect=RuntimeError) as m_sleep:
+                with pytest.raises(RuntimeError):
+                    other_limiter.acquire()
+                m_sleep.assert_called_once()
+
+        assert limiter._held_slots == []
+        with other_limiter:
+            pass
+
+    def test_acquire_error_releases_slot(self, tmp_path):
+        limiter = FileRateLimiter(tmp_path / "bucket", requests_per_second=1, max_in_flight=1)
+
+        with mock.patch.object(limiter, "_take_token", side_effect=RuntimeError):
+            with pytest.raises(RuntimeError):
+                limiter.acquire()
+
+        assert limiter._held_slots == []
+
+    def test_processes(self, tmp_path):
+        path = str(tmp_path / "bucket")
+        processes = [Process(target=_file_limiter_worker, args=(path, 20)) for _ in range(3)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=30)
+
+        assert [process.exitcode for process in processes] == [0, 0, 0]
+
+
+class TestAdaptiveConcurrencyLimiter:
+    @pytest.mark.parametrize(
+        "kwargs",
+        (
+            {"initial_limit": 0},
+            {"initial_limit": 2, "min_limit": 3},
+            {"initial_limit": 10, "max_limit": 5},
+            {"decrease_factor": 1},
+        ),
+    )
+    def test_invalid_params(self, kwargs):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(**kwargs)
+
+    def test_increase(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3)
+
+        limiter.record(200, 0.5)
+        limiter.record(200, 0.5)
+        assert limiter.limit == 2
+        limiter.record(200, 0.5)
+        assert limiter.limit == 3
+        assert limiter.latency == 0.5
+
+        for _ in range(10):
+            limiter.record(200, 0.5)
+        assert limiter.limit == 3
+
+    def test_max_latency(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_latency=1, latency_smoothing=0.5)
+
+        limiter.record(200, 3)
+        assert limiter.latency == 3
+        limiter.record(200, 1)
+        assert limiter.latency == 2
+        assert limiter.limit == 2
+
+    @pytest.mark.parametrize("status_code", (429, 500, 503))
+    @mock.patch("time.monotonic")
+    def test_decrease(self, m_monotonic, status_code):
+        m_monotonic.return_value = 100.0
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, min_limit=3)
+
+        limiter.record(status_code, 1)
+        assert limiter.limit == 8
+
+        # Sent before the previous decrease
+        m_monotonic.return_value = 100.5
+        limiter.record(status_code, 1)
+        assert limiter.limit == 8
+
+        m_monotonic.return_value = 102.0
+        limiter.record(status_code, 1)
+        assert limiter.limit == 4
+
+        m_monotonic.return_value = 104.0
+        limiter.record(status_code, 1)
+        assert limiter.limit == 3
+
+    def test_not_decrease_on_client_error(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+
+        limiter.record(404, 0.1)
+        assert limiter.limit == 4
+
+    def test_acquire(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        acquired = threading.Event()
+
+        def worker():
+            with limiter:
+                acquired.set()
+
+        with limiter:
+            assert limiter.in_flight == 1
+            thread = threading.Thread(target=worker)
+            thread.start()
+            assert not acquired.wait(0.05)
+
+            # A grown limit lets the waiting request through
+            limiter.record(200, 0.1)
+            assert acquired.wait(1)
+
+        thread.join()
+        assert limiter.in_flight == 0
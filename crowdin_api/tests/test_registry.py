@@ -0,0 +1,113 @@
+from unittest import mock
+
+import pytest
+from crowdin_api import AsyncCrowdinClient, CrowdinClient
+from crowdin_api.cache import StorageCache, TTLCache
+from crowdin_api.connection import ConnectionPool
+from crowdin_api.registry import ClientRegistry
+
+
+class TestClientRegistry:
+    def test_init_invalid_max_clients(self):
+        with pytest.raises(ValueError):
+            ClientRegistry(max_clients=0)
+
+    def test_init_per_account_option(self):
+        with pytest.raises(ValueError, match="storage_cache"):
+            ClientRegistry(timeout=30, storage_cache=StorageCache())
+
+    def test_shared_ttl_cache_and_transport(self):
+        ttl_cache, transport = TTLCache(), mock.Mock()
+        registry = ClientRegistry(ttl_cache=ttl_cache, transport=transport)
+
+        requesters = [
+            registry.get(token="token_1").get_api_requestor(),
+            registry.get(token="token_2").get_api_requestor(),
+        ]
+
+        for requester in requesters:
+            assert requester.ttl_cache is ttl_cache
+            assert requester.transport is transport
+
+    def test_get(self):
+        registry = ClientRegistry(timeout=30)
+
+        client = registry.get(token="token_1")
+
+        assert isinstance(client, CrowdinClient)
+        assert client.TOKEN == "token_1"
+        assert client.TIMEOUT == 30
+        assert registry.get(token="token_1") is client
+        assert registry.get(token="token_2") is not client
+        assert registry.get(token="token_1", organization="acme").ORGANIZATION == "acme"
+        assert len(registry) == 3
+
+    def test_clients_share_connection_pool(self):
+        connection_pool = ConnectionPool()
+        registry = ClientRegistry(connection_pool=connection_pool)
+
+        requesters = [
+            registry.get(token="token_1").get_api_requestor(),
+            registry.get(token="token_2", organization="acme").get_api_requestor(),
+        ]
+
+        for requester in requesters:
+            assert requester.connection_pool is connection_pool
+            assert requester.session.get_adapter(requester.base_url) is connection_pool
+        assert requesters[0].session.headers["Authorization"] == "Bearer token_1"
+        assert requesters[1].session.headers["Authorization"] == "Bearer token_2"
+
+    def test_least_recently_used_dropped(self):
+        registry = ClientRegistry(max_clients=2)
+
+        first_client = registry.get(token="token_1")
+        second_client = registry.get(token="token_2")
+        registry.get(token="token_1")
+        registry.get(token="token_3")
+
+        assert len(registry) == 2
+        assert registry.get(token="token_1") is first_client
+        assert registry.get(token="token_2") is not second_client
+
+    def test_connections_do_not_grow_with_tenants(self, server_url):
+        registry = ClientRegistry(max_clients=5, http_protocol="http", base_url=server_url[7:])
+
+        for tenant in range(50):
+            client = registry.get(token="token_{0}".format(tenant))
+            assert client.get_api_requestor().request("get", "projects/1") == {"data": {"id": 1}}
+
+        assert len(registry) == 5
+        assert registry.connection_pool.stats["requests"] == 50
+        assert registry.connection_pool.stats["connections"] == 1
+
+    def test_async_clients(self):
+        registry = ClientRegistry(client_class=AsyncCrowdinClient, max_concurrency=5)
+
+        client = registry.get(token="token")
+
+        assert isinstance(client, AsyncCrowdinClient)
+        assert client.get_api_requestor().connection_pool is registry.connection_pool
+
+    def test_remove(self):
+        registry = ClientRegistry()
+        client = registry.get(token="token")
+
+        with mock.patch.object(client, "close") as m_close:
+            registry.remove(token="token")
+            registry.remove(token="token")
+
+        m_close.assert_called_once()
+        assert len(registry) == 0
+
+    def test_close(self):
+        registry = ClientRegistry()
+        client = registry.get(token="token")
+        client.get_api_requestor()
+
+        with mock.patch.object(registry.connection_pool, "close") as m_close:
+            with registry:
+                pass
+
+        m_close.assert_called_once()
+        assert len(registry) == 0
+        assert client._api_requestor is None
@@ -1,13 +1,19 @@
+import asyncio
+import threading
+import time
 from collections import namedtuple
+from concurrent.futures import Future
 from copy import copy
 from unittest import mock
-from unittest.mock import Mock, PropertyMock
+from unittest.mock import MagicMock, Mock, PropertyMock
 from urllib.parse import urljoin
 
 import pytest
 from crowdin_api import status
-from crowdin_api.exceptions import APIException, ParsingError, ValidationError
-from crowdin_api.requester import APIRequester
+from crowdin_api.cache import ResponseCache, TTLCache
+from crowdin_api.exceptions import APIException, ParsingError, Throttled, ValidationError
+from crowdin_api.requester import APIRequester, AsyncAPIRequester
+from crowdin_api.retry import RetryPolicy
 
 
 class TestAPIRequester:
@@ -110,6 +116,125 @@ class TestAPIRequester:
             **expected_result,
         )
 
+    def test__request_with_rate_limiter(self, requests_mock, base_absolut_url):
+        path = "test"
+        rate_limiter = MagicMock()
+        requester = APIRequester(base_url=base_absolut_url, rate_limiter=rate_limiter)
+        requests_mock.get(urljoin(base_absolut_url, path), text='{"test": 1}')
+
+        assert requester._request(method="get", path=path) == {"test": 1}
+        rate_limiter.__enter__.assert_called_once()
+        rate_limiter.__exit__.assert_called_once()
+        rate_limiter.record.assert_called_once_with(200, mock.ANY)
+        assert requester.rate_limiter is rate_limiter
+
+    def test__request_with_response_cache(self, requests_mock, base_absolut_url):
+        path = "projects/1"
+        url = urljoin(base_absolut_url, path)
+        response_cache = ResponseCache()
+        requester = APIRequester(base_url=base_absolut_url, response_cache=response_cache)
+        assert requester.response_cache is response_cache
+
+        requests_mock.get(url, text='{"data": {"id": 1}}', headers={"ETag": '"v1"'})
+        assert requester._request(method="get", path=path, params={"a": None}) == {
+            "data": {"id": 1}
+        }
+        assert "If-None-Match" not in requests_mock.last_request.headers
+
+        requests_mock.get(url, status_code=304)
+        with mock.patch("crowdin_api.requester.loads") as m_loads:
+            content = requester._request(method="get", path=path)
+        assert content == {"data": {"id": 1}}
+        assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+        # The parsed body is stored, callers get a copy of it
+        m_loads.assert_not_called()
+        content["data"]["id"] = 0
+        assert requester._request(method="get", path=path) == {"data": {"id": 1}}
+
+        # Other params and explicit conditional requests are not served from the cache
+        requests_mock.get(url, text='{"data": {"id": 2}}')
+        assert requester._request(method="get", path=path, params={"a": 1}) == {
+            "data": {"id": 2}
+        }
+        assert "If-None-Match" not in requests_mock.last_request.headers
+
+        requests_mock.get(url, status_code=304)
+        with pytest.raises(APIException):
+            requester._request(method="get", path=path, headers={"If-None-Match": '"v0"'})
+
+        # A response without ETag drops the entry
+        requests_mock.get(url, text='{"data": {"id": 3}}')
+        requester._request(method="get", path=path)
+        assert len(response_cache) == 0
+
+    def test__request_with_response_cache_not_get(self, requests_mock, base_absolut_url):
+        requester = APIRequester(base_url=base_absolut_url, response_cache=ResponseCache())
+        requests_mock.post(urljoin(base_absolut_url, "test"), text="{}", headers={"ETag": "1"})
+
+        requester._request(method="post", path="test", request_data={})
+        assert len(requester.response_cache) == 0
+
+    def test_request_with_ttl_cache(self, requests_mock, base_absolut_url):
+        ttl_cache = TTLCache(ttl={"languages": 60})
+        requester = APIRequester(base_url=base_absolut_url, ttl_cache=ttl_cache)
+        assert requester.ttl_cache is ttl_cache
+        languages_url = urljoin(base_absolut_url, "languages")
+        requests_mock.get(languages_url, text='{"data": []}')
+        requests_mock.post(languages_url, text='{"data": {}}')
+        requests_mock.get(urljoin(base_absolut_url, "projects"), text='{"data": []}')
+
+        for _ in range(2):
+            assert requester.request(method="get", path="languages") == {"data": []}
+            requester.request(method="get", path="projects")
+        requester.request(method="get", path="languages", params={"limit": 5})
+        assert requests_mock.call_count == 4
+
+        requester.request(method="post", path="languages", request_data={"name": "test"})
+        requester.request(method="get", path="languages")
+        assert requests_mock.call_count == 6
+
+    def test_request_with_shared_ttl_cache(self, requests_mock):
+        ttl_cache = TTLCache(ttl={"user": 60})
+
+        def get_requester(base_url, token):
+            return APIRequester(
+                base_url=base_url,
+                default_headers={"Authorization": "Bearer {0}".format(token)},
+                ttl_cache=ttl_cache,
+            )
+
+        first = get_requester("https://api.crowdin.com/api/v2/", "first")
+        second = get_requester("https://api.crowdin.com/api/v2/", "second")
+        enterprise = get_requester("https://org.api.crowdin.com/api/v2/", "first")
+        requests_mock.get(
+            "https://api.crowdin.com/api/v2/user",
+            [{"text": '{"data": {"id": 1}}'}, {"text": '{"data": {"id": 2}}'}],
+        )
+        requests_mock.get("https://org.api.crowdin.com/api/v2/user", text='{"data": {"id": 3}}')
+
+        for _ in range(2):
+            assert first.request(method="get", path="user") == {"data": {"id": 1}}
+            assert second.request(method="get", path="user") == {"data": {"id": 2}}
+            assert enterprise.request(method="get", path="user") == {"data": {"id": 3}}
+
+        assert requests_mock.call_count == 3
+        assert len(ttl_cache) == 3
+
+    def test_request_with_shared_response_cache(self, requests_mock, base_absolut_url):
+        response_cache = ResponseCache()
+        url = urljoin(base_absolut_url, "user")
+        requests_mock.get(url, text='{"data": {"id": 1}}', headers={"ETag": '"v1"'})
+
+        for token in ("first", "second"):
+            APIRequester(
+                base_url=base_absolut_url,
+                default_headers={"Authorization": "Bearer {0}".format(token)},
+                response_cache=response_cache,
+            ).request(method="get", path="user")
+            assert "If-None-Match" not in requests_mock.last_request.headers
+
+        assert len(response_cache) == 2
+
     def test_session_property(self, base_absolut_url):
         requester = APIRequester(base_url=base_absolut_url)
 
@@ -170,6 +295,47 @@ class TestAPIRequester:
         assert m_request.call_count == num_retries
         assert m_sleep.call_count == num_retries - 1
 
+    def test_retry_policy(self, base_absolut_url):
+        requester = APIRequester(base_url=base_absolut_url, max_retries=3, retry_delay=2)
+        assert requester.retry_policy.max_retries == 3
+        assert requester.retry_policy.base_delay == 2
+
+        retry_policy = RetryPolicy()
+        requester = APIRequester(base_url=base_absolut_url, retry_policy=retry_policy)
+        assert requester.retry_policy is retry_policy
+
+    @mock.patch("time.sleep", return_value=None)
+    def test_request_retry_throttled(self, m_sleep, requests_mock, base_absolut_url):
+        path = "test"
+        requester = APIRequester(base_url=base_absolut_url)
+        requests_mock.get(
+            urljoin(base_absolut_url, path),
+            [
+                {"status_code": 429, "text": "{}", "headers": {"Retry-After": "3"}},
+                {"status_code": 200, "text": '{"test": 1}'},
+            ],
+        )
+
+        assert requester.request(method="get", path=path) == {"test": 1}
+        m_sleep.assert_called_once_with(3)
+
+    @mock.patch("time.sleep", return_value=None)
+    def test_request_max_retry_time(self, m_sleep, requests_mock, base_absolut_url):
+        path = "test"
+        requester = APIRequester(
+            base_url=base_absolut_url, retry_policy=RetryPolicy(max_retry_time=5)
+        )
+        requests_mock.get(
+            urljoin(base_absolut_url, path),
+            status_code=429,
+            text="{}",
+            headers={"Retry-After": "10"},
+        )
+
+        with pytest.raises(Throttled):
+            requester.request(method="get", path=path)
+        m_sleep.assert_not_called()
+
     @pytest.mark.parametrize(
         "status_code,exception",
         (
@@ -253,6 +419,69 @@ class TestAPIRequester:
         requester = APIRequester(base_url=base_absolut_url)
         assert requester._clear_data(in_data) == out_data
 
+    def test_request_coalescing(self, base_absolut_url):
+        requester = APIRequester(base_url=base_absolut_url, coalesce_requests=True)
+        started = threading.Event()
+        release = threading.Event()
+
+        def _request(**kwargs):
+            started.set()
+            release.wait(5)
+            return {"data": {"id": 1}}
+
+        results = []
+        with mock.patch.object(requester, "_request", side_effect=_request) as m_request:
+            leader = threading.Thread(
+                target=lambda: results.append(requester.request("get", "projects/1"))
+            )
+            leader.start()
+            started.wait(5)
+
+            followers = [
+                threading.Thread(
+                    target=lambda: results.append(requester.request("get", "projects/1"))
+                )
+                for _ in range(3)
+            ]
+            for follower in followers:
+                follower.start()
+            while requester.coalescing_stats["hits"] < 3:
+                time.sleep(0.001)
+            release.set()
+
+            for thread in [leader, *followers]:
+                thread.join()
+
+            # Other params, methods and finished requests are sent
+            requester.request("get", "projects/1", params={"a": 1})
+            requester.request("post", "projects/1")
+            requester.request("get", "projects/1")
+
+        assert m_request.call_count == 4
+        assert results == [{"data": {"id": 1}}] * 4
+        assert len({id(result) for result in results}) == 4
+        assert requester.coalescing_stats == {"hits": 3, "misses": 3}
+
+    def test_request_coalescing_error(self, base_absolut_url):
+        requester = APIRequester(base_url=base_absolut_url, coalesce_requests=True)
+        future = Future()
+        future.set_exception(ValidationError())
+        requester._in_flight[requester._get_coalescing_key("get", "test", None, None, {})] = future
+
+        with pytest.raises(ValidationError):
+            requester.request("get", "test")
+
+        with mock.patch.object(requester, "_request", side_effect=ValidationError()):
+            requester._in_flight.clear()
+            with pytest.raises(ValidationError):
+                requester.request("get", "test")
+        assert requester._in_flight == {}
+
+    def test_request_coalescing_disabled(self, base_absolut_url):
+        requester = APIRequester(base_url=base_absolut_url)
+
+        assert requester._get_coalescing_key("get", "test", None, None, {}) is None
+
     @mock.patch("crowdin_api.requester.APIRequester.request")
     @pytest.mark.parametrize(
         "kwargs",
@@ -266,3 +495,112 @@ class TestAPIRequester:
         _requester = APIRequester(base_url=base_absolut_url)
         _requester.request('get', 'test', **kwargs)
         m_request.assert_called_once_with('get', 'test', **kwargs)
+
+
+class TestAsyncAPIRequester:
+    def test_init(self, base_absolut_url):
+        requester = AsyncAPIRequester(base_url=base_absolut_url, max_concurrency=7)
+
+        assert requester.is_async is True
+        assert requester._executor._max_workers == 7
+        assert requester.session.get_adapter(base_absolut_url)._pool_maxsize == 7
+
+    def test_request(self, requests_mock, base_absolut_url):
+        path = "test"
+        requester = AsyncAPIRequester(base_url=base_absolut_url)
+        requests_mock.get(urljoin(base_absolut_url, path), text='{"test": 1}')
+
+        async def run():
+            return await asyncio.gather(
+                *(requester.request(method="get", path=path) for _ in range(5))
+            )
+
+        assert asyncio.run(run()) == [{"test": 1}] * 5
+        assert requests_mock.call_count == 5
+
+    @pytest.mark.parametrize(
+        "should_retry,max_retries,num_retries",
+        (
+            (True, 3, 3),
+            (False, 3, 1),
+        ),
+    )
+    @mock.patch("crowdin_api.requester.APIRequester._request")
+    def test_request_retry(
+        self, m_request, base_absolut_url, should_retry, max_retries, num_retries
+    ):
+        m_request.side_effect = APIException(should_retry=should_retry)
+        requester = AsyncAPIRequester(
+            base_url=base_absolut_url, max_retries=max_retries, retry_delay=0
+        )
+
+        with mock.patch("asyncio.sleep", wraps=asyncio.sleep) as m_sleep:
+            with pytest.raises(APIException):
+                asyncio.run(requester.request(method="get", path="test"))
+
+        assert m_request.call_count == num_retries
+        assert m_sleep.call_count == num_retries - 1
+
+    def test_request_with_ttl_cache(self, requests_mock, base_absolut_url):
+        requester = AsyncAPIRequester(
+            base_url=base_absolut_url, ttl_cache=TTLCache(ttl={"languages": 60})
+        )
+        requests_mock.get(urljoin(base_absolut_url, "languages"), text='{"data": []}')
+
+        async def run():
+            return [await requester.request(method="get", path="languages") for _ in range(2)]
+
+        assert asyncio.run(run()) == [{"data": []}, {"data": []}]
+        assert requests_mock.call_count == 1
+
+    def test_request_coalescing(self, base_absolut_url):
+        requester = AsyncAPIRequester(base_url=base_absolut_url, coalesce_requests=True)
+        release = threading.Event()
+
+        def _request(**kwargs):
+            release.wait(5)
+            return {"data": {"id": 1}}
+
+        async def run():
+            tasks = [
+                asyncio.ensure_future(requester.request("get", "projects/1")) for _ in range(3)
+            ]
+            await asyncio.sleep(0.01)
+            release.set()
+            return await asyncio.gather(*tasks)
+
+        with mock.patch.object(requester, "_request", side_effect=_request) as m_request:
+            assert asyncio.run(run()) == [{"data": {"id": 1}}] * 3
+
+        m_request.assert_called_once()
+        assert requester.coalescing_stats == {"hits": 2, "misses": 1}
+
+    @pytest.mark.parametrize("error", (ValidationError(), asyncio.CancelledError()))
+    def test_request_coalescing_error(self, base_absolut_url, error):
+        requester = AsyncAPIRequester(base_url=base_absolut_url, coalesce_requests=True)
+        release = threading.Event()
+
+        def _request(**kwargs):
+            release.wait(5)
+            raise error
+
+        async def run():
+            tasks = [
+                asyncio.ensure_future(requester.request("get", "projects/1")) for _ in range(2)
+            ]
+            await asyncio.sleep(0.01)
+            release.set()
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        with mock.patch.object(requester, "_request", side_effect=_request):
+            results = asyncio.run(run())
+
+        assert [type(result) for result in results] == [type(error)] * 2
+        assert requester._in_flight == {}
+
+    def test_close(self, base_absolut_url):
+        requester = AsyncAPIRequester(base_url=base_absolut_url)
+        requester.close()
+
+        with pytest.raises(RuntimeError):
+            requester._executor.submit(print)
@@ -0,0 +1,103 @@
+import time
+from email.utils import formatdate
+from unittest import mock
+
+import pytest
+from crowdin_api import status
+from crowdin_api.exceptions import APIException, Throttled, ValidationError
+from crowdin_api.retry import RetryPolicy
+
+
+class TestRetryPolicy:
+    @pytest.mark.parametrize(
+        "num_retries,base_delay,max_delay,result",
+        (
+            (1, 0.1, 30, 0.1),
+            (2, 0.1, 30, 0.2),
+            (4, 0.1, 30, 0.8),
+            (10, 1, 30, 30),
+        ),
+    )
+    def test_get_backoff(self, num_retries, base_delay, max_delay, result):
+        policy = RetryPolicy(base_delay=base_delay, max_delay=max_delay, jitter=False)
+        assert policy.get_backoff(num_retries) == pytest.approx(result)
+
+    @mock.patch("random.uniform", return_value=0.05)
+    def test_get_backoff_jitter(self, m_uniform):
+        policy = RetryPolicy(base_delay=0.1)
+
+        assert policy.get_backoff(3) == 0.05
+        m_uniform.assert_called_once_with(0, pytest.approx(0.4))
+
+    @pytest.mark.parametrize(
+        "error,num_retries,max_retries,result",
+        (
+            (APIException(http_status=500), 1, 5, 0.1),
+            (APIException(http_status=500), 5, 5, None),
+            (ValidationError(http_status=400), 1, 5, None),
+            (Throttled(http_status=429), 1, 5, 0.1),
+            (Throttled(http_status=429, headers={"Retry-After": "7"}), 1, 5, 7),
+            (Throttled(http_status=429, headers={"retry-after": "2"}), 1, 5, 2),
+            (Throttled(http_status=429, headers={"Retry-After": "nonsense"}), 1, 5, 0.1),
+            (Throttled(http_status=429, headers={"X-RateLimit-Reset": "3"}), 1, 5, 3),
+            (Throttled(http_status=429, headers={"X-RateLimit-Reset": "x"}), 1, 5, 0.1),
+            (APIException(http_status=503, headers={"Retry-After": "4"}), 1, 5, 4),
+            (APIException(http_status=500, headers={"Retry-After": "4"}), 1, 5, 0.1),
+        ),
+    )
+    def test_get_delay(self, error, num_retries, max_retries, result):
+        policy = RetryPolicy(max_retries=max_retries, base_delay=0.1, jitter=False)
+        assert policy.get_delay(error, num_retries=num_retries) == result
+
+    def test_get_delay_retry_after_date(self):
+        policy = RetryPolicy(max_delay=120)
+        error = Throttled(
+            http_status=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": formatdate(time.time() + 60, usegmt=True)},
+        )
+
+        assert 55 <= policy.get_delay(error, num_retries=1) <= 60
+
+    def test_get_delay_rate_limit_reset_timestamp(self):
+        policy = RetryPolicy()
+        error = Throttled(
+            http_status=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"X-RateLimit-Reset": str(int(time.time()) + 10)},
+        )
+
+        assert 8 <= policy.get_delay(error, num_retries=1) <= 10
+
+    @pytest.mark.parametrize(
+        "headers",
+        (
+            {"Retry-After": "86400"},
+            {"Retry-After": formatdate(time.time() + 86400, usegmt=True)},
+            {"X-RateLimit-Reset": str(int(time.time()) + 86400)},
+        ),
+    )
+    def test_get_delay_server_delay_above_max_delay(self, headers):
+        policy = RetryPolicy(max_delay=30)
+        error = Throttled(http_status=status.HTTP_429_TOO_MANY_REQUESTS, headers=headers)
+
+        assert policy.get_server_delay(error) > 30
+        assert policy.get_delay(error, num_retries=1) is None
+
+    def test_get_delay_ignore_retry_after(self):
+        policy = RetryPolicy(base_delay=0.1, jitter=False, respect_retry_after=False)
+        error = Throttled(http_status=429, headers={"Retry-After": "7"})
+
+        assert policy.get_delay(error, num_retries=1) == 0.1
+
+    @pytest.mark.parametrize(
+        "elapsed,result",
+        (
+            (0, 1),
+            (8, 1),
+            (9.5, None),
+        ),
+    )
+    def test_get_delay_max_retry_time(self, elapsed, result):
+        policy = RetryPolicy(max_retry_time=10)
+        error = Throttled(http_status=429, headers={"Retry-After": "1"})
+
+        assert policy.get_delay(error, num_retries=1, elapsed=elapsed) == result
@@ -0,0 +1,111 @@
+import asyncio
+import threading
+from functools import partial
+from unittest import mock
+
+import pytest
+from crowdin_api.exceptions import NotFound
+from crowdin_api.steps import Blocking, Sleep, async_run_steps, run_steps
+
+
+def get_or_create(get, create):
+    try:
+        return (yield get)
+    except NotFound:
+        created = yield create
+        yield Sleep(0)
+        return created
+
+
+def async_mock(*args, **kwargs):
+    mocked = mock.Mock(*args, **kwargs)
+
+    async def call():
+        return mocked()
+
+    call.mock = mocked
+    return call
+
+
+class TestRunSteps:
+    def test_results_sent(self):
+        assert run_steps(get_or_create(lambda: 1, lambda: 2)) == 1
+
+    def test_errors_thrown(self):
+        get = mock.Mock(side_effect=NotFound())
+        assert run_steps(get_or_create(get, lambda: 2)) == 2
+
+    def test_errors_raised(self):
+        get = mock.Mock(side_effect=NotFound())
+        create = mock.Mock(side_effect=NotFound())
+        with pytest.raises(NotFound):
+            run_steps(get_or_create(get, create))
+
+    @mock.patch("time.sleep")
+    def test_sleep(self, m_sleep):
+        def steps():
+            yield Sleep(2)
+
+        run_steps(steps())
+        m_sleep.assert_called_once_with(2)
+
+    def test_blocking(self):
+        def steps():
+            return (yield Blocking(threading.get_ident))
+
+        assert run_steps(steps()) == threading.get_ident()
+
+
+class TestAsyncRunSteps:
+    def test_results_sent(self):
+        get = async_mock(return_value=1)
+        assert asyncio.run(async_run_steps(get_or_create(get, async_mock()))) == 1
+
+    def test_errors_thrown(self):
+        get = async_mock(side_effect=NotFound())
+        create = async_mock(return_value=2)
+        assert asyncio.run(async_run_steps(get_or_create(get, create))) == 2
+
+    def test_sleep(self):
+        def steps():
+            yield Sleep(0.01)
+
+        with mock.patch("asyncio.sleep", wraps=asyncio.sleep) as m_sleep:
+            asyncio.run(async_run_steps(steps()))
+        m_sleep.assert_called_once_with(0.01)
+
+    def test_blocking(self):
+        def steps():
+            return (yield Blocking(threading.get_ident))
+
+        # Run in the executor of the event loop
+        assert asyncio.run(async_run_steps(steps())) != threading.get_ident()
+
+    def test_cancelled(self):
+        cleanup = async_mock()
+
+        def steps():
+            try:
+                yield Sleep(10)
+            except asyncio.CancelledError:
+                yield cleanup
+                raise
+
+        async def run():
+            task = asyncio.ensure_future(async_run_steps(steps()))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        cleanup.mock.assert_called_once_with()
+
+    def test_partial(self):
+        def steps(add):
+            return (yield partial(add, 2))
+
+        async def add(value):
+            return value + 1
+
+        assert asyncio.run(async_run_steps(steps(add))) == 3
@@ -0,0 +1,189 @@
+import sys
+from collections import namedtuple
+from unittest import mock
+
+import pytest
+from crowdin_api import CrowdinClient
+from crowdin_api.connection import ConnectionPool
+from crowdin_api.exceptions import CrowdinException
+from crowdin_api.requester import APIRequester
+from crowdin_api.transport import HTTPXTransport, RequestsTransport, Transport
+
+ResponseMock = namedtuple("ResponseMock", "status_code content headers")
+
+
+class RecordingTransport(Transport):
+    def __init__(self):
+        self._headers = {}
+        self.requests = []
+
+    @property
+    def headers(self):
+        return self._headers
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        return ResponseMock(status_code=200, content=b'{"data": {"id": 1}}', headers={})
+
+
+class TestRequestsTransport:
+    def test_request(self, server_url):
+        transport = RequestsTransport()
+        transport.headers["X-Test"] = "1"
+
+        response = transport.request("get", server_url + "projects/1", timeout=5)
+
+        assert response.status_code == 200
+        assert response.content == b'{"data": {"id": 1}}'
+        assert transport.session.headers["X-Test"] == "1"
+
+        with mock.patch.object(transport.session, "close") as m_close:
+            transport.close()
+        m_close.assert_called_once()
+
+
+class TestHTTPXTransport:
+    def test_httpx_not_installed(self):
+        with mock.patch.dict(sys.modules, {"httpx": None}):
+            with pytest.raises(CrowdinException):
+                HTTPXTransport()
+
+    def test_client_options(self):
+        m_httpx = mock.Mock()
+
+        with mock.patch.dict(sys.modules, {"httpx": m_httpx}):
+            transport = HTTPXTransport(max_connections=4, verify=False)
+
+        m_httpx.Limits.assert_called_once_with(max_connections=4)
+        m_httpx.Client.assert_called_once_with(
+            http2=True, limits=m_httpx.Limits.return_value, verify=False
+        )
+        assert transport.client is m_httpx.Client.return_value
+        assert transport.headers is m_httpx.Client.return_value.headers
+
+        transport.close()
+        m_httpx.Client.return_value.close.assert_called_once()
+
+    def test_requester_request(self, base_absolut_url):
+        m_httpx = mock.Mock()
+        client = m_httpx.Client.return_value
+        client.headers = {}
+        client.request.return_value = ResponseMock(
+            status_code=200, content=b'{"data": {"id": 1}}', headers={}
+        )
+
+        with mock.patch.dict(sys.modules, {"httpx": m_httpx}):
+            transport = HTTPXTransport()
+        requester = APIRequester(
+            base_url=base_absolut_url,
+            timeout=30,
+            default_headers={"Authorization": "Bearer token"},
+            transport=transport,
+        )
+
+        assert requester.request(
+            method="post",
+            path="projects",
+            params={"limit": 10},
+            headers={"X-Test": "1"},
+            request_data={"name": "project"},
+        ) == {"data": {"id": 1}}
+        client.request.assert_called_once_with(
+            "post",
+            base_absolut_url + "projects",
+            params={"limit": 10},
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": "Bearer token",
+                "X-Test": "1",
+            },
+            content='{"name": "project"}',
+            timeout=30,
+        )
+        assert client.headers == {}
+
+    def test_request(self, server_url):
+        pytest.importorskip("httpx")
+        transport = HTTPXTransport(http2=False)
+        requester = APIRequester(base_url=server_url, transport=transport)
+
+        assert requester.request(method="get", path="projects/1") == {"data": {"id": 1}}
+        assert "Content-Type" not in transport.headers
+        transport.close()
+
+
+class TestRequesterTransport:
+    def test_custom_transport(self, base_absolut_url):
+        transport = RecordingTransport()
+        requester = APIRequester(
+            base_url=base_absolut_url,
+            default_headers={"Authorization": "Bearer token"},
+            transport=transport,
+            connection_pool=ConnectionPool(warm_up=2),
+        )
+
+        assert requester.transport is transport
+        assert requester.request(method="get", path="projects", params={"limit": 10}) == {
+            "data": {"id": 1}
+        }
+        assert transport.headers == {}
+        assert transport.requests == [
+            (
+                "get",
+                base_absolut_url + "projects",
+                {
+                    "params": {"limit": 10},
+                    "headers": {
+                        "Content-Type": "application/json",
+                        "Authorization": "Bearer token",
+                    },
+                    "data": None,
+                    "timeout": 80,
+                },
+            )
+        ]
+        assert requester.connection_stats["connections"] == 0
+
+    def test_shared_transport(self, base_absolut_url):
+        transport = RecordingTransport()
+        first = APIRequester(
+            base_url=base_absolut_url,
+            default_headers={"Authorization": "Bearer first"},
+            transport=transport,
+        )
+        second = APIRequester(
+            base_url=base_absolut_url,
+            default_headers={"Authorization": "Bearer second"},
+            transport=transport,
+        )
+
+        first.request(method="get", path="projects", headers={"X-Test": "1"})
+        second.request(method="get", path="projects")
+        first.request(method="get", path="projects")
+
+        assert [kwargs["headers"]["Authorization"] for _, _, kwargs in transport.requests] == [
+            "Bearer first",
+            "Bearer second",
+            "Bearer first",
+        ]
+        assert transport.requests[0][2]["headers"]["X-Test"] == "1"
+        assert transport.headers == {}
+
+    def test_transport_not_closed(self, base_absolut_url):
+        transport = RecordingTransport()
+        requester = APIRequester(base_url=base_absolut_url, transport=transport)
+
+        with mock.patch.object(transport, "close") as m_close:
+            requester.close()
+
+        m_close.assert_not_called()
+
+    def test_client_transport(self):
+        transport = RecordingTransport()
+        client = CrowdinClient(token="token", project_id=1, transport=transport)
+
+        client.projects.get_project()
+
+        assert client.get_api_requestor().transport is transport
+        assert transport.requests[0][1] == "https://api.crowdin.com/api/v2/projects/1"
+        assert transport.requests[0][2]["headers"]["Authorization"] == "Bearer token"
@@ -0,0 +1,115 @@
+import abc
+from typing import IO, Any, Dict, MutableMapping, Optional, Union
+
+import requests
+from crowdin_api.exceptions import CrowdinException
+
+
+class Transport(metaclass=abc.ABCMeta):
+    """
+    Sends the HTTP requests of `APIRequester`.
+
+    `request` returns a response with `status_code`, `content` and `headers`. `headers` are the
+    default headers sent with every request. `APIRequester` does not change them, it sends its
+    authorization and user agent headers with each request, so a transport can be shared by
+    requesters of different accounts. A transport is closed by its owner and not by the
+    requesters.
+    """
+
+    @property
+    @abc.abstractmethod
+    def headers(self) -> MutableMapping[str, str]:
+        """Headers sent with every request."""
+
+    @abc.abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        data: Union[str, bytes, IO, None] = None,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> Any:
+        """Send a request, return the response."""
+
+    def close(self):
+        pass
+
+
+class RequestsTransport(Transport):
+    """Transport over a `requests` session, the default of `APIRequester`."""
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session or requests.Session()
+
+    @property
+    def headers(self) -> MutableMapping[str, str]:
+        return self.session.headers
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        data: Union[str, bytes, IO, None] = None,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> requests.Response:
+        return self.session.request(
+            method, url, params=params, headers=headers, data=data, timeout=timeout, **kwargs
+        )
+
+    def close(self):
+        self.session.close()
+
+
+class HTTPXTransport(Transport):
+    """
+    Transport over an `httpx` client.
+
+    With `http2` enabled, concurrent requests to a host are multiplexed over one connection
+    instead of opening a connection per request in flight, `max_connections` bounds the number
+    of connections per client. Requires the `http2` extra:
+
+        pip install crowdin-api-client[http2]
+
+    Extended request parameters are passed to `httpx.Client.request`, so requests specific ones
+    such as `proxies` or `verify` go to the client options instead:
+
+        HTTPXTransport(proxy="http://proxy:3128", verify="/etc/ssl/ca.pem")
+    """
+
+    def __init__(self, http2: bool = True, max_connections: Optional[int] = 100, **client_options):
+        try:
+            import httpx
+        except ImportError as err:
+            raise CrowdinException(
+                detail="HTTPXTransport requires httpx, install crowdin-api-client[http2]"
+            ) from err
+
+        client_options.setdefault("limits", httpx.Limits(max_connections=max_connections))
+        self.client = httpx.Client(http2=http2, **client_options)
+
+    @property
+    def headers(self) -> MutableMapping[str, str]:
+        return self.client.headers
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        data: Union[str, bytes, IO, None] = None,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> Any:
+        return self.client.request(
+            method, url, params=params, headers=headers, content=data, timeout=timeout, **kwargs
+        )
+
+    def close(self):
+        self.client.close()
@@ -1,6 +1,10 @@
 import sys
+from typing import Callable, Optional
 
 if sys.version_info >= (3, 8):
     from typing import TypedDict  # noqa F401
 else:
     from typing_extensions import TypedDict  # noqa F401
+
+# Called with the number of bytes transferred and the total size, None if unknown
+ProgressCallback = Callable[[int, Optional[int]], None]
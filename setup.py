@@ -56,6 +56,9 @@ setup(
         "typing-extensions; python_version < '3.8.0'",
         "deprecated"
     ],
+    extras_require={
+        "http2": ["httpx[http2]>=0.23.0"],
+    },
     classifiers=[
         "Programming Language :: Python",
         "Programming Language :: Python :: 3",